@@ -0,0 +1,7 @@
+"""
+Verse Benchmarks
+Micro-benchmarks for lyric parsing, timeline lookups, rendering, audio
+probing and startup time.
+
+Run all of them with ``python -m benchmarks``; results are written as JSON.
+"""
@@ -0,0 +1,75 @@
+"""
+Run the Verse benchmark suite and write the results as JSON.
+
+Usage:
+    python -m benchmarks [--sizes 10 100 1000] [--repeat 5] [--output results.json]
+"""
+
+from pathlib import Path
+import argparse
+import datetime
+import json
+import platform
+import sys
+import tempfile
+
+from benchmarks import (bench_align, bench_export, bench_layout, bench_lookups, bench_parser, bench_probe,
+                        bench_render, bench_scan, bench_startup, bench_visualizer)
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000]
+
+SUITES = {
+    "align": bench_align.run,
+    "export": bench_export.run,
+    "parser": bench_parser.run,
+    "lookups": bench_lookups.run,
+    "layout": bench_layout.run,
+    "probe": bench_probe.run,
+    "render": bench_render.run,
+    "scan": bench_scan.run,
+    "startup": bench_startup.run,
+    "visualizer": bench_visualizer.run,
+}
+
+
+def main() -> None:
+    """Parse arguments, run the selected suites and write the JSON report."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Verse benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="numbers of lyric lines to benchmark")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="timing rounds per measurement")
+    parser.add_argument("--suite", choices=sorted(SUITES), action="append",
+                        help="run only this suite (may be repeated)")
+    parser.add_argument("--output", type=Path,
+                        help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    from src import __version__
+
+    report = {
+        "verse_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "sizes": args.sizes,
+        "repeat": args.repeat,
+        "results": {},
+    }
+
+    with tempfile.TemporaryDirectory(prefix="verse-bench-") as workdir:
+        for name in args.suite or sorted(SUITES):
+            print(f"Running {name} benchmarks...", file=sys.stderr)
+            report["results"][name] = SUITES[name](args.sizes, Path(workdir), args.repeat)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
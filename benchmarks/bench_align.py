@@ -0,0 +1,121 @@
+"""
+Benchmarks for aligning word timing to audio onsets with src.word_alignment.
+"""
+
+from pathlib import Path
+from typing import Iterable, List
+import tracemalloc
+import wave
+
+from benchmarks.synthetic import write_lrc
+from benchmarks.timing import measure
+from src.lyrics_parser import LyricsParser
+from src.pcm import numpy_available
+from src.word_alignment import OnsetEnvelope, align_word_times, onset_envelope
+
+# Song lengths in minutes for the onset envelope; it does not depend on lyric sizes
+DURATIONS = [4, 10]
+
+# Seconds between the synthetic sung syllables
+ONSET_INTERVAL = 0.37
+
+SAMPLE_RATE = 44100
+
+
+def write_song(path: Path, seconds: float, seed: int = 0) -> Path:
+    """
+    Write a 16-bit stereo WAV of decaying tone bursts over soft noise.
+
+    Args:
+        path: Destination file
+        seconds: Playing time
+        seed: Random seed, the same seed always gives the same file
+
+    Returns:
+        The path written
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    burst = int(0.25 * SAMPLE_RATE)
+    decay = np.exp(-np.arange(burst) / (0.06 * SAMPLE_RATE))
+    step = int(ONSET_INTERVAL * SAMPLE_RATE)
+
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(2)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(SAMPLE_RATE)
+        # One minute at a time keeps long songs out of memory
+        total = int(seconds * SAMPLE_RATE)
+        for start in range(0, total, 60 * SAMPLE_RATE):
+            count = min(60 * SAMPLE_RATE, total - start)
+            mono = rng.normal(0.0, 0.01, count)
+            for onset in range(-start % step, count, step):
+                tone = np.sin(2 * np.pi * rng.uniform(200, 800) * np.arange(burst) / SAMPLE_RATE)
+                piece = (0.5 * decay * tone)[:count - onset]
+                mono[onset:onset + len(piece)] += piece
+            samples = (np.repeat(mono[:, None], 2, axis=1) * 32767).astype("<i2")
+            wav_file.writeframes(samples.tobytes())
+    return path
+
+
+def run(sizes: Iterable[int], workdir: Path, repeat: int = 5) -> List[dict]:
+    """
+    Measure the onset envelope of full-length songs and the cost of
+    placing words on onsets for each lyric size.
+
+    Args:
+        sizes: Numbers of lyric lines to generate
+        workdir: Directory for the synthetic WAV and LRC files
+        repeat: Timing rounds per measurement
+
+    Returns:
+        Envelope results per song length, then placement results per size;
+        empty without NumPy
+    """
+    if not numpy_available():
+        return []
+    import numpy as np
+
+    results = []
+    for minutes in DURATIONS:
+        path = write_song(Path(workdir) / f"song_{minutes}m.wav", minutes * 60)
+
+        tracemalloc.start()
+        envelope = onset_envelope(str(path))
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        results.append({
+            "minutes": minutes,
+            "file_bytes": path.stat().st_size,
+            "onsets": int(minutes * 60 / ONSET_INTERVAL),
+            "peaks": len(envelope.peak_times),
+            "peak_traced_bytes": peak_bytes,
+            "onset_envelope": measure(lambda: onset_envelope(str(path)), repeat),
+        })
+
+    for lines in sizes:
+        parser = LyricsParser(compact=True)
+        parser.parse_lrc_file(str(write_lrc(Path(workdir) / f"synthetic_{lines}.lrc", lines)))
+        lyrics = parser.lyrics
+
+        # Onsets spread over the whole song, as the envelope would report them
+        end = lyrics.line_times[-1] + 4.0
+        peak_times = np.arange(0.0, end, ONSET_INTERVAL)
+        strengths = np.random.default_rng(0).uniform(2.0, 20.0, len(peak_times)).astype(np.float32)
+        envelope = OnsetEnvelope(hop_seconds=0.01, strength=strengths,
+                                 peak_times=peak_times, peak_strengths=strengths)
+
+        def place():
+            return align_word_times(lyrics.line_times, lyrics.word_offsets,
+                                    lyrics.word_times, envelope)
+
+        moved = sum(1 for before, after in zip(lyrics.word_times, place()) if before != after)
+        results.append({
+            "lines": lines,
+            "words": len(lyrics.word_times),
+            "words_moved": moved,
+            "align_word_times": measure(place, repeat, len(lyrics)),
+        })
+    return results
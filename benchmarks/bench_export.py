@@ -0,0 +1,73 @@
+"""
+Benchmarks for exporting lyric timelines with src.export.
+"""
+
+from pathlib import Path
+from typing import Iterable, List
+import os
+import shutil
+
+from benchmarks.bench_scan import _write_library
+from benchmarks.synthetic import write_lrc, write_wav
+from benchmarks.timing import measure
+from src.export import (FORMATS, SUBTITLE_FORMATS, export_songs, find_songs,
+                        lyric_cues, record_asciicast)
+from src.lyrics_parser import LyricsParser
+
+# Song/LRC pairs in the batch-exported library
+LIBRARY_PAIRS = 48
+
+# Playing time of the single song whose formats are timed one by one
+SONG_SECONDS = 200.0
+
+
+def run(sizes: Iterable[int], workdir: Path, repeat: int = 5) -> List[dict]:
+    """
+    Measure writing each format for one song per lyric size, how much
+    faster than real time a cast renders, and batch export of a library
+    with one worker and with every CPU.
+
+    Args:
+        sizes: Numbers of lyric lines to generate
+        workdir: Directory for the synthetic songs and exported files
+        repeat: Timing rounds per measurement; batch exports run once each
+
+    Returns:
+        One result dictionary per size, then the batch results
+    """
+    results = []
+    song = write_wav(Path(workdir) / "export.wav", SONG_SECONDS)
+    for lines in sizes:
+        lyrics_path = write_lrc(Path(workdir) / f"export_{lines}.lrc", lines)
+        parser = LyricsParser(compact=True)
+        parser.parse_lrc_file(str(lyrics_path))
+        # The song is as long as the lyrics, as in a real export
+        duration = parser.lyrics[-1].timestamp + 4.0 if len(parser.lyrics) else 0.0
+        cues = lyric_cues(parser.lyrics, duration)
+
+        result = {"lines": lines, "cues": len(cues)}
+        for name, (_, write) in SUBTITLE_FORMATS.items():
+            result[name] = measure(lambda: write(cues, "export"), repeat, max(1, len(cues)))
+
+        # One simulated session per size; long songs take seconds to render
+        if lines <= 1000:
+            cast = measure(lambda: record_asciicast(str(lyrics_path)), 1)
+            result["cast"] = cast
+            result["cast_bytes"] = len(record_asciicast(str(lyrics_path)).encode("utf-8"))
+            result["cast_speedup"] = duration / cast["median"] if cast["median"] else None
+        results.append(result)
+
+    cpus = os.cpu_count() or 1
+    root = Path(workdir) / "export_library"
+    _write_library(root, LIBRARY_PAIRS)
+    songs = find_songs([str(root)], Path(workdir) / "exported")
+    batch = {"pairs": len(songs), "cpus": cpus, "formats": list(FORMATS)}
+    for label, jobs in (("one_worker", 1), ("all_cpus", cpus)):
+        stats = export_songs(songs, FORMATS, jobs=jobs)
+        batch[label] = {key: stats[key] for key in ("seconds", "songs_per_second", "files", "errors")}
+    batch["speedup"] = batch["one_worker"]["seconds"] / batch["all_cpus"]["seconds"]
+    results.append(batch)
+    shutil.rmtree(root)
+    shutil.rmtree(Path(workdir) / "exported")
+    song.unlink()
+    return results
@@ -0,0 +1,116 @@
+"""
+Benchmarks for wrapping and centering multilingual lyric lines.
+"""
+
+from pathlib import Path
+from typing import Iterable, List
+import random
+
+from rich.cells import cell_len
+from rich.console import Console
+
+from benchmarks.bench_render import MAX_FRAMES, _NullFile, _collect_frames
+from benchmarks.synthetic import format_timestamp
+from benchmarks.timing import measure
+from src.display import LyricDisplay
+from src.layout import LayoutCache
+from src.lyrics_parser import LyricsParser
+
+# Long lines in scripts whose cell width differs from their length
+_PHRASES = [
+    "Ça ira, mon cœur, où la lumière danse encore sous la pluie d'été et les étoiles",
+    "夜空に光る星を数えながら君の名前をそっと呼んでみるけど返事はなくて風だけが吹いていた",
+    "我们在雨中跳舞直到黎明来临城市的灯光一盏一盏熄灭只剩下心跳的声音",
+    "사랑해 너를 영원히 사랑해 이 밤이 지나도 내 마음은 변하지 않을 거야 약속해",
+    "🎵 dancing in the moonlight 🌙 with my friends 👩‍👩‍👧 all night long ✨ until the sun 🌅",
+    "मैं तेरे बिना जी नहीं सकता दिल की हर धड़कन तेरा नाम पुकारती है",
+    "Müde Straßen glänzen, während über Zürich langsam die Nacht fällt",
+]
+
+
+def write_multilingual_lrc(path: Path, lines: int, seed: int = 0) -> Path:
+    """
+    Write an LRC file of long lines in mixed scripts.
+
+    Args:
+        path: File to write
+        lines: Number of lyric lines
+        seed: Random seed, the same seed always gives the same file
+
+    Returns:
+        The path written
+    """
+    rng = random.Random(seed)
+    position = 0.0
+    rows = []
+    for _ in range(lines):
+        position += rng.uniform(3.0, 6.0)
+        rows.append(f"{format_timestamp(position)}{rng.choice(_PHRASES)}")
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+    return path
+
+
+def run(sizes: Iterable[int], workdir: Path, repeat: int = 5, width: int = 100) -> List[dict]:
+    """
+    Measure laying out multilingual lines, cold and cached, and the
+    per-frame cost of rendering them wrapped.
+
+    Args:
+        sizes: Numbers of lyric lines to generate
+        workdir: Directory for the synthetic LRC files
+        repeat: Timing rounds per measurement
+        width: Width of the in-memory console
+
+    Returns:
+        One result dictionary per size, costs in seconds per line or frame;
+        cold layouts are counted per distinct line
+    """
+    results = []
+    for lines in sizes:
+        path = write_multilingual_lrc(Path(workdir) / f"multilingual_{lines}.lrc", lines)
+        parser = LyricsParser()
+        parser.parse_lrc_file(str(path))
+        texts = [lyric.text for lyric in parser.lyrics]
+        distinct = list(dict.fromkeys(texts))
+        if not texts:
+            continue
+
+        console = Console(file=_NullFile(), force_terminal=True, width=width,
+                          color_system="truecolor")
+        display = LyricDisplay(console)
+        indent = display.layout.indent
+        cache = LayoutCache(width, indent)
+
+        def layout_cold():
+            fresh = LayoutCache(width, indent)
+            for text in distinct:
+                fresh.get(text)
+
+        def layout_cached():
+            for text in texts:
+                cache.get(text)
+
+        layout_cached()
+        result = {
+            "lines": lines,
+            "distinct_lines": len(distinct),
+            "wrapped_lines": sum(1 for text in texts if cache.get(text).row_count > 1),
+            # Lines the old len()-based centering placed in the wrong column
+            "misaligned_by_len": sum(1 for text in texts if len(text) != cell_len(text)),
+            "layout_cold": measure(layout_cold, repeat, len(distinct)),
+            "layout_cached": measure(layout_cached, repeat, len(texts)),
+        }
+
+        frames = _collect_frames(parser, MAX_FRAMES)
+        if frames:
+            display.song_duration = frames[-1]["current_time"] + 4.0
+
+            def render_all():
+                display.clear_display()
+                for frame in frames:
+                    display.show_lyric_with_context(**frame)
+
+            result["frames"] = len(frames)
+            result["show_lyric_with_context"] = measure(render_all, repeat, len(frames))
+        results.append(result)
+    return results
@@ -0,0 +1,63 @@
+"""
+Benchmarks for the per-query latency of the LyricsParser getters.
+"""
+
+from pathlib import Path
+from typing import Iterable, List
+import random
+
+from benchmarks.synthetic import write_lrc
+from benchmarks.timing import measure
+from src.lyrics_parser import LyricsParser
+
+# Random playback positions queried per timing call
+QUERIES = 1000
+
+GETTERS = (
+    "get_current_lyric",
+    "get_current_words",
+    "get_current_word_only",
+    "get_current_line_index",
+    "get_context_lyrics",
+)
+
+
+def run(sizes: Iterable[int], workdir: Path, repeat: int = 5) -> List[dict]:
+    """
+    Measure per-query latency of every getter and of the timeline cursor.
+
+    Args:
+        sizes: Numbers of lyric lines to generate
+        workdir: Directory for the synthetic LRC files
+        repeat: Timing rounds per measurement
+
+    Returns:
+        One result dictionary per size, latencies in seconds per query
+    """
+    results = []
+    for lines in sizes:
+        path = write_lrc(Path(workdir) / f"synthetic_{lines}.lrc", lines)
+        parser = LyricsParser()
+        lyrics = parser.parse_lrc_file(str(path))
+        end = lyrics[-1].timestamp + 4.0 if lyrics else 0.0
+
+        rng = random.Random(lines)
+        positions = [rng.uniform(0.0, end) for _ in range(QUERIES)]
+
+        result = {"lines": lines, "queries": QUERIES}
+        for name in GETTERS:
+            getter = getattr(parser, name)
+            result[name] = measure(
+                lambda: [getter(position) for position in positions], repeat, QUERIES)
+
+        # Sequential playback: the cursor walks forward 50 ms at a time
+        steps = [i * 0.05 for i in range(int(end / 0.05) + 1)][:QUERIES * 10]
+
+        def walk_cursor():
+            cursor = parser.cursor()
+            for position in steps:
+                cursor.advance(position)
+
+        result["cursor_sequential"] = measure(walk_cursor, repeat, max(1, len(steps)))
+        results.append(result)
+    return results
@@ -0,0 +1,79 @@
+"""
+Benchmarks for LyricsParser.parse_lrc_file and word timing generation.
+"""
+
+from pathlib import Path
+from typing import Iterable, List
+import gc
+import tracemalloc
+
+from benchmarks.synthetic import write_lrc
+from benchmarks.timing import measure
+from src.lyrics_parser import LyricsParser
+
+
+def _generate_all_words(lyrics) -> int:
+    """Generate the words of every line, as a full playback or export would."""
+    return sum(len(line.words) for line in lyrics)
+
+
+def _traced_bytes(path: Path, all_words: bool) -> int:
+    """Memory held by a parsed timeline, with or without every line's words."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        lyrics = LyricsParser().parse_lrc_file(str(path))
+        if all_words:
+            _generate_all_words(lyrics)
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def run(sizes: Iterable[int], workdir: Path, repeat: int = 5) -> List[dict]:
+    """
+    Measure parse throughput and word timing cost for each file size.
+
+    Word timing is generated per line on first use, so parsing is also
+    measured followed by generating every line's words, which is what
+    parsing cost when all words were created up front.
+
+    Args:
+        sizes: Numbers of lyric lines to generate
+        workdir: Directory for the synthetic LRC files
+        repeat: Timing rounds per measurement
+
+    Returns:
+        One result dictionary per size
+    """
+    results = []
+    for lines in sizes:
+        path = write_lrc(Path(workdir) / f"synthetic_{lines}.lrc", lines)
+        file_bytes = path.stat().st_size
+
+        parse = measure(lambda: LyricsParser().parse_lrc_file(str(path)), repeat)
+        parse_all_words = measure(
+            lambda: _generate_all_words(LyricsParser().parse_lrc_file(str(path))), repeat)
+        parse_compact = measure(
+            lambda: LyricsParser(compact=True).parse_lrc_file(str(path)), repeat)
+
+        # Word timing on an already parsed timeline; regenerating is idempotent
+        parser = LyricsParser()
+        lyrics = parser.parse_lrc_file(str(path))
+        word_timing = measure(lambda: parser._generate_word_timing(lyrics), repeat)
+        word_timing_all_words = measure(
+            lambda: (parser._generate_word_timing(lyrics), _generate_all_words(lyrics)), repeat)
+
+        results.append({
+            "lines": lines,
+            "file_bytes": file_bytes,
+            "parse": parse,
+            "parse_mb_per_s": file_bytes / parse["best"] / 1e6,
+            "parse_all_words": parse_all_words,
+            "parse_compact": parse_compact,
+            "word_timing": word_timing,
+            "word_timing_all_words": word_timing_all_words,
+            "traced_bytes": _traced_bytes(path, all_words=False),
+            "traced_bytes_all_words": _traced_bytes(path, all_words=True),
+        })
+    return results
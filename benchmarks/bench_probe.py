@@ -0,0 +1,99 @@
+"""
+Benchmarks for reading audio durations with src.audio_probe.
+"""
+
+from pathlib import Path
+from typing import Iterable, List
+import io
+import wave
+
+from benchmarks.synthetic import write_mp3, write_wav
+from benchmarks.timing import measure
+from src.audio_probe import probe_mp3, probe_wav
+
+# Audio lengths in minutes; header-only probes do not depend on the lyric sizes
+DURATIONS = [4, 60, 600]
+
+# Headerless VBR files are walked frame by frame, keep those shorter
+SCAN_DURATIONS = [4, 60]
+
+
+class _CountingFile(io.FileIO):
+    """Binary file that counts the bytes read through it."""
+
+    bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def _probe_cost(probe, path: Path, repeat: int) -> dict:
+    """Time a probe function on a file and count the bytes it reads."""
+    def run_probe():
+        with open(path, "rb") as file:
+            return probe(file)
+
+    timing = measure(run_probe, repeat)
+    with _CountingFile(path) as file:
+        info = probe(file)
+        bytes_read = file.bytes_read
+
+    return {
+        "method": info.method,
+        "duration": info.duration,
+        "file_bytes": path.stat().st_size,
+        "bytes_read": bytes_read,
+        "probe": timing,
+    }
+
+
+def _wave_module_duration(path: Path) -> float:
+    """Duration through the wave module, as AudioPlayer used to read it."""
+    with wave.open(str(path), "rb") as wav_file:
+        return wav_file.getnframes() / float(wav_file.getframerate())
+
+
+def run(sizes: Iterable[int], workdir: Path, repeat: int = 5) -> List[dict]:
+    """
+    Measure probe time and bytes read for large MP3 and WAV files.
+
+    Files are written sparsely where only headers are probed, so the suite
+    covers ten-hour files without filling the disk.
+
+    Args:
+        sizes: Unused, the suite uses DURATIONS instead of lyric line counts
+        workdir: Directory for the synthetic audio files
+        repeat: Timing rounds per measurement
+
+    Returns:
+        One result dictionary per file kind and duration
+    """
+    workdir = Path(workdir)
+    cases = []
+    for minutes in DURATIONS:
+        seconds = minutes * 60.0
+        cases.append(("mp3_xing_vbr", minutes, probe_mp3, write_mp3(
+            workdir / f"vbr_{minutes}.mp3", seconds, vbr=True, full=False)))
+        cases.append(("mp3_cbr", minutes, probe_mp3, write_mp3(
+            workdir / f"cbr_{minutes}.mp3", seconds, header=False, full=False)))
+        cases.append(("wav", minutes, probe_wav, write_wav(
+            workdir / f"audio_{minutes}.wav", seconds)))
+    for minutes in SCAN_DURATIONS:
+        cases.append(("mp3_vbr_scan", minutes, probe_mp3, write_mp3(
+            workdir / f"scan_{minutes}.mp3", minutes * 60.0, vbr=True, header=False)))
+
+    results = []
+    for kind, minutes, probe, path in cases:
+        result = {"kind": kind, "minutes": minutes}
+        result.update(_probe_cost(probe, path, repeat))
+        if kind == "wav":
+            try:
+                result["wave_module"] = measure(lambda: _wave_module_duration(path), repeat)
+            except wave.Error:
+                # The wave module cannot open RF64 files over 4 GiB
+                result["wave_module"] = None
+        path.unlink()
+        results.append(result)
+    return results
@@ -0,0 +1,127 @@
+"""
+Benchmarks for the per-frame cost of LyricDisplay rendering.
+"""
+
+from pathlib import Path
+from typing import Iterable, List
+
+from rich.console import Console
+
+from benchmarks.synthetic import write_lrc
+from benchmarks.timing import measure
+from src.display import LyricDisplay
+from src.frame_table import build_frame_table
+from src.lyrics_parser import LyricsParser
+
+# Frames rendered per timing call; rendering cost does not grow with song size
+MAX_FRAMES = 2000
+
+# Longest song pre-rendered into a frame table, in lyric lines
+TABLE_MAX_LINES = 10000
+
+
+class _NullFile:
+    """Write-only sink that discards everything."""
+
+    def write(self, data: str) -> int:
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+def _collect_frames(parser: LyricsParser, limit: int) -> List[dict]:
+    """Collect show_lyric_with_context arguments at every word boundary."""
+    frames = []
+    cursor = parser.cursor()
+    position = 0.0
+    last_line = -1
+    while len(frames) < limit:
+        frame = cursor.advance(position)
+        if frame.current_text:
+            frames.append({
+                "current_text": frame.current_text,
+                "previous_text": frame.previous_text,
+                "next_text": frame.next_text,
+                "current_time": position,
+                "clear_screen": frame.line_index != last_line,
+                "line_text": frame.line_text,
+                "word_count": frame.word_count,
+            })
+            last_line = frame.line_index
+        position = cursor.next_event_time()
+        if position is None:
+            break
+    return frames
+
+
+def run(sizes: Iterable[int], workdir: Path, repeat: int = 5, width: int = 120) -> List[dict]:
+    """
+    Measure the per-frame cost of show_lyric_with_context, and of writing
+    the same song from a pre-rendered frame table instead.
+
+    Args:
+        sizes: Numbers of lyric lines to generate
+        workdir: Directory for the synthetic LRC files
+        repeat: Timing rounds per measurement
+        width: Width of the in-memory console
+
+    Returns:
+        One result dictionary per size, cost in seconds per frame
+    """
+    results = []
+    for lines in sizes:
+        path = write_lrc(Path(workdir) / f"synthetic_{lines}.lrc", lines)
+        parser = LyricsParser()
+        parser.parse_lrc_file(str(path))
+        frames = _collect_frames(parser, MAX_FRAMES)
+        if not frames:
+            continue
+
+        console = Console(file=_NullFile(), force_terminal=True, width=width,
+                          color_system="truecolor")
+        display = LyricDisplay(console)
+        display.song_duration = frames[-1]["current_time"] + 4.0
+
+        def render_all():
+            display.clear_display()
+            for frame in frames:
+                display.show_lyric_with_context(**frame)
+
+        line_changes = sum(1 for frame in frames if frame["clear_screen"])
+        start_bytes = display.frame_stats.bytes
+        render_all()
+        frame_bytes = (display.frame_stats.bytes - start_bytes) / len(frames)
+
+        result = {
+            "lines": lines,
+            "frames": len(frames),
+            "line_changes": line_changes,
+            "bytes_per_frame": frame_bytes,
+            "show_lyric_with_context": measure(render_all, repeat, len(frames)),
+        }
+        if lines <= TABLE_MAX_LINES:
+            result["frame_table"] = _measure_table(parser, display, width, repeat)
+        results.append(result)
+    return results
+
+
+def _measure_table(parser: LyricsParser, display: LyricDisplay, width: int,
+                   repeat: int) -> dict:
+    """Measure building a song's frame table and playing it back."""
+    duration = display.song_duration
+    table = build_frame_table(parser, width, duration)
+    playback = [(table.span(i, i), i == table.keyframe(table.lines[i]))
+                for i in range(min(len(table), MAX_FRAMES))]
+
+    def play_all():
+        display.clear_display()
+        for frames, new_line in playback:
+            display.show_prerendered(frames, new_line)
+
+    return {
+        "frames": len(table),
+        "chars": len(table.text),
+        "build": measure(lambda: build_frame_table(parser, width, duration), repeat),
+        "show_prerendered": measure(play_all, repeat, len(playback)),
+    }
@@ -0,0 +1,99 @@
+"""
+Benchmarks for cataloging a library with src.scanner and searching its
+lyrics index with src.lyrics_index.
+"""
+
+from pathlib import Path
+from typing import Iterable, List
+import os
+import shutil
+import time
+
+from benchmarks.synthetic import write_lrc, write_wav
+from benchmarks.timing import measure
+from src.lyrics_index import INDEX_NAME, LyricsIndex
+from src.scanner import LibraryCatalog, scan_library
+
+# Song/LRC pairs per library; the lyric sizes do not apply here
+LIBRARY_SIZES = [100, 1000]
+
+# Lyric lines and audio length of every song in the library
+SONG_LINES = 60
+SONG_SECONDS = 200.0
+
+# Songs per album directory
+ALBUM_SIZE = 12
+
+# Word, prefix and phrase queries over the synthetic vocabulary
+QUERIES = ["tonight", "dr*", "love tonight", "hold me fo*"]
+
+
+def _write_library(root: Path, pairs: int) -> None:
+    """Write a library of sparse WAV files with LRC files, in album folders."""
+    for index in range(pairs):
+        album = root / f"album{index // ALBUM_SIZE:04d}"
+        album.mkdir(parents=True, exist_ok=True)
+        write_wav(album / f"track{index:05d}.wav", SONG_SECONDS)
+        write_lrc(album / f"track{index:05d}.lrc", SONG_LINES, seed=index)
+
+
+def _timed_scan(root: Path, catalog_path: Path, jobs: int, full: bool) -> dict:
+    """Scan the library once and keep the statistics that describe it."""
+    start = time.perf_counter()
+    stats = scan_library(root, LibraryCatalog(catalog_path), jobs=jobs, full=full)
+    return {
+        "seconds": time.perf_counter() - start,
+        "parsed": stats["parsed"],
+        "files_per_second": stats["files_per_second"],
+    }
+
+
+def _best(scans: List[dict]) -> dict:
+    """The fastest of several scans."""
+    return min(scans, key=lambda scan: scan["seconds"])
+
+
+def run(sizes: Iterable[int], workdir: Path, repeat: int = 5) -> List[dict]:
+    """
+    Measure full scans with one worker and with every CPU, rescans, and
+    queries against the lyrics index the scans write.
+
+    Args:
+        sizes: Unused, the suite uses LIBRARY_SIZES instead of lyric line counts
+        workdir: Directory for the synthetic library and its catalog
+        repeat: Scans per measurement, the fastest is reported
+
+    Returns:
+        One result dictionary per library size
+    """
+    cpus = os.cpu_count() or 1
+    results = []
+    for pairs in LIBRARY_SIZES:
+        root = Path(workdir) / f"library_{pairs}"
+        catalog_path = root / "catalog.json"
+        _write_library(root, pairs)
+
+        serial = _best([_timed_scan(root, catalog_path, 1, True) for _ in range(repeat)])
+        parallel = _best([_timed_scan(root, catalog_path, cpus, True) for _ in range(repeat)])
+        # Nothing changed since the last scan: directory walks, stats and
+        # an index rewrite from the previous index
+        rescan = _best([_timed_scan(root, catalog_path, cpus, False) for _ in range(repeat)])
+
+        index_path = catalog_path.with_name(INDEX_NAME)
+        with LyricsIndex(index_path) as index:
+            queries = {query: dict(measure(lambda: index.search(query, limit=20), repeat),
+                                   hits=len(index.search(query)))
+                       for query in QUERIES}
+
+        results.append({
+            "pairs": pairs,
+            "cpus": cpus,
+            "full_scan_one_worker": serial,
+            "full_scan_all_cpus": parallel,
+            "speedup": serial["seconds"] / parallel["seconds"],
+            "unchanged_rescan": rescan,
+            "index_bytes": index_path.stat().st_size,
+            "queries": queries,
+        })
+        shutil.rmtree(root)
+    return results
@@ -0,0 +1,151 @@
+"""
+Startup benchmarks: import time and time to the first frame, with budgets.
+
+Each measurement runs in a fresh interpreter so module caches do not hide
+import costs. Run ``python -m benchmarks.bench_startup`` to check the
+budgets; it exits with status 1 if any median is over budget.
+tests/test_startup_budget.py checks the modules loaded in one run; timing
+is left to this benchmark, as it depends on the machine.
+"""
+
+from pathlib import Path
+from typing import Iterable, List
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.synthetic import write_lrc, write_wav
+
+# Budgets for the median of the runs, in seconds
+IMPORT_BUDGET = 0.15        # Importing src.main and the modules the header needs
+FIRST_FRAME_BUDGET = 0.35   # Interpreter start to the song header on screen
+
+# Modules that cost most of a cold start; the player modules load none of
+# them, and only rich (which draws it) may be loaded by the first frame
+HEAVY_MODULES = ("pygame", "numpy", "rich")
+
+# Lyric lines and audio length of the startup fixture
+FIXTURE_LINES = 1000
+FIXTURE_SECONDS = 240.0
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+
+_IMPORT_SCRIPT = """
+import json, sys, time
+heavy = sys.argv[1].split(",")
+start = time.perf_counter()
+import src.main, src.lyrics_parser, src.scheduler
+player_modules = [name for name in heavy if name in sys.modules]
+import src.display
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "player_modules": player_modules,
+                  "modules": [name for name in heavy if name in sys.modules]}))
+"""
+
+_FIRST_FRAME_SCRIPT = """
+import io, json, sys, time
+heavy = sys.argv[1].split(",")
+start = time.perf_counter()
+from rich.console import Console
+from src.display import LyricDisplay
+from src.main import VersePlayer
+
+marks = {}
+display = LyricDisplay(Console(file=io.StringIO(), force_terminal=True, width=100))
+show_song_header = display.show_song_header
+
+def timed_show_song_header(*args, **kwargs):
+    show_song_header(*args, **kwargs)
+    marks["first_frame"] = time.perf_counter() - start
+    marks["modules"] = [name for name in heavy if name in sys.modules]
+
+player = VersePlayer(sys.argv[2], sys.argv[3], display=display, cache_lyrics=True)
+display.show_song_header = timed_show_song_header
+# Stop where playback would begin; only the startup path is measured
+player._play_loaded = lambda: marks.__setitem__("ready", time.perf_counter() - start)
+player.start_playback()
+print(json.dumps(marks))
+"""
+
+
+def _run_script(script: str, args: List[str], env: dict) -> dict:
+    """Run a measurement script in a fresh interpreter and parse its JSON."""
+    completed = subprocess.run(
+        [sys.executable, "-c", script, *args], cwd=_REPO_ROOT, env=env,
+        capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _median(runs: List[dict], key: str) -> float:
+    """Median of one measurement over all runs."""
+    return statistics.median(run[key] for run in runs)
+
+
+def _loaded(runs: List[dict], key: str) -> List[str]:
+    """Heavy modules loaded in any of the runs, in HEAVY_MODULES order."""
+    loaded = {name for run in runs for name in run[key]}
+    return [name for name in HEAVY_MODULES if name in loaded]
+
+
+def run(sizes: Iterable[int], workdir: Path, repeat: int = 5) -> dict:
+    """
+    Measure import time and time to the first frame against their budgets.
+
+    Args:
+        sizes: Unused, the fixture has FIXTURE_LINES lines
+        workdir: Directory for the fixture files and the lyrics cache
+        repeat: Interpreter launches per measurement
+
+    Returns:
+        Dictionary with the medians, budgets and whether each is met
+    """
+    workdir = Path(workdir)
+    lyrics_path = write_lrc(workdir / "startup.lrc", FIXTURE_LINES)
+    song_path = write_wav(workdir / "startup.wav", FIXTURE_SECONDS)
+
+    env = dict(os.environ)
+    env["SDL_AUDIODRIVER"] = env.get("SDL_AUDIODRIVER", "dummy")
+    env["VERSE_CACHE_DIR"] = str(workdir / "cache")
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+
+    heavy = ",".join(HEAVY_MODULES)
+    imports = [_run_script(_IMPORT_SCRIPT, [heavy], env) for _ in range(repeat)]
+    frames = [_run_script(_FIRST_FRAME_SCRIPT, [heavy, str(song_path), str(lyrics_path)], env)
+              for _ in range(repeat)]
+
+    import_seconds = _median(imports, "seconds")
+    first_frame_seconds = _median(frames, "first_frame")
+    return {
+        "runs": repeat,
+        "import_seconds": import_seconds,
+        "import_budget": IMPORT_BUDGET,
+        "import_within_budget": import_seconds <= IMPORT_BUDGET,
+        "first_frame_seconds": first_frame_seconds,
+        "first_frame_budget": FIRST_FRAME_BUDGET,
+        "first_frame_within_budget": first_frame_seconds <= FIRST_FRAME_BUDGET,
+        # Loading finished and playback would start; not budgeted, the
+        # audio backend dominates it
+        "ready_seconds": _median(frames, "ready"),
+        "heavy_modules_on_player_import": _loaded(imports, "player_modules"),
+        "heavy_modules_before_first_frame": _loaded(imports + frames, "modules"),
+    }
+
+
+def main() -> None:
+    """Check the startup budgets and exit with status 1 if one is missed."""
+    with tempfile.TemporaryDirectory(prefix="verse-startup-") as workdir:
+        result = run([], Path(workdir))
+    print(json.dumps(result, indent=2))
+
+    if not (result["import_within_budget"] and result["first_frame_within_budget"]
+            and not result["heavy_modules_on_player_import"]
+            and result["heavy_modules_before_first_frame"] in ([], ["rich"])):
+        print("Startup budget exceeded", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmarks for the spectrum strip of src.visualizer against its frame budget.
+"""
+
+from pathlib import Path
+from typing import Iterable, List
+
+from rich.console import Console
+
+from benchmarks.bench_align import write_song
+from benchmarks.bench_render import _NullFile, _collect_frames
+from benchmarks.synthetic import write_lrc
+from benchmarks.timing import measure
+from src.display import LyricDisplay
+from src.lyrics_parser import LyricsParser
+from src.pcm import map_wav, numpy_available
+from src.visualizer import DEFAULT_FPS, _BandLevels
+
+# Length of the synthetic song in seconds; a strip only reads FFT_SIZE samples
+SONG_SECONDS = 60
+
+# Strips computed per timing call, spread over the song
+POSITIONS = 200
+
+
+def run(sizes: Iterable[int], workdir: Path, repeat: int = 5) -> List[dict]:
+    """
+    Measure computing one spectrum strip and drawing it, each as a share
+    of the 1/DEFAULT_FPS frame budget. Neither depends on the lyric size.
+
+    Args:
+        sizes: Unused, the strip cost does not depend on lyric sizes
+        workdir: Directory for the synthetic WAV and LRC files
+        repeat: Timing rounds per measurement
+
+    Returns:
+        One result dictionary, costs in seconds per strip; empty without NumPy
+    """
+    if not numpy_available():
+        return []
+
+    path = write_song(Path(workdir) / "visualizer.wav", SONG_SECONDS)
+    levels = _BandLevels(map_wav(str(path)))
+    positions = [SONG_SECONDS * (i + 0.5) / POSITIONS for i in range(POSITIONS)]
+
+    def compute():
+        for position in positions:
+            levels.strip(position)
+
+    strips = [levels.strip(position) for position in positions]
+
+    parser = LyricsParser()
+    parser.parse_lrc_file(str(write_lrc(Path(workdir) / "visualizer.lrc", 10)))
+    console = Console(file=_NullFile(), force_terminal=True, width=100,
+                      color_system="truecolor")
+    display = LyricDisplay(console)
+    display.show_lyric_with_context(**_collect_frames(parser, 1)[0])
+
+    def draw():
+        for strip in strips:
+            display.show_levels(strip)
+
+    budget = 1.0 / DEFAULT_FPS
+    strip_cost = measure(compute, repeat, POSITIONS)
+    draw_cost = measure(draw, repeat, len(strips))
+    return [{
+        "fps": DEFAULT_FPS,
+        "frame_budget_seconds": budget,
+        "strip": strip_cost,
+        "strip_budget_used": strip_cost["median"] / budget,
+        "show_levels": draw_cost,
+        "draw_budget_used": draw_cost["median"] / budget,
+    }]
@@ -0,0 +1,187 @@
+"""
+Synthetic LRC and audio files for the Verse benchmarks.
+"""
+
+from pathlib import Path
+import random
+
+# Small fixed vocabulary so word lengths look like real lyrics
+_VOCABULARY = (
+    "love night heart dance light fire rain dream sky road home time "
+    "never always baby tonight forever we you I me my your the a to and "
+    "in on of let go come stay run fall rise shine burn hold feel know"
+).split()
+
+
+def format_timestamp(seconds: float) -> str:
+    """
+    Format seconds as an LRC [mm:ss.xx] tag.
+
+    Args:
+        seconds: Time in seconds
+
+    Returns:
+        Timestamp tag, minutes grow past 99 for very long files
+    """
+    centiseconds = int(round(seconds * 100))
+    minutes, centiseconds = divmod(centiseconds, 6000)
+    return f"[{minutes:02d}:{centiseconds // 100:02d}.{centiseconds % 100:02d}]"
+
+
+def generate_lrc_text(lines: int, seed: int = 0, line_interval: float = 3.0,
+                      min_words: int = 3, max_words: int = 10) -> str:
+    """
+    Generate the content of a synthetic LRC file.
+
+    Args:
+        lines: Number of lyric lines
+        seed: Random seed, the same seed always gives the same file
+        line_interval: Average seconds between lines
+        min_words: Fewest words per line
+        max_words: Most words per line
+
+    Returns:
+        LRC text with metadata tags and timestamped lines
+    """
+    rng = random.Random(seed)
+    out = ["[ar:Verse Benchmarks]", f"[ti:Synthetic {lines} lines]"]
+    timestamp = 0.0
+    for _ in range(lines):
+        words = rng.choices(_VOCABULARY, k=rng.randint(min_words, max_words))
+        out.append(format_timestamp(timestamp) + " ".join(words))
+        timestamp += line_interval * rng.uniform(0.5, 1.5)
+    return "\n".join(out) + "\n"
+
+
+def write_lrc(path: Path, lines: int, seed: int = 0) -> Path:
+    """
+    Write a synthetic LRC file.
+
+    Args:
+        path: Destination file
+        lines: Number of lyric lines
+        seed: Random seed
+
+    Returns:
+        The path written
+    """
+    path = Path(path)
+    path.write_text(generate_lrc_text(lines, seed), encoding="utf-8")
+    return path
+
+
+# MPEG-1 Layer III bitrate indexes by kbit/s, used for synthetic MP3 frames
+_MP3_BITRATE_INDEX = {32: 1, 40: 2, 48: 3, 56: 4, 64: 5, 80: 6, 96: 7, 112: 8,
+                      128: 9, 160: 10, 192: 11, 224: 12, 256: 13, 320: 14}
+_MP3_SAMPLE_RATE = 44100
+_MP3_FRAME_SAMPLES = 1152
+
+
+def _mp3_frame(bitrate: int, padding: int, body: bytes = b"") -> bytes:
+    """Build one silent MPEG-1 Layer III stereo frame at 44.1 kHz."""
+    header = bytes((0xFF, 0xFB, (_MP3_BITRATE_INDEX[bitrate] << 4) | (padding << 1), 0x00))
+    length = 144 * bitrate * 1000 // _MP3_SAMPLE_RATE + padding
+    return header + body + bytes(length - 4 - len(body))
+
+
+def write_mp3(path: Path, seconds: float, bitrate: int = 128, vbr: bool = False,
+              header: bool = True, id3_bytes: int = 4096, full: bool = True,
+              seed: int = 0) -> Path:
+    """
+    Write a synthetic MP3 of silent frames.
+
+    Args:
+        path: Destination file
+        seconds: Playing time
+        bitrate: Bitrate in kbit/s (average target for VBR)
+        vbr: Vary the bitrate from frame to frame
+        header: Start with a Xing (VBR) or Info (CBR) frame carrying the frame
+            count and LAME encoder delay/padding
+        id3_bytes: Size of a leading ID3v2 tag, 0 for none
+        full: Write every frame; otherwise write the first second and extend
+            the file sparsely to its full size, enough for header-only probes
+        seed: Random seed for VBR bitrates
+
+    Returns:
+        The path written
+    """
+    rng = random.Random(seed)
+    rates = [rate for rate in _MP3_BITRATE_INDEX if bitrate // 2 <= rate <= bitrate * 2]
+    frame_count = int(seconds * _MP3_SAMPLE_RATE / _MP3_FRAME_SAMPLES)
+    written = frame_count if full else min(frame_count, 40)
+
+    frames = []
+    total_bytes = 0
+    remainder = 0
+    for _ in range(frame_count):
+        rate = rng.choice(rates) if vbr else bitrate
+        # Padding slots keep the average frame length exact, as encoders do
+        remainder += 144 * rate * 1000 % _MP3_SAMPLE_RATE
+        padding = 1 if remainder >= _MP3_SAMPLE_RATE else 0
+        remainder -= padding * _MP3_SAMPLE_RATE
+        length = 144 * rate * 1000 // _MP3_SAMPLE_RATE + padding
+        if len(frames) < written:
+            frames.append(_mp3_frame(rate, padding))
+        total_bytes += length
+
+    out = bytearray()
+    if id3_bytes:
+        size = id3_bytes - 10
+        out += b"ID3\x04\x00\x00" + bytes(((size >> 21) & 0x7F, (size >> 14) & 0x7F,
+                                           (size >> 7) & 0x7F, size & 0x7F))
+        out += bytes(size)
+    if header:
+        # Xing/Info tag after the 32-byte side info, then the LAME extension
+        # with 576 samples of encoder delay and 1152 samples of padding
+        body = bytes(32) + (b"Xing" if vbr else b"Info") + (0x0F).to_bytes(4, "big")
+        body += frame_count.to_bytes(4, "big") + total_bytes.to_bytes(4, "big")
+        body += bytes(100) + (50).to_bytes(4, "big")
+        body += b"LAME3.100" + bytes(12) + bytes((576 >> 4, ((576 & 0x0F) << 4) | (1152 >> 8), 1152 & 0xFF))
+        out += _mp3_frame(128, 0, body)
+
+    path = Path(path)
+    with open(path, "wb") as file:
+        file.write(out)
+        file.write(b"".join(frames))
+        if not full:
+            file.truncate(len(out) + total_bytes)
+    return path
+
+
+def write_wav(path: Path, seconds: float, sample_rate: int = 44100, channels: int = 2) -> Path:
+    """
+    Write a 16-bit PCM WAV header and extend the file sparsely with silence.
+
+    Files over 4 GiB are written as RF64 with a ds64 chunk holding the sizes.
+
+    Args:
+        path: Destination file
+        seconds: Playing time
+        sample_rate: Samples per second
+        channels: Number of channels
+
+    Returns:
+        The path written
+    """
+    block_align = channels * 2
+    data_size = int(seconds * sample_rate) * block_align
+    fmt = b"fmt " + (16).to_bytes(4, "little")
+    fmt += (1).to_bytes(2, "little") + channels.to_bytes(2, "little")
+    fmt += sample_rate.to_bytes(4, "little") + (sample_rate * block_align).to_bytes(4, "little")
+    fmt += block_align.to_bytes(2, "little") + (16).to_bytes(2, "little")
+
+    if 36 + data_size <= 0xFFFFFFFF:
+        header = b"RIFF" + (36 + data_size).to_bytes(4, "little") + b"WAVE" + fmt
+        header += b"data" + data_size.to_bytes(4, "little")
+    else:
+        ds64 = b"ds64" + (28).to_bytes(4, "little")
+        ds64 += (72 + data_size).to_bytes(8, "little") + data_size.to_bytes(8, "little")
+        ds64 += (data_size // block_align).to_bytes(8, "little") + bytes(4)
+        header = b"RF64" + b"\xff\xff\xff\xff" + b"WAVE" + ds64 + fmt
+        header += b"data" + b"\xff\xff\xff\xff"
+
+    path = Path(path)
+    with open(path, "wb") as file:
+        file.write(header)
+        file.truncate(len(header) + data_size)
+    return path
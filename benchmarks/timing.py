@@ -0,0 +1,30 @@
+"""
+Timing helpers shared by the Verse benchmarks.
+"""
+
+from typing import Callable
+import statistics
+import timeit
+
+
+def measure(func: Callable[[], object], repeat: int = 5, per_call: int = 1) -> dict:
+    """
+    Time a function with timeit, auto-ranging the number of loops.
+
+    Args:
+        func: Zero-argument function to time
+        repeat: Number of timing rounds
+        per_call: Operations performed by one call, to report per-operation cost
+
+    Returns:
+        Dictionary with loops per round and best/median seconds per operation
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    rounds = [t / number / per_call for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "loops": number,
+        "operations_per_call": per_call,
+        "best": min(rounds),
+        "median": statistics.median(rounds),
+    }
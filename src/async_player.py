@@ -0,0 +1,239 @@
+"""
+Async Player Module for Verse Music Player
+Runs the playback core as asyncio tasks with keyboard controls.
+
+Controls:
+    space / p   Pause or resume
+    left/right  Seek back or forward SEEK_STEP seconds
+    0 - 9       Jump to 0% - 90% of the song
+    q / Esc     Quit
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+import asyncio
+
+from src.keyboard import KeyReader
+from src.main import DisplayState
+
+# Seconds between audio clock reads, the mixer sampling interval of
+# src.audio_clock.InterpolatedClock
+CLOCK_INTERVAL = 0.1
+
+# Seconds skipped by the left and right arrow keys
+SEEK_STEP = 5.0
+
+PAUSED_MESSAGE = "Paused - press space to resume"
+
+
+class AsyncPlaybackCore:
+    """
+    A VersePlayer's sync loop as three tasks on one asyncio event loop.
+
+    The clock task reads the audio position every CLOCK_INTERVAL and ends
+    playback with the song. The render task sleeps until the next word,
+    line or progress tick, or until woken, and draws the frame at the
+    position extrapolated from the last clock read. The key task applies
+    pause, resume, seek and quit and wakes the render task, so a key shows
+    on screen with the next frame.
+
+    pygame calls run on a single-thread executor: they never block the
+    event loop and never run on two threads at once. While paused, the
+    clock and render tasks wait on events without a timeout and the key
+    reader waits on the terminal, so the player uses no CPU.
+    """
+
+    def __init__(self, player, key_reader: Optional[KeyReader] = None):
+        """
+        Initialize the playback core.
+
+        Args:
+            player: VersePlayer with its song loaded and playing
+            key_reader: Key source, defaults to a KeyReader on stdin
+        """
+        self.player = player
+        self.audio_player = player.audio_player
+        self.display = player.display
+        self.clock = player.clock
+        self.key_reader = key_reader or KeyReader()
+        self.paused = False
+
+    def run(self) -> None:
+        """Run the playback tasks until the song ends or the user quits."""
+        asyncio.run(self._run())
+
+    async def _run(self) -> None:
+        """Start the clock, render and key tasks and wait for the first to end."""
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="verse-audio")
+        self._view = DisplayState(cursor=self.player.lyrics_parser.cursor(),
+                                  frames=self.player.frame_tables)
+        self._wake = asyncio.Event()
+        self._resumed = asyncio.Event()
+        self._resumed.set()
+        # Bumped by every seek, pause and resume so that a clock read that
+        # was in flight meanwhile is dropped
+        self._generation = 0
+
+        # Spectrum frames published by the visualizer thread wake the render task
+        loop = asyncio.get_running_loop()
+        self.player._wake_render = lambda: self._wake_from_thread(loop)
+
+        self.key_reader.start()
+        tasks = []
+        try:
+            self._set_anchor(await self._in_executor(self.audio_player.get_position))
+            tasks = [
+                asyncio.ensure_future(self._clock_task()),
+                asyncio.ensure_future(self._render_task()),
+                asyncio.ensure_future(self._key_task()),
+            ]
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.key_reader.stop()
+            self._executor.shutdown(wait=True)
+            self.player._wake_render = self.clock.wake
+
+    def _wake_from_thread(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Wake the render task from another thread."""
+        try:
+            loop.call_soon_threadsafe(self._wake.set)
+        except RuntimeError:
+            # The event loop closed while the thread was publishing
+            pass
+
+    async def _in_executor(self, function, *args):
+        """Run a blocking audio call on the audio thread."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+
+    def _set_anchor(self, position: float, at: Optional[float] = None) -> None:
+        """Pin the extrapolated position to an audio clock reading."""
+        self._anchor_position = position
+        self._anchor_time = self.clock.now() if at is None else at
+        self.player.state.current_position = position
+
+    def _position(self) -> float:
+        """Current playback position, extrapolated from the last clock read."""
+        if self.paused:
+            return self._anchor_position
+        return self._anchor_position + (self.clock.now() - self._anchor_time)
+
+    def _read_audio(self) -> Tuple[float, float, bool, Optional[float]]:
+        """
+        Audio thread: read the position, whether the song still plays and
+        whether a playlist moved on to its next song.
+
+        Returns:
+            (position, clock time of the reading, playing, duration of the
+            song that started or None) tuple
+        """
+        position = self.audio_player.get_position()
+        read_at = self.clock.now()
+        playing = self.audio_player.is_playing()
+        return position, read_at, playing, self.player._poll_next_track()
+
+    async def _clock_task(self) -> None:
+        """Follow the audio clock; returns when playback has ended."""
+        while True:
+            await self._resumed.wait()
+            generation = self._generation
+            position, read_at, playing, next_duration = await self._in_executor(
+                self._read_audio)
+            if not playing:
+                return
+
+            # Follow a gapless switch to the next song's timeline; the
+            # mixer reported it once, so it applies whatever the generation
+            if next_duration is not None:
+                self._view = DisplayState(cursor=self.player._switch_track(next_duration),
+                                          frames=self.player.frame_tables)
+                self._wake.set()
+
+            if generation == self._generation:
+                self._set_anchor(position, read_at)
+
+            await asyncio.sleep(CLOCK_INTERVAL)
+
+    async def _render_task(self) -> None:
+        """Draw frames when lyric events are due or when woken up."""
+        scheduler = self.player.scheduler
+        while True:
+            self._wake.clear()
+            position = self._position()
+            next_event = self.player._render_frame(self._view, position)
+
+            if self.paused:
+                # Nothing moves until a key arrives
+                self.display.show_status(PAUSED_MESSAGE)
+                delay = None
+            else:
+                deadline = scheduler.next_deadline(position, next_event)
+                delay = max(scheduler.min_sleep, deadline - position)
+                scheduler.wakeups += 1
+
+            try:
+                await asyncio.wait_for(self._wake.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _key_task(self) -> None:
+        """Apply key presses; returns when the user quits."""
+        while True:
+            key = await self.key_reader.get()
+            if key in ('q', 'Q', 'escape'):
+                await self._quit()
+                return
+            if key in (' ', 'p', 'P'):
+                await self._toggle_pause()
+            elif key == 'left':
+                await self._seek(self.audio_player.seek_by, -SEEK_STEP)
+            elif key == 'right':
+                await self._seek(self.audio_player.seek_by, SEEK_STEP)
+            elif key.isdigit():
+                duration = await self._in_executor(self.audio_player.get_duration)
+                if duration > 0:
+                    await self._seek(self.audio_player.seek, duration * int(key) / 10)
+
+    async def _toggle_pause(self) -> None:
+        """Pause or resume the audio and the tasks that follow it."""
+        self._generation += 1
+        if self.paused:
+            await self._in_executor(self.audio_player.resume)
+            position = await self._in_executor(self.audio_player.get_position)
+            self.paused = False
+            self._set_anchor(position)
+            self.display.show_status(None)
+            self._resumed.set()
+        else:
+            await self._in_executor(self.audio_player.pause)
+            position = await self._in_executor(self.audio_player.get_position)
+            self._set_anchor(position)
+            self.paused = True
+            self._resumed.clear()
+        self._wake.set()
+
+    async def _seek(self, seek, target: float) -> None:
+        """
+        Jump to a new position and redraw the screen with the next frame.
+
+        Args:
+            seek: The audio player's seek or seek_by method
+            target: Argument for the seek method, in seconds
+        """
+        self._generation += 1
+        position = await self._in_executor(seek, target)
+        self._set_anchor(position)
+
+        # The cursor finds the new line by binary search; the reset view
+        # makes the next frame draw every row again
+        self._view.reset()
+        self._wake.set()
+
+    async def _quit(self) -> None:
+        """Stop playback for good, playlists included."""
+        self.player.state.interrupted = True
+        await self._in_executor(self.audio_player.stop)
@@ -0,0 +1,161 @@
+"""
+Audio Clock Module for Verse Music Player
+Smooth playback position interpolated between coarse mixer readings.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Optional
+import math
+import time
+
+
+@dataclass
+class ClockStats:
+    """Jitter counters for the mixer readings seen by an InterpolatedClock."""
+    samples: int = 0               # Mixer readings folded into the estimate
+    resyncs: int = 0               # Readings too far off to filter, snapped to
+    error_sum: float = 0.0         # Sum of reading minus prediction, seconds
+    error_sq_sum: float = 0.0      # Sum of squared errors
+    max_abs_error: float = 0.0     # Largest filtered error magnitude, seconds
+
+    def summary(self) -> dict:
+        """
+        Summarize the mixer jitter against the interpolated clock.
+
+        Returns:
+            Dictionary with sample counts and error mean, RMS jitter and
+            maximum in milliseconds
+        """
+        samples = max(1, self.samples)
+        mean = self.error_sum / samples
+        variance = max(0.0, self.error_sq_sum / samples - mean * mean)
+        return {
+            'samples': self.samples,
+            'resyncs': self.resyncs,
+            'mean_error_ms': mean * 1000.0,
+            'jitter_ms': math.sqrt(variance) * 1000.0,
+            'max_error_ms': self.max_abs_error * 1000.0,
+        }
+
+
+class InterpolatedClock:
+    """
+    Playback clock anchored to time.perf_counter().
+
+    The mixer reports its position in buffer-sized steps and every reading
+    is a call into the audio library. Between readings the position is
+    extrapolated from the monotonic clock; every ``sample_interval`` a new
+    mixer reading nudges the anchor and the playback rate with a small
+    alpha-beta filter, so the clock follows slow drift without inheriting
+    the mixer's step jitter. Readings further off than ``max_error`` (a
+    stall or a seek) re-anchor the clock directly.
+    """
+
+    def __init__(
+        self,
+        read_mixer: Callable[[], Optional[float]],
+        clock: Callable[[], float] = time.perf_counter,
+        sample_interval: float = 0.1,
+        alpha: float = 0.1,
+        beta: float = 0.005,
+        max_rate_error: float = 0.01,
+        max_error: float = 0.25
+    ):
+        """
+        Initialize the clock.
+
+        Args:
+            read_mixer: Returns the mixer position in seconds, or None if the
+                mixer has none yet
+            clock: Monotonic clock in seconds
+            sample_interval: Seconds between mixer readings
+            alpha: Share of a reading's error applied to the position
+            beta: Share of a reading's error applied to the playback rate
+            max_rate_error: Largest deviation of the rate from 1.0
+            max_error: Error above which the clock re-anchors to the reading
+        """
+        self._read_mixer = read_mixer
+        self._clock = clock
+        self.sample_interval = sample_interval
+        self.alpha = alpha
+        self.beta = beta
+        self.max_rate_error = max_rate_error
+        self.max_error = max_error
+        self.stats = ClockStats()
+
+        self._anchor_time: float = 0.0
+        self._anchor_position: float = 0.0
+        self._rate: float = 1.0
+        self._next_sample: float = 0.0
+        self._last_position: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Current estimate of mixer seconds per monotonic second."""
+        return self._rate
+
+    def start(self, position: float = 0.0, at: Optional[float] = None) -> None:
+        """
+        Anchor the clock when playback starts or jumps.
+
+        Args:
+            position: Playback position in seconds at the anchor
+            at: Monotonic time of the anchor, defaults to now
+        """
+        now = self._clock() if at is None else at
+        self._anchor_time = now
+        self._anchor_position = position
+        self._rate = 1.0
+        self._next_sample = now + self.sample_interval
+        self._last_position = position
+
+    def position(self) -> float:
+        """
+        Get the interpolated playback position.
+
+        Returns:
+            Playback position in seconds; never decreases between anchors
+        """
+        now = self._clock()
+        if now >= self._next_sample:
+            self._sample(now)
+
+        position = self._anchor_position + (now - self._anchor_time) * self._rate
+        # Filter corrections may step back by a fraction of a millisecond
+        if position < self._last_position:
+            return self._last_position
+        self._last_position = position
+        return position
+
+    def _sample(self, now: float) -> None:
+        """Fold a fresh mixer reading into the anchor and rate."""
+        self._next_sample = now + self.sample_interval
+        reading = self._read_mixer()
+        if reading is None:
+            return
+
+        elapsed = now - self._anchor_time
+        predicted = self._anchor_position + elapsed * self._rate
+        error = reading - predicted
+
+        stats = self.stats
+        if abs(error) > self.max_error:
+            stats.resyncs += 1
+            self._anchor_time = now
+            self._anchor_position = reading
+            self._rate = 1.0
+            self._last_position = reading
+            return
+
+        stats.samples += 1
+        stats.error_sum += error
+        stats.error_sq_sum += error * error
+        if abs(error) > stats.max_abs_error:
+            stats.max_abs_error = abs(error)
+
+        self._anchor_time = now
+        self._anchor_position = predicted + self.alpha * error
+        if elapsed > 0:
+            rate = self._rate + self.beta * error / elapsed
+            self._rate = min(1.0 + self.max_rate_error,
+                             max(1.0 - self.max_rate_error, rate))
@@ -0,0 +1,448 @@
+"""
+Audio Probe Module for Verse Music Player
+Reads audio durations from file headers without decoding.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Optional, Tuple
+import struct
+
+# First read after the ID3v2 tags, enough for the first frames of most files
+_PROBE_READ = 8 * 1024
+
+# How much audio data is searched for the first MPEG frame
+_SYNC_WINDOW = 64 * 1024
+
+# Consecutive frame headers that must line up to accept the first frame
+_SYNC_FRAMES = 3
+
+# Consecutive frames that must agree before a file is treated as CBR
+_CBR_CHECK_FRAMES = 8
+
+# fmt chunk tag whose real format follows in the extension
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# Bitrates in kbit/s by [MPEG-1?][layer] and bitrate index
+_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+# Sample rates by version bits (0 = MPEG-2.5, 2 = MPEG-2, 3 = MPEG-1)
+_SAMPLE_RATES = {
+    0: (11025, 12000, 8000),
+    2: (22050, 24000, 16000),
+    3: (44100, 48000, 32000),
+}
+
+
+@dataclass
+class AudioInfo:
+    """Stream properties read from an audio file's headers."""
+    duration: float       # Playing time in seconds
+    sample_rate: int      # Samples per second
+    channels: int         # Number of channels
+    bitrate: int          # Average bitrate in bit/s
+    method: str           # Where the duration came from: riff, xing, vbri, cbr or scan
+
+
+@dataclass
+class WavLayout:
+    """Sample format and location of the audio data in a WAV file."""
+    format_tag: int       # 1 = integer PCM, 3 = IEEE float
+    channels: int         # Number of channels
+    sample_rate: int      # Samples per second
+    byte_rate: int        # Bytes per second
+    block_align: int      # Bytes per frame, all channels
+    bits_per_sample: int  # Bits of one sample
+    data_offset: int      # File offset of the first sample
+    data_size: int        # Bytes of sample data present in the file
+
+
+@dataclass
+class _FrameHeader:
+    """Decoded 4-byte MPEG audio frame header."""
+    mpeg1: bool
+    layer: int
+    bitrate: int          # bit/s
+    sample_rate: int
+    channels: int
+    samples: int          # Samples per frame
+    length: int           # Frame length in bytes including the header
+
+
+def _parse_frame_header(data: bytes, offset: int) -> Optional[_FrameHeader]:
+    """Decode the frame header at offset, or return None if it is not one."""
+    if offset + 4 > len(data):
+        return None
+    b0, b1, b2, b3 = data[offset:offset + 4]
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+
+    version = (b1 >> 3) & 0x03
+    layer = 4 - ((b1 >> 1) & 0x03)
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 0x03
+    # Reserved version/layer/sample rate, free-format and bad bitrates
+    if version == 1 or layer == 4 or rate_index == 3 or bitrate_index in (0, 15):
+        return None
+
+    mpeg1 = version == 3
+    bitrate = _BITRATES[(mpeg1, layer)][bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    padding = (b2 >> 1) & 0x01
+    channels = 1 if (b3 >> 6) == 3 else 2
+
+    if layer == 1:
+        samples = 384
+        length = (12 * bitrate // sample_rate + padding) * 4
+    elif layer == 2 or mpeg1:
+        samples = 1152
+        length = 144 * bitrate // sample_rate + padding
+    else:
+        samples = 576
+        length = 72 * bitrate // sample_rate + padding
+
+    return _FrameHeader(mpeg1=mpeg1, layer=layer, bitrate=bitrate,
+                        sample_rate=sample_rate, channels=channels,
+                        samples=samples, length=length)
+
+
+def _skip_id3v2(file: BinaryIO) -> int:
+    """
+    Skip any ID3v2 tags at the start of the file.
+
+    Returns:
+        Offset of the first byte after the tags
+    """
+    offset = 0
+    while True:
+        file.seek(offset)
+        header = file.read(10)
+        if len(header) < 10 or header[:3] != b'ID3':
+            return offset
+        # Tag size is a 28-bit syncsafe integer excluding the header
+        size = ((header[6] & 0x7F) << 21 | (header[7] & 0x7F) << 14
+                | (header[8] & 0x7F) << 7 | (header[9] & 0x7F))
+        footer = 10 if header[5] & 0x10 else 0
+        offset += 10 + size + footer
+
+
+def _find_first_frame(data: bytes) -> Tuple[int, _FrameHeader]:
+    """
+    Find the first frame that starts a run of consistent frame headers.
+
+    Raises:
+        ValueError: If no MPEG frame is found in the data
+    """
+    offset = data.find(b'\xff')
+    while offset != -1:
+        header = _parse_frame_header(data, offset)
+        if header is not None and _frames_follow(data, offset, header):
+            return offset, header
+        offset = data.find(b'\xff', offset + 1)
+    raise ValueError("No MPEG audio frame found")
+
+
+def _frames_follow(data: bytes, offset: int, header: _FrameHeader) -> bool:
+    """
+    Check that the next frames line up behind a candidate header.
+
+    A stray 0xFF in padding or tag data decodes as a header now and then,
+    but the frames after it will not line up with the same stream layout.
+    """
+    for _ in range(_SYNC_FRAMES - 1):
+        offset += header.length
+        if offset + 4 > len(data):
+            # Cut off by the end of the window, nothing contradicts it
+            return True
+        following = _parse_frame_header(data, offset)
+        if (following is None or following.sample_rate != header.sample_rate
+                or following.layer != header.layer):
+            return False
+        header = following
+    return True
+
+
+def _read_xing(frame: bytes, header: _FrameHeader) -> Optional[Tuple[int, int]]:
+    """
+    Read the frame count of a Xing/Info header, minus LAME encoder padding.
+
+    Returns:
+        Tuple of (frames, samples to trim), or None without a frame count
+    """
+    if header.mpeg1:
+        side_info = 17 if header.channels == 1 else 32
+    else:
+        side_info = 9 if header.channels == 1 else 17
+    offset = 4 + side_info
+    if frame[offset:offset + 4] not in (b'Xing', b'Info') or len(frame) < offset + 8:
+        return None
+
+    flags = struct.unpack_from('>I', frame, offset + 4)[0]
+    if not flags & 0x01 or len(frame) < offset + 12:
+        return None
+    frames = struct.unpack_from('>I', frame, offset + 8)[0]
+
+    # Skip the optional byte count, seek table and quality fields to reach
+    # the LAME extension with the encoder delay and padding
+    lame = offset + 12
+    if flags & 0x02:
+        lame += 4
+    if flags & 0x04:
+        lame += 100
+    if flags & 0x08:
+        lame += 4
+
+    trim = 0
+    if frame[lame:lame + 4] in (b'LAME', b'Lavf', b'Lavc') and len(frame) >= lame + 24:
+        packed = frame[lame + 21:lame + 24]
+        delay = (packed[0] << 4) | (packed[1] >> 4)
+        padding = ((packed[1] & 0x0F) << 8) | packed[2]
+        trim = delay + padding
+
+    return frames, trim
+
+
+def _read_vbri(frame: bytes) -> Optional[int]:
+    """Read the frame count of a Fraunhofer VBRI header, if present."""
+    offset = 4 + 32
+    if frame[offset:offset + 4] != b'VBRI' or len(frame) < offset + 18:
+        return None
+    return struct.unpack_from('>I', frame, offset + 14)[0]
+
+
+def _audio_end(file: BinaryIO, file_size: int) -> int:
+    """Get the offset where MPEG audio ends, before ID3v1/APE trailers."""
+    end = file_size
+    if end >= 128:
+        file.seek(end - 128)
+        if file.read(3) == b'TAG':
+            end -= 128
+    if end >= 32:
+        file.seek(end - 32)
+        footer = file.read(32)
+        if footer[:8] == b'APETAGEX':
+            # Size covers the items and footer; a header adds 32 more bytes
+            size, flags = struct.unpack_from('<II', footer, 12)
+            end -= size + (32 if flags & 0x80000000 else 0)
+    return end
+
+
+def _scan_frames(file: BinaryIO, offset: int, end: int) -> int:
+    """
+    Walk every frame header from offset to end without reading payloads.
+
+    Returns:
+        Total number of samples in the frames
+    """
+    samples = 0
+    while offset + 4 <= end:
+        file.seek(offset)
+        header = _parse_frame_header(file.read(4), 0)
+        if header is None:
+            break
+        samples += header.samples
+        offset += header.length
+    return samples
+
+
+def probe_mp3(file: BinaryIO) -> AudioInfo:
+    """
+    Read an MP3's duration from its headers.
+
+    Uses the Xing/Info or VBRI header when the encoder wrote one, the file
+    size for constant bitrate streams, and only walks every frame header as
+    a last resort for VBR files without a header.
+
+    Args:
+        file: Seekable binary file
+
+    Returns:
+        AudioInfo of the stream
+
+    Raises:
+        ValueError: If the file contains no MPEG audio frames
+    """
+    file_size = file.seek(0, 2)
+    start = _skip_id3v2(file)
+    file.seek(start)
+    data = file.read(_PROBE_READ)
+
+    # Junk before the first frame or a frame cut off by the first read
+    # needs the wider window
+    try:
+        frame_offset, header = _find_first_frame(data)
+    except ValueError:
+        frame_offset, header = None, None
+    if header is None or frame_offset + header.length > len(data):
+        data += file.read(_SYNC_WINDOW - len(data))
+        frame_offset, header = _find_first_frame(data)
+    frame = data[frame_offset:frame_offset + header.length]
+    audio_start = start + frame_offset
+    audio_end = _audio_end(file, file_size)
+
+    def info(samples: int, method: str) -> AudioInfo:
+        duration = max(0, samples) / header.sample_rate
+        audio_bytes = audio_end - audio_start
+        bitrate = int(audio_bytes * 8 / duration) if duration else header.bitrate
+        return AudioInfo(duration=duration, sample_rate=header.sample_rate,
+                         channels=header.channels, bitrate=bitrate, method=method)
+
+    if header.layer == 3:
+        xing = _read_xing(frame, header)
+        if xing is not None:
+            frames, trim = xing
+            return info(frames * header.samples - trim, 'xing')
+        vbri_frames = _read_vbri(frame)
+        if vbri_frames is not None:
+            return info(vbri_frames * header.samples, 'vbri')
+
+    # Constant bitrate if the first frames all share the bitrate
+    offset = frame_offset
+    for _ in range(_CBR_CHECK_FRAMES):
+        following = _parse_frame_header(data, offset)
+        if following is None:
+            break
+        if following.bitrate != header.bitrate:
+            return info(_scan_frames(file, audio_start, audio_end), 'scan')
+        offset += following.length
+
+    # Padding slots make the average frame length exact, so the audio size
+    # divides into a whole number of frames
+    frames = round((audio_end - audio_start) * 8 * header.sample_rate
+                   / (header.bitrate * header.samples))
+    return AudioInfo(duration=frames * header.samples / header.sample_rate,
+                     sample_rate=header.sample_rate, channels=header.channels,
+                     bitrate=header.bitrate, method='cbr')
+
+
+def _read_header(file: BinaryIO, size: int) -> bytes:
+    """Read size bytes of a WAV header, raising ValueError if the file ends first."""
+    data = file.read(size)
+    if len(data) < size:
+        raise ValueError("truncated WAV header")
+    return data
+
+
+def read_wav_layout(file: BinaryIO) -> WavLayout:
+    """
+    Locate a WAV file's sample data by walking its RIFF chunks.
+
+    Args:
+        file: Seekable binary file
+
+    Returns:
+        WavLayout of the sample data
+
+    Raises:
+        ValueError: If the file is not RIFF/RF64 WAVE, lacks fmt/data chunks
+            or ends inside a chunk header
+    """
+    file_size = file.seek(0, 2)
+    file.seek(0)
+    riff = file.read(12)
+    if len(riff) < 12 or riff[:4] not in (b'RIFF', b'RF64') or riff[8:12] != b'WAVE':
+        raise ValueError("Not a RIFF WAVE file")
+
+    offset = 12
+    fmt = None
+    data_size_64 = None
+    while offset + 8 <= file_size:
+        file.seek(offset)
+        chunk_id, chunk_size = struct.unpack('<4sI', _read_header(file, 8))
+        body = offset + 8
+
+        if chunk_id == b'fmt ':
+            if chunk_size < 16:
+                raise ValueError("truncated WAV header")
+            fmt = struct.unpack('<HHIIHH', _read_header(file, 16))
+            if fmt[0] == _WAVE_FORMAT_EXTENSIBLE and chunk_size >= 26:
+                # The real format tag opens the sub-format GUID
+                extension = file.read(10)
+                if len(extension) == 10:
+                    fmt = (struct.unpack_from('<H', extension, 8)[0],) + fmt[1:]
+        elif chunk_id == b'ds64':
+            # RF64 keeps the real sizes here, the 32-bit fields hold 0xFFFFFFFF
+            data_size_64 = struct.unpack('<QQ', _read_header(file, 16))[1]
+        elif chunk_id == b'data':
+            if fmt is None:
+                break
+            format_tag, channels, sample_rate, byte_rate, block_align, bits = fmt
+            if not byte_rate:
+                raise ValueError("WAVE byte rate is zero")
+            data_size = data_size_64 if data_size_64 is not None else chunk_size
+            # Streamed or truncated files understate or overstate the size
+            data_size = min(data_size, file_size - body)
+            return WavLayout(format_tag=format_tag, channels=channels,
+                             sample_rate=sample_rate, byte_rate=byte_rate,
+                             block_align=block_align, bits_per_sample=bits,
+                             data_offset=body, data_size=data_size)
+
+        # Chunks are padded to an even size
+        offset = body + chunk_size + (chunk_size & 1)
+
+    raise ValueError("WAVE file has no fmt and data chunks")
+
+
+def probe_wav(file: BinaryIO) -> AudioInfo:
+    """
+    Read a WAV file's duration from its RIFF chunks.
+
+    Args:
+        file: Seekable binary file
+
+    Returns:
+        AudioInfo of the stream
+
+    Raises:
+        ValueError: If the file is not RIFF/RF64 WAVE or lacks fmt/data chunks
+    """
+    layout = read_wav_layout(file)
+    return AudioInfo(duration=layout.data_size / layout.byte_rate,
+                     sample_rate=layout.sample_rate, channels=layout.channels,
+                     bitrate=layout.byte_rate * 8, method='riff')
+
+
+def probe(file_path: str) -> AudioInfo:
+    """
+    Read the stream properties of an MP3 or WAV file.
+
+    Args:
+        file_path: Path to the audio file
+
+    Returns:
+        AudioInfo of the stream
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the format is unsupported or the headers are invalid
+    """
+    suffix = Path(file_path).suffix.lower()
+    with open(file_path, 'rb') as file:
+        if suffix == '.wav':
+            return probe_wav(file)
+        if suffix == '.mp3':
+            return probe_mp3(file)
+    raise ValueError(f"Unsupported audio format '{suffix}'")
+
+
+def probe_duration(file_path: str) -> float:
+    """
+    Get the duration of an audio file in seconds.
+
+    Args:
+        file_path: Path to the audio file
+
+    Returns:
+        Duration in seconds, or 0.0 if unable to determine
+    """
+    try:
+        return probe(file_path).duration
+    except (OSError, ValueError):
+        return 0.0
@@ -0,0 +1,297 @@
+"""
+Compact Lyrics Module for Verse Music Player
+Array-backed storage for parsed lyric timelines.
+"""
+
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Iterable, List
+import struct
+import sys
+
+# Binary layout: header, then the array columns, then the string table
+_HEADER = struct.Struct('<4sHxxIII')
+_MAGIC = b'VLYR'
+_FORMAT_VERSION = 1
+
+
+class CompactLyrics(Sequence):
+    """
+    Column-oriented storage for a parsed lyric timeline.
+
+    Timestamps and offsets live in ``array('d')``/``array('i')`` columns and
+    every piece of text is an index into one interned string table, so a
+    song costs a handful of arrays instead of one object per line and word.
+    Indexing returns LyricLineView objects that behave like LyricLine.
+    """
+
+    def __init__(self):
+        """Initialize an empty timeline."""
+        self.line_times = array('d')    # Line timestamps in seconds
+        self.line_texts = array('i')    # String table index of each line
+        self.word_offsets = array('i', [0])  # Words of line i: [i]..[i + 1]
+        self.word_times = array('d')    # Word timestamps in seconds
+        self.word_texts = array('i')    # String table index of each word
+        self.strings: List[str] = []    # Interned string table
+        self._string_ids: Dict[str, int] = {}
+
+    @classmethod
+    def from_lines(cls, lines: Iterable) -> 'CompactLyrics':
+        """
+        Build a compact timeline from LyricLine objects.
+
+        Args:
+            lines: Lyric lines with their generated word timing
+
+        Returns:
+            CompactLyrics holding the same timeline
+        """
+        # Imported here, lyrics_parser imports this module
+        from src.lyrics_parser import timed_words
+
+        lyrics = cls()
+        for line in lines:
+            lyrics.append_line(line.timestamp, line.text, timed_words(line))
+        lyrics.freeze()
+        return lyrics
+
+    def _intern(self, text: str) -> int:
+        """Get the string table index of a text, adding it if needed."""
+        string_id = self._string_ids.get(text)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.strings.append(sys.intern(text))
+            self._string_ids[text] = string_id
+        return string_id
+
+    def append_line(self, timestamp: float, text: str, words: list) -> None:
+        """
+        Append a line to the timeline.
+
+        Args:
+            timestamp: Line timestamp in seconds
+            text: Full line text
+            words: List of (timestamp, text) tuples for the line's words
+        """
+        self.line_times.append(timestamp)
+        self.line_texts.append(self._intern(text))
+        for word_time, word_text in words:
+            self.word_times.append(word_time)
+            self.word_texts.append(self._intern(word_text))
+        self.word_offsets.append(len(self.word_times))
+
+    def freeze(self) -> None:
+        """Drop the lookup table only needed while appending lines."""
+        self._string_ids = {}
+
+    def with_word_times(self, word_times: array) -> 'CompactLyrics':
+        """
+        Get a copy of the timeline with different word timestamps.
+
+        The copy shares every other column and the string table.
+
+        Args:
+            word_times: New timestamp of each word, in timeline order
+
+        Returns:
+            CompactLyrics with the new word timing
+
+        Raises:
+            ValueError: If the number of timestamps does not match the words
+        """
+        if len(word_times) != len(self.word_times):
+            raise ValueError("Word timestamps do not match the timeline's words")
+        lyrics = CompactLyrics()
+        lyrics.line_times = self.line_times
+        lyrics.line_texts = self.line_texts
+        lyrics.word_offsets = self.word_offsets
+        lyrics.word_times = array('d', word_times)
+        lyrics.word_texts = self.word_texts
+        lyrics.strings = self.strings
+        return lyrics
+
+    def to_lines(self) -> list:
+        """
+        Materialize the timeline as LyricLine/LyricWord objects.
+
+        Returns:
+            List of LyricLine objects with their word timing
+        """
+        # Imported here, lyrics_parser imports this module
+        from src.lyrics_parser import LyricLine, LyricWord
+
+        strings = self.strings
+        lines = []
+        for i in range(len(self)):
+            start = self.word_offsets[i]
+            end = self.word_offsets[i + 1]
+            lines.append(LyricLine(
+                timestamp=self.line_times[i],
+                text=strings[self.line_texts[i]],
+                words=[LyricWord(timestamp=self.word_times[j],
+                                 text=strings[self.word_texts[j]],
+                                 line_index=i)
+                       for j in range(start, end)]
+            ))
+        return lines
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the timeline into a compact binary blob.
+
+        Returns:
+            Little-endian encoding of the columns and string table
+        """
+        encoded = [text.encode('utf-8') for text in self.strings]
+        string_lengths = array('i', (len(data) for data in encoded))
+
+        columns = [self.line_times, self.line_texts, self.word_offsets,
+                   self.word_times, self.word_texts, string_lengths]
+        if sys.byteorder != 'little':
+            columns = [array(column.typecode, column) for column in columns]
+            for column in columns:
+                column.byteswap()
+
+        header = _HEADER.pack(_MAGIC, _FORMAT_VERSION, len(self),
+                              len(self.word_times), len(self.strings))
+        return b''.join([header] + [column.tobytes() for column in columns] + encoded)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'CompactLyrics':
+        """
+        Deserialize a timeline produced by to_bytes.
+
+        Args:
+            data: Serialized timeline
+
+        Returns:
+            CompactLyrics holding the stored timeline
+
+        Raises:
+            ValueError: If the data is truncated or not a serialized timeline
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Serialized lyrics are truncated")
+        magic, version, line_count, word_count, string_count = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError("Unsupported serialized lyrics format")
+
+        lyrics = cls()
+        offset = _HEADER.size
+        columns = []
+        for typecode, count in (('d', line_count), ('i', line_count),
+                                ('i', line_count + 1), ('d', word_count),
+                                ('i', word_count), ('i', string_count)):
+            column = array(typecode)
+            size = column.itemsize * count
+            if offset + size > len(data):
+                raise ValueError("Serialized lyrics are truncated")
+            column.frombytes(data[offset:offset + size])
+            if sys.byteorder != 'little':
+                column.byteswap()
+            columns.append(column)
+            offset += size
+
+        (lyrics.line_times, lyrics.line_texts, lyrics.word_offsets,
+         lyrics.word_times, lyrics.word_texts, string_lengths) = columns
+
+        for length in string_lengths:
+            if offset + length > len(data):
+                raise ValueError("Serialized lyrics are truncated")
+            lyrics.strings.append(sys.intern(
+                data[offset:offset + length].decode('utf-8')))
+            offset += length
+
+        return lyrics
+
+    def __len__(self) -> int:
+        return len(self.line_times)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [LyricLineView(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("lyric line index out of range")
+        return LyricLineView(self, index)
+
+    def __repr__(self) -> str:
+        return f"CompactLyrics(lines={len(self)}, words={len(self.word_times)})"
+
+
+class LyricLineView:
+    """Read-only view of one line of a CompactLyrics timeline."""
+
+    __slots__ = ('_lyrics', '_index')
+
+    def __init__(self, lyrics: CompactLyrics, index: int):
+        self._lyrics = lyrics
+        self._index = index
+
+    @property
+    def timestamp(self) -> float:
+        """Time in seconds."""
+        return self._lyrics.line_times[self._index]
+
+    @property
+    def text(self) -> str:
+        """Lyric text."""
+        return self._lyrics.strings[self._lyrics.line_texts[self._index]]
+
+    @property
+    def words(self) -> 'LyricWordsView':
+        """Word-level timing of the line."""
+        return LyricWordsView(self._lyrics, self._index)
+
+    def __repr__(self) -> str:
+        return f"LyricLineView(timestamp={self.timestamp!r}, text={self.text!r})"
+
+
+class LyricWordsView(Sequence):
+    """Read-only sequence of the words of one compact line."""
+
+    __slots__ = ('_lyrics', '_start', '_end', '_line_index')
+
+    def __init__(self, lyrics: CompactLyrics, line_index: int):
+        self._lyrics = lyrics
+        self._start = lyrics.word_offsets[line_index]
+        self._end = lyrics.word_offsets[line_index + 1]
+        self._line_index = line_index
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [LyricWordView(self._lyrics, self._start + i, self._line_index)
+                    for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("lyric word index out of range")
+        return LyricWordView(self._lyrics, self._start + index, self._line_index)
+
+
+class LyricWordView:
+    """Read-only view of one word of a CompactLyrics timeline."""
+
+    __slots__ = ('_lyrics', '_index', 'line_index')
+
+    def __init__(self, lyrics: CompactLyrics, index: int, line_index: int):
+        self._lyrics = lyrics
+        self._index = index
+        self.line_index = line_index
+
+    @property
+    def timestamp(self) -> float:
+        """Time in seconds when word should appear."""
+        return self._lyrics.word_times[self._index]
+
+    @property
+    def text(self) -> str:
+        """Word text."""
+        return self._lyrics.strings[self._lyrics.word_texts[self._index]]
+
+    def __repr__(self) -> str:
+        return f"LyricWordView(timestamp={self.timestamp!r}, text={self.text!r}, line_index={self.line_index!r})"
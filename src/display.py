@@ -3,22 +3,82 @@ Display Module for Verse Music Player
 Handles terminal rendering and lyric display using rich library.
 """
 
+from dataclasses import dataclass
+from rich.cells import cell_len, chop_cells
+from rich.color import ColorSystem
 from rich.console import Console
+from rich.style import Style
 from rich.text import Text
 from rich.align import Align
 from rich.panel import Panel
-from typing import Optional, List, Tuple
+from typing import Callable, Dict, Optional, List, Tuple
+import re
+import threading
+import time
+
+from src.layout import LayoutCache
+from src.terminal import FrameStats, FrameWriter
+
+# Progress bar: time (5 chars) + space (1) + bar (20) + space (1) = 27 chars
+PROGRESS_BAR_WIDTH = 27
+PROGRESS_BAR_CELLS = 20
+PROGRESS_BAR_COLUMN = 7  # Terminal column of the first bar cell
+
+# Style of the spectrum strip above the progress bar (see src/visualizer.py)
+LEVELS_STYLE = "dim cyan"
+
+# Fade styles for the visible words, from the newest word to the oldest
+FADE_STYLES = ("bold cyan", "cyan", "bright_cyan", "dim cyan")
+
+# Cursor moves that start the lyric rows: on a cleared screen, leaving an
+# empty row at the top, or in place, up over the rows of the previous line
+CONTEXT_FRESH = "\033[2J\033[H\r\n"
+CONTEXT_START = re.compile(r"\033\[2J\033\[H\r\n|\033\[\d*F")
+
+# Console color system names mapped to Rich color systems
+_COLOR_SYSTEMS = {
+    "standard": ColorSystem.STANDARD,
+    "256": ColorSystem.EIGHT_BIT,
+    "truecolor": ColorSystem.TRUECOLOR,
+    "windows": ColorSystem.WINDOWS,
+}
+
+
+@dataclass
+class _LineTemplate:
+    """Pre-styled current lyric line, built once per line."""
+    words: List[str]                     # Words of the line
+    places: List[List[Tuple[int, int]]]  # (row, column) of each piece of each word
+    styled: List[List[List[str]]]        # ANSI text of each word's pieces in every fade style
+    rows: int                            # Terminal rows the line wraps to
+
+
+def _cursor_up(rows: int) -> str:
+    """Escape sequence moving to the start of a row further up."""
+    return "\033[F" if rows == 1 else f"\033[{rows}F"
+
+
+def _cursor_down(rows: int) -> str:
+    """Escape sequence moving to the start of a row further down."""
+    return "\033[E" if rows == 1 else f"\033[{rows}E"
 
 
 class LyricDisplay:
     """Terminal display component for rendering synchronized lyrics."""
 
-    def __init__(self, console: Optional[Console] = None):
+    def __init__(
+        self,
+        console: Optional[Console] = None,
+        max_fps: Optional[float] = None,
+        clock: Callable[[], float] = time.perf_counter
+    ):
         """
         Initialize the lyric display.
 
         Args:
             console: Rich console instance, creates new one if None
+            max_fps: Optional cap on lyric frames written per second
+            clock: Monotonic clock in seconds used by the frame-rate cap
         """
         # Configure rich console settings for optimal terminal rendering
         if console is None:
@@ -36,6 +96,79 @@ class LyricDisplay:
         self.last_displayed: Optional[str] = None
         self.song_duration: float = 0.0  # Total song duration in seconds
 
+        # Every update is composed into one buffered write per frame
+        self.frames = FrameWriter(self.console.file, max_fps=max_fps, clock=clock)
+
+        # Line layouts for the terminal width, measured again only after a
+        # resize; the real terminal reports resizes with SIGWINCH
+        self.layout = LayoutCache(self.console.width or 120, PROGRESS_BAR_WIDTH)
+        self._resize_pending: bool = False
+        self._layout_generation: int = 0
+        if console is None:
+            self._watch_resize()
+
+        # Incremental rendering state, reset whenever the screen is cleared
+        self._color_system = _COLOR_SYSTEMS.get(self.console.color_system)
+        self._style_cache: Dict[str, Style] = {}
+        self._template: Optional[_LineTemplate] = None
+        self._block_rows: int = 0   # Lyric rows on screen, cursor on the last
+        self._next_rows: int = 1    # Rows of the next-line context
+        self._bar_rows: int = 1     # Rows from the last row up to the progress bar
+        self._drawn_words: int = 0
+        self._drawn_time: Optional[str] = None
+        self._drawn_filled: Optional[int] = None
+
+        # The lyric rows were last drawn from a frame table, so they are on
+        # screen but the incremental state above does not describe them
+        self._prerendered: bool = False
+
+    def _watch_resize(self) -> None:
+        """Invalidate the layouts when the terminal reports a resize."""
+        import signal
+
+        if (not hasattr(signal, 'SIGWINCH')
+                or threading.current_thread() is not threading.main_thread()):
+            return
+        previous = signal.getsignal(signal.SIGWINCH)
+
+        def on_resize(signum, frame):
+            self.invalidate_layout()
+            if callable(previous):
+                previous(signum, frame)
+
+        try:
+            signal.signal(signal.SIGWINCH, on_resize)
+        except (OSError, ValueError):
+            pass
+
+    def invalidate_layout(self) -> None:
+        """Measure the terminal again before the next frame."""
+        # Only a flag: the handler may run in the middle of a frame
+        self._resize_pending = True
+
+    def _check_resize(self) -> None:
+        """Apply a pending resize: new layouts and a redraw from scratch."""
+        if not self._resize_pending:
+            return
+        self._resize_pending = False
+        if self.layout.resize(self.console.width or 120):
+            self._layout_generation += 1
+            # The terminal reflowed the old rows; start over on a cleared screen
+            self._template = None
+            self._prerendered = False
+
+    @property
+    def terminal_width(self) -> int:
+        """Terminal width in columns, as of the last resize."""
+        self._check_resize()
+        return self.layout.width
+
+    @property
+    def layout_generation(self) -> int:
+        """Counter that goes up whenever a resize changed the width."""
+        self._check_resize()
+        return self._layout_generation
+
     def _format_time(self, seconds: float) -> str:
         """
         Format time in seconds to MM:SS format.
@@ -50,38 +183,179 @@ class LyricDisplay:
         secs = int(seconds % 60)
         return f"{minutes:02d}:{secs:02d}"
 
-    def _create_progress_bar(self, current: float, total: float, width: int = 20) -> Text:
+    def _ansi(self, text: str, style: str) -> str:
+        """
+        Render text with a Rich style to an ANSI string for this console.
+
+        Args:
+            text: Text to render
+            style: Rich style definition, e.g. "bold cyan"
+
+        Returns:
+            Text wrapped in the console's escape codes (plain without color)
+        """
+        if self._color_system is None:
+            return text
+        parsed = self._style_cache.get(style)
+        if parsed is None:
+            parsed = self._style_cache[style] = Style.parse(style)
+        return parsed.render(text, color_system=self._color_system)
+
+    def _build_template(self, line_text: str) -> _LineTemplate:
+        """
+        Pre-style every word of a lyric line in all fade levels.
+
+        Args:
+            line_text: Full text of the line
+
+        Returns:
+            Template with word places and styled words
+        """
+        # Lay out the full line right of the progress bar, so words appear
+        # in place instead of the line re-centering each tick
+        layout = self.layout.get(line_text)
+
+        places = []
+        styled = []
+        for pieces in layout.words:
+            places.append([(row, column) for row, column, _ in pieces])
+            styled.append([[self._ansi(piece, fade) for _, _, piece in pieces]
+                           for fade in FADE_STYLES])
+
+        return _LineTemplate(words=line_text.split(), places=places, styled=styled,
+                             rows=layout.row_count)
+
+    def _render_progress(self, current: float, total: float) -> str:
         """
-        Create a compact visual progress bar with time display for left side.
+        Render the changed cells of the progress bar on the current row.
 
         Args:
             current: Current playback position in seconds
             total: Total duration in seconds
-            width: Width of the progress bar in characters
 
         Returns:
-            Rich Text object with the progress bar
+            Escape sequence updating only the cells that changed
         """
         if total <= 0:
             percentage = 0
         else:
             percentage = min(100, (current / total) * 100)
+        filled_width = int((percentage / 100) * PROGRESS_BAR_CELLS)
+        time_text = self._format_time(current)
+
+        parts = []
+        if time_text != self._drawn_time:
+            parts.append("\033[1G" + self._ansi(time_text, "bold cyan"))
+            self._drawn_time = time_text
+
+        drawn_filled = self._drawn_filled
+        if drawn_filled is None:
+            # Nothing drawn yet, draw the whole bar
+            parts.append(
+                f"\033[{PROGRESS_BAR_COLUMN}G"
+                + self._ansi("▓" * filled_width, "bold magenta")
+                + self._ansi("░" * (PROGRESS_BAR_CELLS - filled_width), "dim white"))
+        elif filled_width > drawn_filled:
+            parts.append(
+                f"\033[{PROGRESS_BAR_COLUMN + drawn_filled}G"
+                + self._ansi("▓" * (filled_width - drawn_filled), "bold magenta"))
+        elif filled_width < drawn_filled:
+            parts.append(
+                f"\033[{PROGRESS_BAR_COLUMN + filled_width}G"
+                + self._ansi("░" * (drawn_filled - filled_width), "dim white"))
+        self._drawn_filled = filled_width
+
+        return ''.join(parts)
+
+    def _render_words(self, word_count: int) -> Tuple[str, int]:
+        """
+        Render the words whose fade level changed on the current line's rows.
 
-        filled_width = int((percentage / 100) * width)
-        empty_width = width - filled_width
+        The newest word is brightest and the three before it fade out, so a
+        tick only restyles the last few words and draws the new ones.
 
-        # Create compact progress bar
-        progress_text = Text()
-        progress_text.append(self._format_time(current), style="bold cyan")
-        progress_text.append(" ", style="dim white")
+        Args:
+            word_count: Number of visible words of the current line
 
-        # Progress bar with filled portion in magenta and empty in gray
-        # Using different characters that render better in terminals
-        progress_text.append("▓" * filled_width, style="bold magenta")
-        progress_text.append("░" * empty_width, style="dim white")
-        progress_text.append(" ", style="dim white")
+        Returns:
+            Escape sequence updating only the words that changed, starting
+            on the line's first row, and the row of the line it ends on
+        """
+        template = self._template
+        drawn_count = self._drawn_words
+        parts = []
+        row = 0
+
+        def move(to_row: int, column: int) -> None:
+            nonlocal row
+            if to_row > row:
+                parts.append(f"\033[{to_row - row}B")
+            elif to_row < row:
+                parts.append(f"\033[{row - to_row}A")
+            row = to_row
+            parts.append(f"\033[{column}G")
+
+        if word_count < drawn_count:
+            # Moved backwards, erase the words that are no longer visible
+            first_row, column = template.places[word_count][0]
+            move(first_row, column)
+            parts.append("\033[K")
+            for below in range(first_row + 1, template.rows):
+                move(below, 1)
+                parts.append("\033[2K")
+
+        last_fade = len(FADE_STYLES) - 1
+        for i in range(max(0, min(drawn_count, word_count) - last_fade), word_count):
+            pieces = template.styled[i][min(word_count - 1 - i, last_fade)]
+            for (piece_row, column), piece in zip(template.places[i], pieces):
+                move(piece_row, column)
+                parts.append(piece)
+
+        self._drawn_words = word_count
+        return ''.join(parts), row
+
+    def _context_start(self) -> str:
+        """Cursor move to the first lyric row, for drawing a new line."""
+        if self._template is None and not self._prerendered:
+            # Clear the screen and leave an empty row at the top
+            return CONTEXT_FRESH
+        # Cursor is on the last row, go back up to the first previous-line row
+        return _cursor_up(self._block_rows - 1)
+
+    def _render_context(self, start: str, previous_text: Optional[str],
+                        next_text: Optional[str], current_rows: int) -> str:
+        """
+        Render the previous, current (empty) and next rows for a new line.
 
-        return progress_text
+        On the first frame the screen is cleared; afterwards the rows are
+        rewritten in place. Either way the cursor ends on the last row of
+        the next line.
+
+        Args:
+            start: Cursor move to the first row, from _context_start()
+            previous_text: The previous lyric line (dimmed)
+            next_text: The next lyric line (dimmed)
+            current_rows: Rows the current line wraps to
+
+        Returns:
+            Escape sequence drawing the context rows
+        """
+        def context_rows(text: Optional[str]) -> List[str]:
+            if not text:
+                return ["\033[2K"]
+            # Indented by the progress bar width, then centered
+            return ["\033[2K" + " " * (column - 1) + self._ansi(row_text, "dim white")
+                    for column, row_text in self.layout.get(text).rows]
+
+        next_rows = context_rows(next_text)
+        rows = context_rows(previous_text) + ["\033[2K"] * (current_rows + 1) + next_rows
+
+        # Erase what is left below when the new line takes fewer rows
+        end = "\033[J\r" if start != CONTEXT_FRESH and len(rows) < self._block_rows else "\r"
+
+        self._block_rows = len(rows)
+        self._next_rows = len(next_rows)
+        return start + "\r\n".join(rows) + end
 
     def show_lyric_with_context(
         self,
@@ -89,123 +363,142 @@ class LyricDisplay:
         previous_text: Optional[str] = None,
         next_text: Optional[str] = None,
         current_time: float = 0.0,
-        clear_screen: bool = False
+        clear_screen: bool = False,
+        line_text: Optional[str] = None,
+        word_count: Optional[int] = None
     ) -> None:
         """
         Display current lyric with context (previous and next lines) and progress bar on the left.
         Words appear one at a time on the same line (karaoke style).
 
+        The context rows and the styled words of the line are built once per
+        line; every other call only writes the progress bar cells and words
+        that changed since the last frame.
+
         Args:
             current_text: The current lyric text to display
             previous_text: The previous lyric line (dimmed)
             next_text: The next lyric line (dimmed)
             current_time: Current playback position in seconds
-            clear_screen: If True, clear the entire screen and redraw everything (new line)
+            clear_screen: If True, start a new line and redraw the context rows
+            line_text: Full text of the current line, defaults to current_text
+            word_count: Number of visible words, counted from current_text if None
         """
         if not current_text:
             return
 
-        # If starting a new line, clear screen and draw context
-        if clear_screen:
-            self.console.clear()
-
-            # Print some spacing at top
-            self.console.print()
-
-            # Print previous lyric (dimmed) - no progress bar
-            if previous_text:
-                prev_text = Text()
-                # Spacing for alignment
-                prev_text.append("                           ")
-                prev_text.append(previous_text, style="dim white")
-                self.console.print(Align.center(prev_text))
-                self.console.print()
-            else:
-                self.console.print()
-
-            # Print placeholder for current line (will be updated)
-            self.console.print()
-
-            # Print next lyric (dimmed) - no progress bar
-            if next_text:
-                next_styled = Text()
-                # Spacing for alignment
-                next_styled.append("                           ")
-                next_styled.append(next_text, style="dim white")
-                self.console.print(Align.center(next_styled))
-            else:
-                self.console.print()
-
-            # Move cursor back up to the current line position
-            # We need to go up: 1 (next lyric or empty) + 1 (current line)
-            self.console.file.write("\033[2F")
-            self.console.file.flush()
-
-        # If not a new line, just move cursor up to overwrite current line
-        elif self.last_displayed:
-            # Move cursor up one line and clear it
-            self.console.file.write("\033[F\033[K")
-            self.console.file.flush()
-
-        # Get progress bar for left side (fixed position)
-        progress_bar = self._create_progress_bar(
-            current_time, self.song_duration)
-
-        # Create styled current lyric with fading gradient (centered)
-        current_styled = Text()
-        words = current_text.split()
-
-        # Create fading gradient: newest word is brightest, older words fade
-        # Using cyan as the base color with fading intensity
-        num_words = len(words)
-        for i, word in enumerate(words):
-            # Calculate fade level - most recent word (last) is brightest
-            # Earlier words get progressively dimmer
-            if num_words <= 1:
-                # Single word - make it bright
-                color = "bold cyan"
-            elif i == num_words - 1:
-                # Last word (most recent) - brightest
-                color = "bold cyan"
-            elif i == num_words - 2:
-                # Second to last - bright but not bold
-                color = "cyan"
-            elif i == num_words - 3:
-                # Third to last - dimmer
-                color = "bright_cyan"
-            else:
-                # Older words - dimmest
-                color = "dim cyan"
-
-            current_styled.append(word, style=color)
-            if i < len(words) - 1:
-                current_styled.append(" ")
+        if word_count is None:
+            word_count = len(current_text.split())
+
+        self._check_resize()
+        parts = []
+
+        # New line: pre-style the line once and draw the context rows around
+        # it; text that outgrew the template (caller passed no line_text)
+        # may wrap differently, so it starts over the same way
+        if (clear_screen or self._template is None
+                or word_count > len(self._template.words)):
+            start = self._context_start()
+            self._template = self._build_template(line_text or current_text)
+            parts.append(self._render_context(start, previous_text, next_text,
+                                              self._template.rows))
+            self._drawn_words = 0
+            self._drawn_time = None
+            self._drawn_filled = None
+            self._prerendered = False
+
+        # Move up to the current line, update the changed cells, move back down
+        self._bar_rows = self._next_rows + self._template.rows - 1
+        parts.append(_cursor_up(self._bar_rows))
+        parts.append(self._render_progress(current_time, self.song_duration))
+        words, row = self._render_words(word_count)
+        parts.append(words)
+        parts.append(_cursor_down(self._template.rows - row - 1 + self._next_rows))
+
+        self.frames.write(''.join(parts))
+        self.frames.commit(force=clear_screen)
 
-        # Create the full line with progress bar on left and centered lyrics
-        # Progress bar: time (5 chars) + space (1) + bar (20) + space (1) = ~27 chars
-        progress_bar_width = 27
+        # Update last displayed text
+        self.last_displayed = current_text
 
-        # Get terminal width
-        terminal_width = self.console.width or 120
+    def show_prerendered(self, frames: str, new_line: bool = False, rows: int = 4,
+                         bar_rows: int = 1) -> None:
+        """
+        Write lyric frames taken from a frame table (see src/frame_table.py).
 
-        # Calculate how much space we have for centering the lyrics
-        available_width = terminal_width - progress_bar_width
-        lyric_length = len(current_text)
+        Args:
+            frames: Escape sequences of one or more consecutive frames
+            new_line: The frames start with a line's keyframe, which is
+                drawn in place of the lyric rows or on a cleared screen
+            rows: Lyric rows the keyframe draws
+            bar_rows: Rows from the keyframe's last row up to its progress bar
+        """
+        if new_line:
+            start = self._context_start()
+            if start != CONTEXT_FRESH and rows < self._block_rows:
+                # Erase the taller previous line's rows before drawing
+                start += "\033[J"
+            frames = start + frames
+            self._block_rows = rows
+            self._bar_rows = bar_rows
+        self.frames.write(frames)
+        self.frames.commit(force=new_line)
+
+        # Live rendering after this starts over with the context rows
+        self._template = None
+        self._prerendered = True
+
+    def show_levels(self, levels: str) -> None:
+        """
+        Draw the spectrum strip on the empty row above the progress bar.
 
-        # Calculate padding to center lyrics in available space
-        left_padding = max(0, (available_width - lyric_length) // 2)
+        Args:
+            levels: One block character per band, from src/visualizer.py
+        """
+        if self._template is None and not self._prerendered:
+            # No lyric rows on screen to place the strip against
+            return
+        rows = self._bar_rows + 1
+        self.frames.write(_cursor_up(rows) + f"\033[{PROGRESS_BAR_COLUMN}G"
+                          + self._ansi(levels, LEVELS_STYLE) + _cursor_down(rows))
+        self.frames.commit()
 
-        # Build the complete line
-        full_line = Text()
-        full_line.append_text(progress_bar)
-        full_line.append(" " * left_padding)
-        full_line.append_text(current_styled)
+    @property
+    def frame_stats(self) -> FrameStats:
+        """Bytes and write/flush calls spent on terminal output so far."""
+        return self.frames.stats
 
-        # Print the complete line
-        self.console.print(full_line)
+    def flush_pending(self) -> Optional[float]:
+        """
+        Write a frame held back by the frame-rate cap once it is due.
 
-        # Update last displayed text
-        self.last_displayed = current_text
+        Returns:
+            Seconds until a still-pending frame is due, or None if nothing
+            is pending
+        """
+        delay = self.frames.pending_delay()
+        if delay == 0.0:
+            self.frames.commit()
+            return None
+        return delay
+
+    def _print(self, renderable) -> None:
+        """
+        Render a Rich renderable into the current frame buffer.
+
+        Args:
+            renderable: Anything Console.print accepts
+        """
+        with self.console.capture() as capture:
+            self.console.print(renderable)
+        self.frames.write(capture.get())
+
+    def _clear_screen(self) -> None:
+        """Add a screen clear to the current frame buffer."""
+        if self.console.is_terminal and not self.console.is_dumb_terminal:
+            self.frames.write("\033[2J\033[H")
+        self._template = None
+        self._prerendered = False
 
     def show_lyric(self, text: str, clear_line: bool = False) -> None:
         """
@@ -221,9 +514,9 @@ class LyricDisplay:
 
         # If clear_line is True, clear the entire display (for new lines)
         if clear_line:
-            self.console.clear()
+            self._clear_screen()
             # Print newline to position cursor
-            self.console.print()
+            self.frames.write("\n")
 
         # Create styled text with gradient color formatting
         styled_text = Text()
@@ -245,18 +538,31 @@ class LyricDisplay:
         # This overwrites the previous line instead of creating a new one
         if not clear_line and self.last_displayed:
             # Move cursor up and clear the line
-            self.console.file.write("\033[F\033[K")
-            self.console.file.flush()
+            self.frames.write("\033[F\033[K")
 
         # Print the centered text
-        self.console.print(centered_text)
+        self._print(centered_text)
+        self.frames.commit(force=True)
 
         # Update last displayed text
         self.last_displayed = text
 
     def clear_display(self) -> None:
         """Clear the terminal display to prevent flickering."""
-        self.console.clear()
+        self._clear_screen()
+        self.frames.commit(force=True)
+
+    def show_status(self, message: Optional[str] = None) -> None:
+        """
+        Show a status message on the row below the lyrics, or clear it.
+
+        Args:
+            message: Text to show, e.g. "Paused"; None clears the row
+        """
+        row = "\033[2K" + (self._ansi(message, "bold yellow") if message else "")
+        # The cursor rests on the next-line row; step below it and back
+        self.frames.write("\r\033[E" + row + "\033[F")
+        self.frames.commit(force=True)
 
     def set_song_duration(self, duration: float) -> None:
         """
@@ -275,7 +581,7 @@ class LyricDisplay:
             song_name: Name of the song being played
             duration: Total song duration in seconds
         """
-        self.clear_display()
+        self._clear_screen()
         self.song_duration = duration
 
         # Calculate the width based on song name length
@@ -309,8 +615,38 @@ class LyricDisplay:
         # Center the header
         centered_header = Align.center(header_text)
 
-        # Print the header
-        self.console.print(centered_header)
+        # Print the header together with the screen clear
+        self._print(centered_header)
+        self.frames.commit(force=True)
+
+    def show_song_title(self, song_name: str, duration: float = 0.0) -> None:
+        """
+        Show the name of a song that started without a gap.
+
+        The name goes on the empty row above the lyric rows, which stay on
+        screen, so playback is not interrupted by a cleared screen. Before
+        any lyric rows are drawn the full header is shown instead.
+
+        Args:
+            song_name: Name of the song now playing
+            duration: Total song duration in seconds
+        """
+        self._check_resize()
+        if self._template is None and not self._prerendered:
+            self.show_song_header(song_name, duration)
+            return
+        self.song_duration = duration
+
+        title = f"♪  {song_name}  ♪"
+        width = self.layout.width
+        if cell_len(title) > width:
+            title = chop_cells(title, width)[0]
+        column = max(0, (width - cell_len(title)) // 2) + 1
+
+        # Save the cursor, rewrite the top row, and return to the lyric rows
+        self.frames.write(f"\0337\033[H\033[2K\033[{column}G"
+                          + self._ansi(title, "bold cyan") + "\0338")
+        self.frames.commit(force=True)
 
     def show_error(self, message: str) -> None:
         """
@@ -320,7 +656,7 @@ class LyricDisplay:
             message: Error message to display
         """
         # Clear display first for consistent presentation
-        self.clear_display()
+        self._clear_screen()
 
         # Create styled error text with red color
         error_text = Text(f"Error: {message}", style="bold red")
@@ -329,7 +665,8 @@ class LyricDisplay:
         centered_error = Align.center(error_text)
 
         # Print the error message
-        self.console.print(centered_error)
+        self._print(centered_error)
+        self.frames.commit(force=True)
 
         # Reset last displayed to ensure next lyric shows properly
         self.last_displayed = None
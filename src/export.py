@@ -0,0 +1,483 @@
+"""
+Export Module for Verse Music Player
+Writes lyric timelines as subtitles and renders terminal sessions as asciicasts.
+
+Usage:
+    python verse.py export <lyrics.lrc | directory | playlist.m3u>...
+        [--format srt|vtt|ass|cast]... [--output-dir DIR] [--jobs N]
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import argparse
+import contextlib
+import functools
+import io
+import json
+import os
+import time
+
+# Seconds the last line stays up when the song duration is unknown, as in
+# LyricsParser._generate_word_timing
+LAST_LINE_SECONDS = 4.0
+
+# Songs handed to a worker per task; rendering a cast takes far longer than
+# pickling a song, so small chunks keep the pool balanced
+_MAX_CHUNK = 8
+
+# ASS colours are &HAABBGGRR: sung words turn from white to cyan
+_ASS_HEADER = """[Script Info]
+Title: {title}
+ScriptType: v4.00+
+PlayResX: 1280
+PlayResY: 720
+WrapStyle: 0
+ScaledBorderAndShadow: yes
+
+[V4+ Styles]
+Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
+Style: Default,Arial,48,&H00FFFF00,&H00FFFFFF,&H00000000,&H80000000,0,0,0,0,100,100,0,0,1,2,1,2,40,40,40,1
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+"""
+
+
+@dataclass
+class Cue:
+    """One lyric line on screen, with the timing of its words."""
+    start: float    # Line timestamp in seconds
+    end: float      # When the next line replaces it, in seconds
+    text: str       # Full line text
+    words: List[Tuple[float, str]] = field(default_factory=list)  # (timestamp, text) pairs
+
+
+@dataclass
+class SongExport:
+    """One song to export and where its files go."""
+    lyrics_path: str            # LRC file
+    song_path: Optional[str]    # Audio file for the duration, None for a bare LRC file
+    output_stem: str            # Output path without the format's suffix
+
+
+def lyric_cues(lyrics, duration: Optional[float] = None) -> List[Cue]:
+    """
+    Turn a parsed timeline into the cues Verse shows on screen.
+
+    Each line is up from its timestamp until the next line's, the last one
+    until the song ends. Empty lines only end the line before them, and
+    lines replaced at the instant they start are left out, as on screen.
+
+    Args:
+        lyrics: Parsed lyric lines, as returned by LyricsParser.parse_lrc_file
+        duration: Song length in seconds, if known
+
+    Returns:
+        Cues in timeline order
+    """
+    from src.lyrics_parser import timed_words
+
+    cues = []
+    count = len(lyrics)
+    for i, line in enumerate(lyrics):
+        start = line.timestamp
+        if i + 1 < count:
+            end = lyrics[i + 1].timestamp
+        elif duration and duration > start:
+            end = duration
+        else:
+            end = start + LAST_LINE_SECONDS
+        if line.text and end > start:
+            cues.append(Cue(start=start, end=end, text=line.text, words=timed_words(line)))
+    return cues
+
+
+def _format_time(seconds: float, separator: str = '.', digits: int = 3,
+                 hour_digits: int = 2) -> str:
+    """
+    Format seconds as a subtitle timestamp.
+
+    Args:
+        seconds: Time in seconds
+        separator: Character before the fraction
+        digits: Fraction digits, 3 for milliseconds and 2 for centiseconds
+        hour_digits: Minimum digits of the hours
+
+    Returns:
+        Timestamp such as 00:01:02.345
+    """
+    scale = 10 ** digits
+    units = max(0, int(round(seconds * scale)))
+    total_seconds, fraction = divmod(units, scale)
+    minutes, secs = divmod(total_seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:0{hour_digits}d}:{minutes:02d}:{secs:02d}{separator}{fraction:0{digits}d}"
+
+
+def to_srt(cues: Sequence[Cue], title: str = '') -> str:
+    """
+    Write cues as SubRip subtitles.
+
+    SRT has no word timing, so each cue carries its full line.
+
+    Args:
+        cues: Cues from lyric_cues
+        title: Unused, SRT has no title
+
+    Returns:
+        SRT document
+    """
+    blocks = []
+    for number, cue in enumerate(cues, 1):
+        blocks.append(f"{number}\n{_format_time(cue.start, ',')} --> "
+                      f"{_format_time(cue.end, ',')}\n{cue.text}\n")
+    return '\n'.join(blocks)
+
+
+def _escape_vtt(text: str) -> str:
+    """Escape the characters WebVTT cue text reserves."""
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def to_webvtt(cues: Sequence[Cue], title: str = '') -> str:
+    """
+    Write cues as WebVTT subtitles with karaoke timestamps.
+
+    Every word after the first is preceded by an inline <hh:mm:ss.mmm>
+    timestamp, so players reveal or highlight the words as they are sung.
+
+    Args:
+        cues: Cues from lyric_cues
+        title: Written as the file's title, if given
+
+    Returns:
+        WebVTT document
+    """
+    blocks = ["WEBVTT" + (f" - {title}" if title else '') + "\n"]
+    for cue in cues:
+        start_ms = round(cue.start * 1000)
+        end_ms = round(cue.end * 1000)
+        previous_ms = start_ms
+        parts = []
+        for word_time, word in cue.words:
+            word_ms = round(word_time * 1000)
+            # Inline timestamps must fall inside the cue, in increasing order
+            if previous_ms < word_ms < end_ms and parts:
+                parts.append(f"<{_format_time(word_time)}>{_escape_vtt(word)}")
+                previous_ms = word_ms
+            else:
+                parts.append(_escape_vtt(word))
+        text = ' '.join(parts) if parts else _escape_vtt(cue.text)
+        blocks.append(f"{_format_time(cue.start)} --> {_format_time(cue.end)}\n{text}\n")
+    return '\n'.join(blocks)
+
+
+def _escape_ass(text: str) -> str:
+    """Keep braces in the text from opening ASS override blocks."""
+    return text.replace('{', '(').replace('}', ')')
+
+
+def to_ass(cues: Sequence[Cue], title: str = '') -> str:
+    """
+    Write cues as Advanced SubStation Alpha subtitles with karaoke tags.
+
+    Each word gets a {\\k} tag lasting until the next word, the last word
+    until the line ends, so players sweep the highlight along the line.
+    Durations are rounded on the centisecond grid of ASS times, so they
+    add up to the line's length exactly.
+
+    Args:
+        cues: Cues from lyric_cues
+        title: Written as the script's title
+
+    Returns:
+        ASS document
+    """
+    lines = [_ASS_HEADER.format(title=title or 'Verse')]
+    for cue in cues:
+        start_cs = round(cue.start * 100)
+        end_cs = round(cue.end * 100)
+        boundaries = []
+        previous_cs = start_cs
+        for word_time, _ in cue.words:
+            previous_cs = min(max(round(word_time * 100), previous_cs), end_cs)
+            boundaries.append(previous_cs)
+        boundaries.append(end_cs)
+
+        parts = [f"{{\\k{boundaries[index + 1] - boundaries[index]}}}{_escape_ass(word)}"
+                 for index, (_, word) in enumerate(cue.words)]
+        if parts and boundaries[0] > start_cs:
+            # Silence before the first word
+            parts[0] = f"{{\\k{boundaries[0] - start_cs}}}" + parts[0]
+        text = ' '.join(parts) if parts else _escape_ass(cue.text)
+
+        lines.append(f"Dialogue: 0,{_format_time(cue.start, digits=2, hour_digits=1)},"
+                     f"{_format_time(cue.end, digits=2, hour_digits=1)},Default,,0,0,0,,{text}\n")
+    return ''.join(lines)
+
+
+class _TimedOutput(io.StringIO):
+    """In-memory terminal that records the virtual time of every write."""
+
+    def __init__(self, clock):
+        """
+        Initialize the recorder.
+
+        Args:
+            clock: VirtualClock the simulated session runs on
+        """
+        super().__init__()
+        self.clock = clock
+        self.events: List[List] = []    # [time, text] pairs, one per instant
+
+    def write(self, text: str) -> int:
+        if text:
+            now = self.clock.now()
+            if self.events and self.events[-1][0] == now:
+                self.events[-1][1] += text
+            else:
+                self.events.append([now, text])
+        return super().write(text)
+
+
+def record_asciicast(lyrics_path: str, song_path: Optional[str] = None,
+                     width: int = 100, height: int = 24,
+                     align_words: bool = False) -> str:
+    """
+    Render a full Verse session as an asciicast v2 recording.
+
+    The session runs headless on a virtual clock (see src/simulation.py),
+    so a song renders in a fraction of its playing time. Event times are
+    virtual playback times, and the header carries no wall-clock timestamp,
+    so the same song and settings always give the same file.
+
+    Args:
+        lyrics_path: Path to the LRC file
+        song_path: Optional audio file, for the duration and the header
+        width: Terminal columns
+        height: Terminal rows
+        align_words: Move word timing onto the song's onsets (WAV only)
+
+    Returns:
+        asciicast v2 document, one JSON value per line
+    """
+    from src.simulation import VirtualClock, simulate
+
+    clock = VirtualClock()
+    output = _TimedOutput(clock)
+    simulate(lyrics_path, song_path, width=width, height=height,
+             clock=clock, output=output, align_words=align_words)
+
+    header = {"version": 2, "width": width, "height": height,
+              "title": Path(song_path or lyrics_path).stem}
+    lines = [json.dumps(header, ensure_ascii=False)]
+    lines += [json.dumps([round(moment, 6), "o", text], ensure_ascii=False)
+              for moment, text in output.events]
+    return '\n'.join(lines) + '\n'
+
+
+# Subtitle writers and file suffixes by format name
+SUBTITLE_FORMATS: Dict[str, Tuple[str, Callable[[Sequence[Cue], str], str]]] = {
+    'srt': ('.srt', to_srt),
+    'vtt': ('.vtt', to_webvtt),
+    'ass': ('.ass', to_ass),
+}
+
+FORMATS = tuple(SUBTITLE_FORMATS) + ('cast',)
+
+
+def export_song(song: SongExport, formats: Sequence[str], width: int = 100,
+                height: int = 24, align_words: bool = False) -> dict:
+    """
+    Write one song in every requested format.
+
+    Runs in a worker process, so it takes and returns only plain data.
+
+    Args:
+        song: Song to export
+        formats: Names from FORMATS
+        width: Terminal columns of a cast
+        height: Terminal rows of a cast
+        align_words: Move word timing onto the song's onsets (WAV only)
+
+    Returns:
+        Result with the files written and an error message if the song
+        could not be exported
+    """
+    from src.audio_probe import probe_duration
+    from src.lyrics_parser import LyricsParser
+
+    start = time.perf_counter()
+    result = {'lyrics': song.lyrics_path, 'song': song.song_path,
+              'written': [], 'error': None}
+    try:
+        title = Path(song.song_path or song.lyrics_path).stem
+        stem = Path(song.output_stem)
+        stem.parent.mkdir(parents=True, exist_ok=True)
+
+        if any(name in SUBTITLE_FORMATS for name in formats):
+            # Each file is read once, so a batch bypasses the lyrics cache
+            # rather than evicting the entries of songs being played; the
+            # parser's timestamp warnings are not part of the export
+            parser = LyricsParser(compact=True)
+            with contextlib.redirect_stdout(io.StringIO()):
+                parser.parse_lrc_file(song.lyrics_path)
+            if align_words and song.song_path:
+                from src.word_alignment import align_parsed_lyrics
+                align_parsed_lyrics(parser, song.lyrics_path, song.song_path)
+            duration = probe_duration(song.song_path) if song.song_path else None
+            cues = lyric_cues(parser.lyrics, duration)
+
+        for name in formats:
+            if name == 'cast':
+                suffix = '.cast'
+                text = record_asciicast(song.lyrics_path, song.song_path, width, height,
+                                        align_words)
+            else:
+                suffix, write = SUBTITLE_FORMATS[name]
+                text = write(cues, title)
+            path = stem.with_name(stem.name + suffix)
+            path.write_text(text, encoding='utf-8')
+            result['written'].append(str(path))
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def _export_chunk(songs: List[SongExport], **options) -> List[dict]:
+    """Worker task: export a batch of songs."""
+    return [export_song(song, **options) for song in songs]
+
+
+def export_songs(songs: Sequence[SongExport], formats: Sequence[str],
+                 jobs: Optional[int] = None, **options) -> dict:
+    """
+    Export many songs in parallel worker processes.
+
+    Args:
+        songs: Songs to export
+        formats: Names from FORMATS
+        jobs: Worker processes, defaults to every CPU
+        **options: width, height and align_words for export_song
+
+    Returns:
+        Export statistics and the result of every song in input order
+    """
+    start = time.perf_counter()
+    jobs = jobs or os.cpu_count() or 1
+    results = []
+    if songs:
+        # Several chunks per worker keep the pool balanced near the end
+        chunk_size = max(1, min(_MAX_CHUNK, len(songs) // (jobs * 4)))
+        chunks = [list(songs[i:i + chunk_size]) for i in range(0, len(songs), chunk_size)]
+        task = functools.partial(_export_chunk, formats=list(formats), **options)
+        with contextlib.ExitStack() as stack:
+            map_chunks = map
+            if jobs > 1 and len(chunks) > 1:
+                pool = ProcessPoolExecutor(max_workers=min(jobs, len(chunks)))
+                map_chunks = stack.enter_context(pool).map
+            for entries in map_chunks(task, chunks):
+                results += entries
+
+    elapsed = time.perf_counter() - start
+    return {
+        'songs': len(songs),
+        'files': sum(len(result['written']) for result in results),
+        'errors': sum(1 for result in results if result['error']),
+        'jobs': jobs,
+        'seconds': elapsed,
+        'songs_per_second': len(songs) / elapsed if elapsed else 0.0,
+        'results': results,
+    }
+
+
+def find_songs(sources: Sequence[str], output_dir: Optional[Path] = None) -> List[SongExport]:
+    """
+    Collect the songs to export from command-line sources.
+
+    Args:
+        sources: LRC files, library directories (every song/LRC pair below
+            them) and M3U playlists
+        output_dir: Directory for the exported files; by default they go
+            next to each LRC file. Pairs found in a directory keep their
+            subdirectory below it.
+
+    Returns:
+        Songs in the order given
+
+    Raises:
+        ValueError: If a source is none of the above or holds no songs
+    """
+    from src.scanner import find_pairs
+
+    songs = []
+    for source in sources:
+        path = Path(source)
+        if path.is_dir():
+            pairs = [(song, lyrics, output_dir / lyrics.parent.relative_to(path)
+                      if output_dir else lyrics.parent)
+                     for song, lyrics in find_pairs(path)]
+        elif path.suffix.lower() == '.lrc':
+            pairs = [(None, path, output_dir or path.parent)]
+        else:
+            from src.playlist import PLAYLIST_SUFFIXES, load_playlist
+            if path.suffix.lower() not in PLAYLIST_SUFFIXES:
+                raise ValueError(f"'{source}' is not an LRC file, a directory or an M3U playlist")
+            pairs = [(track.song_path, track.lyrics_path, output_dir or track.lyrics_path.parent)
+                     for track in load_playlist([source])]
+        if not pairs:
+            raise ValueError(f"No song/LRC pairs found in '{source}'")
+
+        for song, lyrics, directory in pairs:
+            songs.append(SongExport(lyrics_path=str(lyrics),
+                                    song_path=str(song) if song else None,
+                                    output_stem=str(Path(directory) / lyrics.stem)))
+    return songs
+
+
+def main(arguments: Sequence[str]) -> int:
+    """
+    Run the export command.
+
+    Args:
+        arguments: Command-line arguments after 'export'
+
+    Returns:
+        Process exit status
+    """
+    parser = argparse.ArgumentParser(
+        prog='python verse.py export',
+        description='Write lyric timing as subtitles or render asciicast recordings')
+    parser.add_argument('sources', nargs='+',
+                        help='LRC files, library directories or M3U playlists')
+    parser.add_argument('--format', choices=FORMATS, action='append', dest='formats',
+                        help='output format, may be repeated (default: srt)')
+    parser.add_argument('--output-dir', type=Path,
+                        help='directory for the exported files (default: next to each LRC file)')
+    parser.add_argument('--jobs', type=int, help='worker processes (default: all CPUs)')
+    parser.add_argument('--width', type=int, default=100, help='cast terminal columns (default: 100)')
+    parser.add_argument('--height', type=int, default=24, help='cast terminal rows (default: 24)')
+    parser.add_argument('--align', action='store_true',
+                        help='place words on onsets in WAV songs, as VERSE_ALIGN does')
+    args = parser.parse_args(arguments)
+
+    try:
+        songs = find_songs(args.sources, args.output_dir)
+    except (OSError, ValueError) as e:
+        print(f"Error: {str(e)}")
+        return 1
+
+    formats = list(dict.fromkeys(args.formats or ['srt']))
+    stats = export_songs(songs, formats, jobs=args.jobs, width=args.width,
+                         height=args.height, align_words=args.align)
+
+    for result in stats['results']:
+        if result['error']:
+            print(f"Error: {result['lyrics']}: {result['error']}")
+    print(f"Exported {stats['songs'] - stats['errors']} of {stats['songs']} songs "
+          f"({stats['files']} files) in {stats['seconds']:.2f}s "
+          f"({stats['songs_per_second']:.1f} songs/s, {stats['jobs']} workers)")
+    return 1 if stats['errors'] else 0
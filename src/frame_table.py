@@ -0,0 +1,283 @@
+"""
+Frame Table Module for Verse Music Player
+Pre-renders every lyric frame of a song so playback only writes strings.
+"""
+
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+import threading
+
+from src.display import CONTEXT_START
+
+
+@dataclass
+class FrameTable:
+    """
+    Lyric frames of one song for one terminal width, back to back in one string.
+
+    Frames are the escape sequences the live renderer writes at every word,
+    line and progress bar tick, each relative to the frame before it. The
+    first frame of a line is a keyframe that redraws all three lyric rows;
+    it is stored without its leading cursor move, which depends on what is
+    on screen when playback joins the table.
+    """
+    width: int          # Terminal width the frames are laid out for
+    duration: float     # Song length the progress bar was drawn against
+    text: str           # All frames, concatenated
+    times: array        # Playback time of each frame ('d')
+    offsets: array      # Start of each frame in text, plus the end ('L')
+    lines: array        # Lyric line of each frame ('l')
+    keyframes: array    # First frame of each line, -1 if never shown ('l')
+    rows: array         # Lyric rows each line's keyframe draws ('l')
+    bar_rows: array     # Rows from each keyframe's last row up to its progress bar ('l')
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def frame_at(self, position: float) -> int:
+        """
+        Find the last frame due at a playback position.
+
+        Args:
+            position: Playback time in seconds
+
+        Returns:
+            Frame index, -1 before the first frame
+        """
+        return bisect_right(self.times, position) - 1
+
+    def keyframe(self, line_index: int) -> int:
+        """
+        Get the frame that starts a lyric line.
+
+        Args:
+            line_index: Index of the line in the timeline
+
+        Returns:
+            Frame index, or -1 if the table cannot start the line
+        """
+        if 0 <= line_index < len(self.keyframes):
+            return self.keyframes[line_index]
+        return -1
+
+    def span(self, first: int, last: int) -> str:
+        """
+        Get frames first to last (inclusive) as one string.
+
+        Args:
+            first: Index of the first frame
+            last: Index of the last frame
+
+        Returns:
+            The frames' escape sequences, ready to write
+        """
+        return self.text[self.offsets[first]:self.offsets[last + 1]]
+
+
+class _FrameRecorder:
+    """Console file that keeps each write as one frame."""
+
+    def __init__(self):
+        self.frames: List[str] = []
+
+    def write(self, data: str) -> int:
+        self.frames.append(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+def build_frame_table(
+    lyrics_parser,
+    width: int,
+    duration: float,
+    color_system: Optional[str] = 'truecolor',
+    progress_interval: float = 1.0
+) -> FrameTable:
+    """
+    Render every lyric frame of a parsed song on an in-memory console.
+
+    The frames come from VersePlayer's own renderer, driven through each
+    word, line and progress tick in order, so they are byte for byte what
+    live playback would write.
+
+    Args:
+        lyrics_parser: Parser holding the song's timeline; not modified
+        width: Terminal width to lay the frames out for
+        duration: Song length in seconds for the progress bar
+        color_system: Rich color system of the terminal, None for no color
+        progress_interval: Playback time between progress bar ticks
+
+    Returns:
+        FrameTable covering the song from its first line to its end
+    """
+    # Imported here, src.main imports this module lazily
+    from rich.console import Console
+    from src.display import LyricDisplay
+    from src.main import DisplayState, VersePlayer
+
+    recorder = _FrameRecorder()
+    console = Console(file=recorder, force_terminal=True, width=width, height=24,
+                      color_system=color_system, legacy_windows=False, highlight=False)
+    display = LyricDisplay(console)
+    display.song_duration = duration
+    renderer = VersePlayer('', '', lyrics_parser=lyrics_parser, display=display)
+    renderer.scheduler.progress_interval = progress_interval
+
+    view = DisplayState(cursor=lyrics_parser.cursor())
+    line_count = len(lyrics_parser.lyrics)
+    end = duration if duration > 0 else float('inf')
+
+    text: List[str] = []
+    times = array('d')
+    offsets = array('L', [0])
+    lines = array('l')
+    keyframes = array('l', [-1]) * line_count
+    rows = array('l', [0]) * line_count
+    bar_rows = array('l', [1]) * line_count
+    size = 0
+    shown_line = -1
+
+    position = 0.0
+    while position < end:
+        written = len(recorder.frames)
+        next_event = renderer._render_frame(view, position)
+
+        if len(recorder.frames) > written and view.lyric is not None:
+            frame = ''.join(recorder.frames[written:])
+            line_index = view.line_index
+            if line_index != shown_line:
+                # Keyframe: drop the cursor move in front of the rows
+                start = CONTEXT_START.match(frame)
+                if start is not None:
+                    frame = frame[start.end():]
+                    keyframes[line_index] = len(times)
+                    rows[line_index] = display._block_rows
+                    bar_rows[line_index] = display._bar_rows
+                shown_line = line_index
+            text.append(frame)
+            size += len(frame)
+            times.append(position)
+            offsets.append(size)
+            lines.append(line_index)
+        elif view.lyric is None:
+            # Cleared screen between lines, drawn live during playback
+            shown_line = -1
+
+        # Step to the next word, line or progress bar tick
+        next_tick = renderer.scheduler.next_progress_tick(position)
+        if next_event is None and duration <= 0:
+            break
+        position = next_tick if next_event is None else min(next_event, next_tick)
+
+    return FrameTable(width=width, duration=duration, text=''.join(text), times=times,
+                      offsets=offsets, lines=lines, keyframes=keyframes, rows=rows,
+                      bar_rows=bar_rows)
+
+
+class PrerenderedFrames:
+    """
+    Frame table of one song, built on a worker thread.
+
+    The table matches one terminal width and song duration. Asking for it
+    at any other size, for example after the terminal was resized, drops
+    it and starts a rebuild in the background; until the new table is
+    ready, playback renders live.
+    """
+
+    def __init__(self, lyrics_parser, color_system: Optional[str],
+                 progress_interval: float = 1.0):
+        """
+        Initialize the frame tables of a parsed song.
+
+        Args:
+            lyrics_parser: Parser holding the song's timeline
+            color_system: Rich color system of the terminal, None for no color
+            progress_interval: Playback time between progress bar ticks
+        """
+        self.lyrics_parser = lyrics_parser
+        self.color_system = color_system
+        self.progress_interval = progress_interval
+        self.builds: int = 0
+        self.build_seconds: float = 0.0
+        self._table: Optional[FrameTable] = None
+        self._building: Optional[Tuple[int, float]] = None
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+
+    def build(self, width: int, duration: float) -> None:
+        """
+        Start building the table for a terminal size in a worker thread.
+
+        Args:
+            width: Terminal width in columns
+            duration: Song length in seconds
+        """
+        key = (width, duration)
+        with self._lock:
+            if self._building == key:
+                return
+            table = self._table
+            if table is not None and (table.width, table.duration) == key:
+                return
+            self._building = key
+            self._table = None
+            self._ready.clear()
+        threading.Thread(target=self._build, args=key,
+                         name="verse-frame-table", daemon=True).start()
+
+    def _build(self, width: int, duration: float) -> None:
+        """Worker thread: render the table and publish it if still wanted."""
+        import time
+
+        start = time.perf_counter()
+        try:
+            table = build_frame_table(self.lyrics_parser, width, duration,
+                                      self.color_system, self.progress_interval)
+        except Exception:
+            # Playback renders live without a table
+            table = None
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            if self._building != (width, duration):
+                return
+            self._building = None
+            self._table = table
+            self.builds += 1
+            self.build_seconds += elapsed
+            self._ready.set()
+
+    def table(self, width: int, duration: float) -> Optional[FrameTable]:
+        """
+        Get the table for the current terminal size if it is ready.
+
+        Args:
+            width: Terminal width in columns
+            duration: Song length in seconds
+
+        Returns:
+            The ready table, or None while none matches; a mismatching
+            table is dropped and rebuilt for the new size
+        """
+        table = self._table
+        if table is not None and table.width == width and table.duration == duration:
+            return table
+        self.build(width, duration)
+        return None
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[FrameTable]:
+        """
+        Wait for the build in progress to finish.
+
+        Args:
+            timeout: Longest wait in seconds, None to wait until done
+
+        Returns:
+            The table, or None if it is not ready or could not be built
+        """
+        self._ready.wait(timeout)
+        return self._table
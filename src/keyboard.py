@@ -0,0 +1,152 @@
+"""
+Keyboard Module for Verse Music Player
+Reads single key presses from the terminal without waiting for Enter.
+"""
+
+from typing import List, Optional, TextIO
+import asyncio
+import os
+import sys
+
+# Key names for the escape sequences of the arrow keys
+_ESCAPE_KEYS = {
+    '\x1b[A': 'up',
+    '\x1b[B': 'down',
+    '\x1b[C': 'right',
+    '\x1b[D': 'left',
+    '\x1bOA': 'up',
+    '\x1bOB': 'down',
+    '\x1bOC': 'right',
+    '\x1bOD': 'left',
+}
+
+
+def parse_keys(data: bytes) -> List[str]:
+    """
+    Split bytes read from the terminal into key names.
+
+    Arrow keys become 'up', 'down', 'left' and 'right', a lone escape
+    becomes 'escape' and anything else its character.
+
+    Args:
+        data: Bytes from one read of the terminal
+
+    Returns:
+        Key names in the order they were pressed
+    """
+    keys = []
+    text = data.decode('utf-8', 'replace')
+    i = 0
+    while i < len(text):
+        if text[i] == '\x1b':
+            key = _ESCAPE_KEYS.get(text[i:i + 3])
+            if key is not None:
+                keys.append(key)
+                i += 3
+                continue
+            keys.append('escape')
+        else:
+            keys.append(text[i])
+        i += 1
+    return keys
+
+
+class KeyReader:
+    """
+    Non-blocking key reader for an asyncio event loop.
+
+    The terminal is switched to cbreak mode: keys arrive one at a time
+    without echo, while output processing and Ctrl+C keep working. The
+    terminal file descriptor is watched by the event loop, so waiting for a
+    key costs no CPU. Where there is no terminal or no termios module (for
+    example on Windows), the reader is unavailable and get() never returns.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        """
+        Initialize the key reader.
+
+        Args:
+            stream: Terminal input, defaults to sys.stdin
+        """
+        self.stream = stream or sys.stdin
+        self._fd: Optional[int] = None
+        self._saved_attributes = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.available = self._is_terminal()
+
+    def _is_terminal(self) -> bool:
+        """Check for a terminal that supports cbreak mode."""
+        try:
+            import termios  # noqa: F401  (POSIX only)
+            return self.stream.isatty()
+        except (ImportError, AttributeError, ValueError):
+            return False
+
+    def start(self) -> bool:
+        """
+        Switch the terminal to cbreak mode and start watching it.
+
+        Must be called from a coroutine running on the event loop.
+
+        Returns:
+            True if keys will be delivered, False if unavailable
+        """
+        if not self.available:
+            return False
+
+        import termios
+        import tty
+
+        self._fd = self.stream.fileno()
+        try:
+            self._saved_attributes = termios.tcgetattr(self._fd)
+            tty.setcbreak(self._fd)
+        except termios.error:
+            self.available = False
+            return False
+
+        self._queue = asyncio.Queue()
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(self._fd, self._on_readable)
+        return True
+
+    def stop(self) -> None:
+        """Stop watching the terminal and restore its previous mode."""
+        if self._fd is None:
+            return
+
+        import termios
+
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.remove_reader(self._fd)
+        if self._saved_attributes is not None:
+            termios.tcsetattr(self._fd, termios.TCSADRAIN, self._saved_attributes)
+        self._fd = None
+        self._saved_attributes = None
+
+    def _on_readable(self) -> None:
+        """Event loop callback: queue the keys that arrived."""
+        try:
+            data = os.read(self._fd, 64)
+        except OSError:
+            data = b''
+        if not data:
+            # End of input, nothing more will come
+            self._loop.remove_reader(self._fd)
+            return
+        for key in parse_keys(data):
+            self._queue.put_nowait(key)
+
+    async def get(self) -> str:
+        """
+        Wait for the next key press.
+
+        Returns:
+            Key name, see parse_keys()
+        """
+        if self._queue is None:
+            # No terminal: wait until cancelled
+            await asyncio.Event().wait()
+        return await self._queue.get()
@@ -0,0 +1,135 @@
+"""
+Layout Module for Verse Music Player
+Wraps and centers lyric lines by terminal cell width, once per line and width.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from rich.cells import cell_len, chop_cells
+
+# Layouts kept per terminal width before the cache starts over
+MAX_LAYOUTS = 4096
+
+
+@dataclass
+class LineLayout:
+    """Wrapped, centered placement of one lyric line."""
+    rows: List[Tuple[int, str]] = field(default_factory=list)   # (column, text) of each row
+    words: List[List[Tuple[int, int, str]]] = field(default_factory=list)  # (row, column, text) pieces of each word
+
+    @property
+    def row_count(self) -> int:
+        """Terminal rows the line takes, at least one."""
+        return max(1, len(self.rows))
+
+
+def layout_line(text: str, width: int, indent: int = 0) -> LineLayout:
+    """
+    Wrap a lyric line at word boundaries and center each row.
+
+    Widths are counted in terminal cells, so wide CJK characters and emoji
+    take two columns and combining marks none. Words wider than a row,
+    such as CJK lines without spaces, are split across rows.
+
+    Args:
+        text: Lyric line; words are separated by whitespace
+        width: Terminal width in columns
+        indent: Columns reserved on the left, e.g. for the progress bar
+
+    Returns:
+        LineLayout with 1-based terminal columns
+    """
+    available = max(1, width - indent)
+
+    # Group (word index, text, cells) pieces into rows that fit
+    rows: List[List[Tuple[int, str, int]]] = []
+    row: List[Tuple[int, str, int]] = []
+    row_cells = 0
+    for index, word in enumerate(text.split()):
+        cells = cell_len(word)
+        pieces = [(word, cells)] if cells <= available else [
+            (piece, cell_len(piece)) for piece in chop_cells(word, available)]
+        for piece, piece_cells in pieces:
+            needed = row_cells + 1 + piece_cells if row else piece_cells
+            if row and needed > available:
+                rows.append(row)
+                row = []
+                needed = piece_cells
+            row.append((index, piece, piece_cells))
+            row_cells = needed
+    if row:
+        rows.append(row)
+
+    layout = LineLayout()
+    for row_index, row in enumerate(rows):
+        row_cells = sum(cells for _, _, cells in row) + len(row) - 1
+        column = indent + max(0, (available - row_cells) // 2) + 1
+        layout.rows.append((column, ' '.join(piece for _, piece, _ in row)))
+        for index, piece, cells in row:
+            if index == len(layout.words):
+                layout.words.append([])
+            layout.words[index].append((row_index, column, piece))
+            column += cells + 1
+    return layout
+
+
+class LayoutCache:
+    """
+    Line layouts for the current terminal width.
+
+    Each distinct line is measured and wrapped once; repeated lines such as
+    choruses and every later frame of a line reuse the layout. The width
+    only changes through resize(), which drops the cached layouts.
+    """
+
+    def __init__(self, width: int, indent: int = 0):
+        """
+        Initialize the cache.
+
+        Args:
+            width: Terminal width in columns
+            indent: Columns reserved on the left of every line
+        """
+        self.width = width
+        self.indent = indent
+        self.hits: int = 0
+        self.misses: int = 0
+        self._layouts: Dict[str, LineLayout] = {}
+
+    def get(self, text: str) -> LineLayout:
+        """
+        Get the layout of a line, computing it on first use.
+
+        Args:
+            text: Lyric line
+
+        Returns:
+            LineLayout for the current width
+        """
+        layout = self._layouts.get(text)
+        if layout is not None:
+            self.hits += 1
+            return layout
+
+        self.misses += 1
+        if len(self._layouts) >= MAX_LAYOUTS:
+            self._layouts.clear()
+        layout = self._layouts[text] = layout_line(text, self.width, self.indent)
+        return layout
+
+    def resize(self, width: int) -> bool:
+        """
+        Switch to a new terminal width.
+
+        Args:
+            width: Terminal width in columns
+
+        Returns:
+            True if the width changed and the cached layouts were dropped
+        """
+        if width == self.width:
+            return False
+        self.width = width
+        self._layouts.clear()
+        return True
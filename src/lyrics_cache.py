@@ -0,0 +1,230 @@
+"""
+Lyrics Cache Module for Verse Music Player
+Persists compiled lyric timelines on disk so warm starts skip parsing.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+import hashlib
+import os
+import struct
+import tempfile
+
+from src.compact_lyrics import CompactLyrics
+
+# Entry layout: header identifying the source file, then the timeline blob
+_ENTRY_HEADER = struct.Struct('<4sHxxqq32s')
+_ENTRY_MAGIC = b'VLCE'
+
+# Bump whenever parsing or word timing changes what a file compiles to
+CACHE_VERSION = 2
+
+# Default upper bound for the cache directory size
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def cache_enabled() -> bool:
+    """
+    Check whether the lyrics cache is turned on.
+
+    Returns:
+        True if $VERSE_CACHE is set to anything but '' or '0', or if
+        $VERSE_CACHE_DIR names a cache directory
+    """
+    return (os.environ.get('VERSE_CACHE', '') not in ('', '0')
+            or bool(os.environ.get('VERSE_CACHE_DIR')))
+
+
+def default_cache_dir() -> Path:
+    """
+    Get the default lyrics cache directory.
+
+    Returns:
+        $VERSE_CACHE_DIR if set, otherwise verse/lyrics under the user cache
+        directory ($XDG_CACHE_HOME or ~/.cache)
+    """
+    override = os.environ.get('VERSE_CACHE_DIR')
+    if override:
+        return Path(override)
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache')
+    return Path(base) / 'verse' / 'lyrics'
+
+
+@dataclass
+class CacheKey:
+    """Identity of an LRC file at the moment it was read."""
+    path: str           # Absolute path of the LRC file
+    mtime_ns: int       # Modification time in nanoseconds
+    size: int           # File size in bytes
+    content_hash: bytes  # BLAKE2b-256 digest of the file content
+    variant: str = ''    # Derived timeline stored in its own entry, '' for the parsed one
+
+
+class LyricsCache:
+    """
+    On-disk cache of compiled lyric timelines.
+
+    Each LRC file maps to one entry named after its path. The entry header
+    records the file's mtime, size and content hash; any mismatch marks the
+    entry stale and the caller re-parses and overwrites it. Entries are
+    written to a temporary file and atomically renamed, so concurrent
+    players never see partial writes, and the least recently used entries
+    are evicted once the directory grows past ``max_bytes``.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries, see default_cache_dir
+            max_bytes: Total entry size above which old entries are evicted
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.max_bytes = max_bytes
+
+    def make_key(self, file_path: str, variant: str = '') -> CacheKey:
+        """
+        Compute the cache key of an LRC file.
+
+        Args:
+            file_path: Path to the LRC file
+            variant: Names a timeline derived from the file, such as word
+                timing aligned to an audio file, which gets its own entry
+
+        Returns:
+            CacheKey for the file's current state
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        path = os.path.abspath(file_path)
+        with open(path, 'rb') as file:
+            stat = os.fstat(file.fileno())
+            digest = hashlib.blake2b(file.read(), digest_size=32)
+        digest.update(variant.encode('utf-8'))
+        return CacheKey(path=path, mtime_ns=stat.st_mtime_ns, size=stat.st_size,
+                        content_hash=digest.digest(), variant=variant)
+
+    def _entry_path(self, key: CacheKey) -> Path:
+        """Get the entry file used for a source path and variant."""
+        source = key.path + '\0' + key.variant if key.variant else key.path
+        name = hashlib.blake2b(source.encode('utf-8'), digest_size=16).hexdigest()
+        return self.cache_dir / f"{name}.v{CACHE_VERSION}.bin"
+
+    def load(self, key: CacheKey) -> Optional[CompactLyrics]:
+        """
+        Load a cached timeline.
+
+        Args:
+            key: Cache key of the LRC file
+
+        Returns:
+            The cached timeline, or None on a miss or stale/corrupt entry
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'rb') as file:
+                data = file.read()
+        except OSError:
+            return None
+
+        if len(data) < _ENTRY_HEADER.size:
+            return None
+        magic, version, mtime_ns, size, content_hash = _ENTRY_HEADER.unpack_from(data)
+        if (magic != _ENTRY_MAGIC or version != CACHE_VERSION
+                or mtime_ns != key.mtime_ns or size != key.size
+                or content_hash != key.content_hash):
+            return None
+
+        try:
+            lyrics = CompactLyrics.from_bytes(data[_ENTRY_HEADER.size:])
+        except (ValueError, UnicodeDecodeError):
+            return None
+
+        # Mark the entry as recently used for eviction
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        return lyrics
+
+    def store(self, key: CacheKey, lyrics: CompactLyrics) -> bool:
+        """
+        Store a compiled timeline, replacing any previous entry.
+
+        Args:
+            key: Cache key of the LRC file the timeline was parsed from
+            lyrics: Compiled timeline
+
+        Returns:
+            True if the entry was written, False if the cache is unwritable
+        """
+        header = _ENTRY_HEADER.pack(_ENTRY_MAGIC, CACHE_VERSION, key.mtime_ns,
+                                    key.size, key.content_hash)
+        entry_path = self._entry_path(key)
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                dir=self.cache_dir, prefix='.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    file.write(header)
+                    file.write(lyrics.to_bytes())
+                # Atomic on POSIX and Windows, last writer wins
+                os.replace(temp_path, entry_path)
+            except BaseException:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+                raise
+        except OSError:
+            return False
+
+        self.evict()
+        return True
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache fits max_bytes."""
+        entries = []
+        total = 0
+        try:
+            for entry in os.scandir(self.cache_dir):
+                if not entry.name.endswith('.bin'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    # Removed by another player in the meantime
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                total += stat.st_size
+        except OSError:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        """Delete every cache entry."""
+        try:
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith('.bin'):
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
+            pass
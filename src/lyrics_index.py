@@ -0,0 +1,617 @@
+"""
+Lyrics Index Module for Verse Music Player
+Full-text search over the lyrics of a scanned library.
+
+Usage:
+    python verse.py search <directory> <query> [--index PATH] [--limit N] [--play N]
+
+The index is a single file that is memory-mapped for queries, so a search
+reads the term table and the postings of the matching terms only:
+
+    header       magic, version, counts and section offsets
+    song table   (song offset, song length, lyrics offset, lyrics length,
+                 first line, line count) per song id, pointing into the
+                 string blob and the line table
+    line table   (text offset, text length) per line of every song, in
+                 timeline order, pointing into the string blob
+    term table   (term offset, term length, first posting, posting count)
+                 per term, sorted by the UTF-8 bytes of the term
+    strings      UTF-8 song paths, lyrics paths, line texts and terms;
+                 repeated line texts are stored once
+    postings     four columns, one entry per token: song id (uint32), line
+                 index (uint32), token position in the line (uint16) and
+                 timestamp in milliseconds (uint32)
+
+All integers are little-endian.
+"""
+
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+import argparse
+import heapq
+import itertools
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+import time
+
+INDEX_NAME = '.verse-index.bin'
+INDEX_MAGIC = b'VRSI'
+INDEX_VERSION = 2
+
+# Magic, version, song count, term count, then the offsets of the song
+# table, line table, term table, strings and the four posting columns
+_HEADER = struct.Struct('<4sIII8Q')
+_SONG = struct.Struct('<IIIIII')
+_LINE = struct.Struct('<II')
+_TERM = struct.Struct('<IIII')
+
+# Posting columns: (name, array typecode, bytes per entry)
+_COLUMNS = (('song', 'I', 4), ('line', 'I', 4), ('position', 'H', 2), ('time', 'I', 4))
+
+# Words, keeping inner apostrophes so "don't" is one token
+_TOKEN = re.compile(r"\w+(?:'\w+)*")
+
+_MAX_POSITION = 0xFFFF
+
+# Postings of one song: term -> flat [line index, position, milliseconds, ...]
+SongPostings = Dict[str, List[int]]
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase search tokens.
+
+    Args:
+        text: Lyric or query text
+
+    Returns:
+        Tokens in order, punctuation dropped
+    """
+    return _TOKEN.findall(text.casefold())
+
+
+def song_postings(lyrics) -> SongPostings:
+    """
+    Tokenize a parsed timeline into the postings of one song.
+
+    Every token takes the timestamp of the word it comes from, so a hit can
+    start playback on the word itself. Lines without word timing use the
+    line timestamp.
+
+    Args:
+        lyrics: Parsed lyric lines, as returned by LyricsParser.parse_lrc_file
+
+    Returns:
+        Dictionary of term to a flat list of (line index, position,
+        milliseconds) triples in timeline order
+    """
+    # Imported here so the search command does not load the parser
+    from src.lyrics_parser import timed_words
+
+    postings: SongPostings = {}
+    find_tokens = _TOKEN.findall
+    for line_index, line in enumerate(lyrics):
+        position = 0
+        for timestamp, text in timed_words(line) or ((line.timestamp, line.text),):
+            tokens = find_tokens(text.casefold())
+            if not tokens:
+                continue
+            milliseconds = int(timestamp * 1000 + 0.5)
+            for token in tokens:
+                # Positions past the column range are not indexed
+                if position <= _MAX_POSITION:
+                    triples = postings.get(token)
+                    if triples is None:
+                        triples = postings[token] = []
+                    triples += (line_index, position, milliseconds)
+                position += 1
+    return postings
+
+
+def _native(column: array) -> array:
+    """Convert a little-endian column to the native byte order, in place."""
+    if sys.byteorder == 'big':
+        column.byteswap()
+    return column
+
+
+@dataclass
+class SearchHit:
+    """One match of a query in the library."""
+    song_id: int          # Song id in the index
+    song_path: str        # Path to the audio file
+    lyrics_path: str      # Path to the LRC file
+    line_index: int       # Line of the parsed timeline
+    position: int         # Token position of the match in the line
+    timestamp: float      # Time of the first matched word in seconds
+    line_text: str        # Full text of the matched line
+
+
+class LyricsIndex:
+    """
+    Read-only, memory-mapped lyrics index.
+
+    Terms are found by binary search over the term table; postings are
+    copied out of the map per term, so opening an index and running a
+    query costs the same for a small and a large library.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open and map an index file.
+
+        Args:
+            path: Index file written by IndexBuilder
+
+        Raises:
+            OSError: If the file cannot be opened
+            ValueError: If the file is not a Verse index of this version
+        """
+        self.path = Path(path)
+        with open(self.path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size < _HEADER.size:
+                raise ValueError(f"Not a Verse lyrics index: {self.path}")
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header = _HEADER.unpack_from(self._map, 0)
+        magic, version, self.song_count, self.term_count = header[:4]
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            self._map.close()
+            raise ValueError(f"Not a Verse lyrics index of version {INDEX_VERSION}: {self.path}")
+        self._songs_offset, self._lines_offset, self._terms_offset = header[4:7]
+        self._strings_offset = header[7]
+        self._column_offsets = header[8:]
+
+    def close(self) -> None:
+        """Unmap the index file."""
+        self._map.close()
+
+    def __enter__(self) -> 'LyricsIndex':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _string(self, offset: int, length: int) -> bytes:
+        """Read bytes from the string blob."""
+        start = self._strings_offset + offset
+        return self._map[start:start + length]
+
+    def song(self, song_id: int) -> Tuple[str, str]:
+        """
+        Get the files of a song.
+
+        Args:
+            song_id: Song id from a posting
+
+        Returns:
+            (song_path, lyrics_path) tuple
+        """
+        song_offset, song_length, lyrics_offset, lyrics_length, _, _ = self._song_entry(song_id)
+        return (self._string(song_offset, song_length).decode('utf-8'),
+                self._string(lyrics_offset, lyrics_length).decode('utf-8'))
+
+    def _song_entry(self, song_id: int) -> Tuple[int, int, int, int, int, int]:
+        """Read a song table row."""
+        return _SONG.unpack_from(self._map, self._songs_offset + song_id * _SONG.size)
+
+    def line_text(self, song_id: int, line_index: int) -> str:
+        """
+        Get the text of one line of a song, as it was when indexed.
+
+        Args:
+            song_id: Song id from a posting
+            line_index: Line of the parsed timeline
+
+        Returns:
+            The line text, '' for a line the song does not have
+        """
+        first_line, line_count = self._song_entry(song_id)[4:]
+        if not 0 <= line_index < line_count:
+            return ''
+        offset, length = _LINE.unpack_from(
+            self._map, self._lines_offset + (first_line + line_index) * _LINE.size)
+        return self._string(offset, length).decode('utf-8')
+
+    def line_texts(self, song_id: int) -> List[str]:
+        """
+        Get the text of every line of a song, as it was when indexed.
+
+        Args:
+            song_id: Song id from a posting
+
+        Returns:
+            Line texts in timeline order
+        """
+        return [self.line_text(song_id, line_index)
+                for line_index in range(self._song_entry(song_id)[5])]
+
+    def song_ids(self) -> Dict[str, int]:
+        """
+        Map every song path in the index to its id.
+
+        Returns:
+            Dictionary of song path to song id
+        """
+        return {self.song(song_id)[0]: song_id for song_id in range(self.song_count)}
+
+    def _term_entry(self, term_id: int) -> Tuple[int, int, int, int]:
+        """Read a term table row."""
+        return _TERM.unpack_from(self._map, self._terms_offset + term_id * _TERM.size)
+
+    def _term(self, term_id: int) -> bytes:
+        """Read the UTF-8 bytes of a term."""
+        offset, length, _, _ = self._term_entry(term_id)
+        return self._string(offset, length)
+
+    def _lower_bound(self, key: bytes) -> int:
+        """Binary search for the first term not less than key."""
+        low, high = 0, self.term_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._term(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _term_ids(self, token: str, prefix: bool) -> range:
+        """Term ids equal to a token, or starting with it for a prefix."""
+        key = token.encode('utf-8')
+        first = self._lower_bound(key)
+        last = first
+        if prefix:
+            while last < self.term_count and self._term(last).startswith(key):
+                last += 1
+        elif first < self.term_count and self._term(first) == key:
+            last = first + 1
+        return range(first, last)
+
+    def _postings(self, term_id: int, limit: Optional[int] = None) -> Iterator[Tuple[int, int, int, int]]:
+        """
+        Read the postings of a term from the map.
+
+        Args:
+            term_id: Term to read
+            limit: Read only the first postings of the term
+
+        Returns:
+            Iterator of (song id, line index, position, milliseconds) in
+            index order
+        """
+        return zip(*self._columns(term_id, limit))
+
+    def _columns(self, term_id: int, limit: Optional[int] = None) -> List[array]:
+        """Copy the posting columns of a term out of the map."""
+        _, _, first, count = self._term_entry(term_id)
+        if limit is not None:
+            count = min(count, limit)
+
+        columns = []
+        for (_, typecode, size), offset in zip(_COLUMNS, self._column_offsets):
+            start = offset + first * size
+            column = array(typecode)
+            column.frombytes(self._map[start:start + count * size])
+            columns.append(_native(column))
+        return columns
+
+    def iter_columns(self) -> Iterator[Tuple[str, List[array]]]:
+        """
+        Walk the whole index, term by term.
+
+        Yields:
+            (term, columns) tuples in term order; the columns hold the song
+            ids, line indexes, positions and milliseconds of the postings
+        """
+        for term_id in range(self.term_count):
+            yield self._term(term_id).decode('utf-8'), self._columns(term_id)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[SearchHit]:
+        """
+        Find the lines that contain a phrase.
+
+        The query is tokenized like the lyrics; every token must follow the
+        previous one in the same line. A trailing ``*`` turns the last
+        token into a prefix, so ``hold me cl*`` matches "hold me close".
+
+        Args:
+            query: Words to find
+            limit: Return only the first hits in song and line order
+
+        Returns:
+            Hits in song and line order
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        prefix = query.rstrip().endswith('*')
+        term_ids = [self._term_ids(token, prefix and index == len(tokens) - 1)
+                    for index, token in enumerate(tokens)]
+        if any(len(ids) == 0 for ids in term_ids):
+            return []
+
+        if len(tokens) == 1:
+            # Postings are sorted per term; merge the prefix terms lazily
+            # and stop at the limit
+            matches = heapq.merge(*(self._postings(term_id, limit) for term_id in term_ids[0]))
+        else:
+            matches = self._phrase_matches(term_ids)
+
+        return [SearchHit(song_id, *self.song(song_id), line_index, position,
+                          milliseconds / 1000.0, self.line_text(song_id, line_index))
+                for song_id, line_index, position, milliseconds
+                in itertools.islice(matches, limit)]
+
+    def _phrase_matches(self, term_ids: Sequence[range]) -> Iterator[Tuple[int, int, int, int]]:
+        """
+        Intersect the postings of consecutive tokens.
+
+        A phrase starting at (song, line, position) needs token k at
+        position + k of the same line. The rarest token is intersected
+        first, so frequent words only filter an already small set.
+
+        Returns:
+            Postings of the first token where the whole phrase matches, in
+            index order
+        """
+        counts = [sum(self._term_entry(term_id)[3] for term_id in ids) for ids in term_ids]
+        starts = None
+        for index in sorted(range(len(term_ids)), key=counts.__getitem__):
+            keys = itertools.chain.from_iterable(
+                zip(songs, lines, [position - index for position in positions])
+                for songs, lines, positions, _ in map(self._columns, term_ids[index]))
+            starts = set(keys) if starts is None else {key for key in keys if key in starts}
+            if not starts:
+                return iter(())
+
+        matches = [posting for term_id in term_ids[0] for posting in self._postings(term_id)
+                   if posting[:3] in starts]
+        matches.sort()
+        return iter(matches)
+
+
+class IndexBuilder:
+    """
+    Collects postings per song and writes them as a LyricsIndex file.
+
+    Songs that did not change since the last build can be carried over from
+    the previous index instead of being parsed again. The previous index
+    is closed once write() has read them.
+    """
+
+    def __init__(self):
+        """Initialize an empty builder."""
+        self._songs: Dict[str, Tuple[str, Optional[SongPostings], List[str]]] = {}
+        self._reused: Dict[str, int] = {}
+        self._previous: Optional[LyricsIndex] = None
+
+    def add_song(self, song_path: str, lyrics_path: str, postings: SongPostings,
+                 line_texts: Sequence[str]) -> None:
+        """
+        Add a song with freshly tokenized lyrics.
+
+        Args:
+            song_path: Path to the audio file
+            lyrics_path: Path to the LRC file
+            postings: Postings from song_postings()
+            line_texts: Text of every line of the parsed timeline, shown
+                with search hits
+        """
+        self._reused.pop(song_path, None)
+        self._songs[song_path] = (lyrics_path, postings, list(line_texts))
+
+    def reuse_song(self, previous: LyricsIndex, song_path: str, song_id: int) -> None:
+        """
+        Carry a song over from the previous index unchanged.
+
+        Args:
+            previous: Index the song is read from when writing
+            song_path: Path to the audio file
+            song_id: Id of the song in the previous index
+        """
+        self._previous = previous
+        self._reused[song_path] = song_id
+        self._songs[song_path] = (previous.song(song_id)[1], None,
+                                  previous.line_texts(song_id))
+
+    def write(self, path: Path) -> None:
+        """
+        Write the index atomically via a temporary file.
+
+        Args:
+            path: Index file to create or replace
+        """
+        song_paths = sorted(self._songs)
+        new_ids = {song_path: song_id for song_id, song_path in enumerate(song_paths)}
+
+        # term -> four posting columns; songs are appended in id order per
+        # source, carried-over and new songs may interleave
+        terms: Dict[str, List[array]] = {}
+        unsorted = set()
+
+        def extend(term: str, song_ids, lines, positions, times) -> None:
+            columns = terms.get(term)
+            if columns is None:
+                columns = terms[term] = [array(typecode) for _, typecode, _ in _COLUMNS]
+            elif columns[0] and columns[0][-1] > song_ids[0]:
+                unsorted.add(term)
+            columns[0].extend(song_ids)
+            columns[1].extend(lines)
+            columns[2].extend(positions)
+            columns[3].extend(times)
+
+        if self._reused:
+            remap = {old_id: new_ids[song_path] for song_path, old_id in self._reused.items()}
+            for term, (song_ids, lines, positions, times) in self._previous.iter_columns():
+                mapped = [remap.get(song_id) for song_id in song_ids]
+                if None in mapped:
+                    # Drop the postings of songs that changed or are gone
+                    keep = [new_id is not None for new_id in mapped]
+                    mapped = list(itertools.compress(mapped, keep))
+                    if not mapped:
+                        continue
+                    lines, positions, times = (list(itertools.compress(column, keep))
+                                               for column in (lines, positions, times))
+                extend(term, mapped, lines, positions, times)
+        if self._previous is not None:
+            # Unmap before the file is replaced, which Windows refuses otherwise
+            self._previous.close()
+            self._previous = None
+
+        for song_path in song_paths:
+            postings = self._songs[song_path][1]
+            if postings is not None:
+                song_id = new_ids[song_path]
+                for term, triples in postings.items():
+                    extend(term, [song_id] * (len(triples) // 3),
+                           triples[0::3], triples[1::3], triples[2::3])
+
+        for term in unsorted:
+            rows = sorted(zip(*terms[term]))
+            terms[term] = [array(typecode, column)
+                           for (_, typecode, _), column in zip(_COLUMNS, zip(*rows))]
+
+        self._write_file(Path(path), song_paths, terms)
+
+    def _write_file(self, path: Path, song_paths: List[str], terms: Dict[str, List[array]]) -> None:
+        """Lay out the sections and write them to disk."""
+        strings = bytearray()
+        string_spans: Dict[str, Tuple[int, int]] = {}
+
+        def add_string(text: str) -> Tuple[int, int]:
+            span = string_spans.get(text)
+            if span is None:
+                data = text.encode('utf-8')
+                span = string_spans[text] = (len(strings), len(data))
+                strings.extend(data)
+            return span
+
+        song_table = bytearray()
+        line_table = bytearray()
+        line_count = 0
+        for song_path in song_paths:
+            lyrics_path, _, line_texts = self._songs[song_path]
+            song_table += _SONG.pack(*add_string(song_path), *add_string(lyrics_path),
+                                     line_count, len(line_texts))
+            for text in line_texts:
+                line_table += _LINE.pack(*add_string(text))
+            line_count += len(line_texts)
+
+        term_table = bytearray()
+        columns = [array(typecode) for _, typecode, _ in _COLUMNS]
+        for term in sorted(terms, key=lambda term: term.encode('utf-8')):
+            term_columns = terms[term]
+            term_table += _TERM.pack(*add_string(term), len(columns[0]), len(term_columns[0]))
+            for column, term_column in zip(columns, term_columns):
+                column.extend(term_column)
+
+        sections = [bytes(song_table), bytes(line_table), bytes(term_table), bytes(strings)]
+        for column in columns:
+            if sys.byteorder == 'big':
+                column.byteswap()
+            sections.append(column.tobytes())
+
+        offsets = []
+        offset = _HEADER.size
+        for section in sections:
+            offsets.append(offset)
+            offset += len(section)
+        header = _HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(song_paths), len(terms), *offsets)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(header)
+                for section in sections:
+                    file.write(section)
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+
+def open_index(path: Path) -> Optional[LyricsIndex]:
+    """
+    Open an index file if there is a usable one.
+
+    Args:
+        path: Index file
+
+    Returns:
+        The opened index, or None if it is missing, unreadable or outdated
+    """
+    try:
+        return LyricsIndex(path)
+    except (OSError, ValueError):
+        return None
+
+
+def main(arguments: Sequence[str]) -> int:
+    """
+    Run the search command.
+
+    Args:
+        arguments: Command-line arguments after 'search'
+
+    Returns:
+        Process exit status
+    """
+    parser = argparse.ArgumentParser(
+        prog='python verse.py search',
+        description='Find a phrase in the lyrics of a scanned library')
+    parser.add_argument('directory', type=Path, help='library directory scanned before')
+    parser.add_argument('query', nargs='+', help='words to find; end with * for a prefix')
+    parser.add_argument('--index', type=Path,
+                        help=f'index file (default: <directory>/{INDEX_NAME})')
+    parser.add_argument('--limit', type=int, default=20, help='hits to list (default: 20)')
+    parser.add_argument('--play', type=int, metavar='N',
+                        help='play hit N starting at the matched words')
+    args = parser.parse_args(arguments)
+
+    index_path = args.index or args.directory / INDEX_NAME
+    index = open_index(index_path)
+    if index is None:
+        print(f"Error: no lyrics index at '{index_path}'. "
+              f"Run: python verse.py scan {args.directory}")
+        return 1
+
+    query = ' '.join(args.query)
+    limit = max(args.limit, args.play or 0)
+    with index:
+        start = time.perf_counter()
+        hits = index.search(query, limit=limit)
+        elapsed = time.perf_counter() - start
+
+    if not hits:
+        print(f"No matches for '{query}' ({elapsed * 1000:.1f} ms)")
+        return 1
+
+    if args.play is None:
+        shown = f"First {len(hits)}" if len(hits) == limit else str(len(hits))
+        print(f"{shown} matches for '{query}' ({elapsed * 1000:.1f} ms):")
+        for number, hit in enumerate(hits, 1):
+            minutes, seconds = divmod(hit.timestamp, 60)
+            print(f"{number:3d}. {Path(hit.song_path).stem}  "
+                  f"[{int(minutes):02d}:{seconds:05.2f}]  {hit.line_text}")
+        return 0
+
+    if not 1 <= args.play <= len(hits):
+        print(f"Error: --play must be between 1 and {len(hits)}")
+        return 1
+
+    from src.main import VersePlayer, check_dependencies
+    check_dependencies()
+    hit = hits[args.play - 1]
+    VersePlayer(hit.song_path, hit.lyrics_path, start_position=hit.timestamp,
+                keyboard_controls=True).start_playback()
+    return 0
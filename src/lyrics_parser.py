@@ -3,10 +3,86 @@ Lyrics Parser Module for Verse Music Player
 Handles parsing of LRC format lyric files and timestamp management.
 """
 
+from bisect import bisect_right
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import List, Optional
+from operator import itemgetter
+from typing import BinaryIO, Iterator, List, Optional, Tuple
 import re
 
+from src.compact_lyrics import CompactLyrics
+from src.lyrics_cache import LyricsCache
+
+# One LRC line: an [offset:] tag, or the first [mm:ss.xx] tag, any further
+# timestamp tags and the text
+_LRC_LINE = re.compile(
+    rb'^(?:\xef\xbb\xbf)?[ \t]*(?:'
+    rb'\[offset:[ \t]*([+-]?\d+)[ \t]*\]'
+    rb'|\[(\d+):(\d\d)(?:\.(\d{1,3}))?\][ \t]*'
+    rb'((?:\[\d+:\d\d(?:\.\d{1,3})?\][ \t]*)*)(.*)'
+    rb')',
+    re.MULTILINE | re.IGNORECASE)
+
+# A single [mm:ss], [mm:ss.x], [mm:ss.xx] or [mm:ss.xxx] timestamp tag
+_TIME_TAG = re.compile(rb'\[(\d+):(\d\d)(?:\.(\d{1,3}))?\]')
+
+# Divisor for 1, 2 and 3 digit fractional seconds
+_FRACTION_SCALE = (1.0, 10.0, 100.0, 1000.0)
+
+# Bytes read per chunk when streaming an LRC file
+_CHUNK_SIZE = 1 << 20
+
+# Seconds the words of the last line are spread over
+LAST_LINE_SECONDS = 4.0
+
+
+def _iter_line_chunks(file: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    """
+    Read a binary file in bulk chunks that always end on a line boundary.
+
+    Args:
+        file: File opened in binary mode
+        chunk_size: Number of bytes to read at a time
+
+    Yields:
+        Chunks of whole lines; only the last one may lack a trailing newline
+    """
+    remainder = b''
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            if remainder:
+                yield remainder
+            return
+
+        data = remainder + chunk
+        cut = data.rfind(b'\n') + 1
+        if cut == 0:
+            # No complete line yet, keep reading
+            remainder = data
+            continue
+
+        remainder = data[cut:]
+        yield data[:cut]
+
+
+def _warn_invalid_timestamps(data: bytes, first_line_number: int) -> None:
+    """
+    Print a warning for every line of a chunk with an out-of-range timestamp.
+
+    Args:
+        data: Chunk of whole LRC lines
+        first_line_number: Line number of the first line in the chunk
+    """
+    for match in _LRC_LINE.finditer(data):
+        line = match.group(0)
+        if not any(int(seconds) >= 60 for _, seconds, _ in _TIME_TAG.findall(line)):
+            continue
+        line_number = first_line_number + data.count(b'\n', 0, match.start())
+        print(
+            f"Warning: Invalid timestamp on line {line_number}: "
+            f"{line.decode('utf-8', 'replace').strip()}")
+
 
 @dataclass
 class LyricWord:
@@ -21,7 +97,7 @@ class LyricLine:
     """Data structure for storing timestamped lyric lines."""
     timestamp: float  # Time in seconds
     text: str        # Lyric text
-    words: List['LyricWord'] = None  # Optional word-level timing
+    words: Sequence = None  # Optional word-level timing, LyricWord items
 
     def __post_init__(self):
         """Validate the lyric line data after initialization."""
@@ -33,13 +109,187 @@ class LyricLine:
             self.words = []
 
 
+def _even_word_times(timestamp: float, text: str, duration: float) -> List[Tuple[float, str]]:
+    """
+    Spread the words of a line evenly over its duration.
+
+    Args:
+        timestamp: Timestamp of the line in seconds
+        text: Full line text
+        duration: Seconds until the next line
+
+    Returns:
+        (timestamp, text) pair of each word, in order
+    """
+    texts = text.split()
+    if not texts:
+        return []
+    time_per_word = duration / len(texts)
+    return [(timestamp + (word_index * time_per_word), word_text)
+            for word_index, word_text in enumerate(texts)]
+
+
+def _compact_timeline(entries: List[Tuple[float, str]]) -> CompactLyrics:
+    """
+    Pack sorted (timestamp, text) entries and their even word timing.
+
+    Args:
+        entries: Line entries sorted by timestamp
+
+    Returns:
+        CompactLyrics holding the same timeline LyricsParser builds from lines
+    """
+    lyrics = CompactLyrics()
+    last_index = len(entries) - 1
+    for i, (timestamp, text) in enumerate(entries):
+        duration = entries[i + 1][0] - timestamp if i < last_index else LAST_LINE_SECONDS
+        lyrics.append_line(timestamp, text, _even_word_times(timestamp, text, duration))
+    lyrics.freeze()
+    return lyrics
+
+
+class LineWords(Sequence):
+    """
+    Word-level timing of one parsed line, generated the first time it is used.
+
+    Parsing only records the line's timestamp and the time until the next
+    line; the line is split into LyricWord objects, spread evenly over that
+    time, on first access and kept for later ones. A song whose lines are
+    never shown costs one of these per line instead of one object per word.
+    """
+
+    __slots__ = ('_timestamp', '_text', '_duration', '_line_index', '_words')
+
+    def __init__(self, timestamp: float, text: str, duration: float, line_index: int):
+        """
+        Initialize the deferred timing.
+
+        Args:
+            timestamp: Timestamp of the line in seconds
+            text: Full line text
+            duration: Seconds over which the words are spread
+            line_index: Index of the line in the sorted timeline
+        """
+        self._timestamp = timestamp
+        self._text = text
+        self._duration = duration
+        self._line_index = line_index
+        self._words: Optional[List[LyricWord]] = None
+
+    def timed_texts(self) -> List[Tuple[float, str]]:
+        """
+        Get the (timestamp, text) pair of each word without creating words.
+
+        Returns:
+            One pair per word of the line, in order
+        """
+        if self._words is not None:
+            return [(word.timestamp, word.text) for word in self._words]
+
+        return _even_word_times(self._timestamp, self._text, self._duration)
+
+    def materialize(self) -> List[LyricWord]:
+        """
+        Create the line's words once and keep them.
+
+        Returns:
+            The line's LyricWord objects, the same list on every call
+        """
+        words = self._words
+        if words is None:
+            line_index = self._line_index
+            words = self._words = [
+                LyricWord(timestamp=timestamp, text=text, line_index=line_index)
+                for timestamp, text in self.timed_texts()]
+        return words
+
+    @property
+    def generated(self) -> bool:
+        """True once the words have been created."""
+        return self._words is not None
+
+    def __len__(self) -> int:
+        return len(self.materialize())
+
+    def __getitem__(self, index):
+        return self.materialize()[index]
+
+    def __iter__(self):
+        return iter(self.materialize())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LineWords):
+            other = other.materialize()
+        return self.materialize() == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self.materialize())
+
+
+def timed_words(line) -> List[Tuple[float, str]]:
+    """
+    Get the (timestamp, text) pair of each word of a line.
+
+    Deferred word timing is read without creating the LyricWord objects,
+    for callers that only scan the words once.
+
+    Args:
+        line: LyricLine, or a CompactLyrics line view
+
+    Returns:
+        One pair per word of the line, in order
+    """
+    words = line.words
+    if type(words) is LineWords:
+        return words.timed_texts()
+    return [(word.timestamp, word.text) for word in words]
+
+
+def _line_words(line) -> Sequence:
+    """Get a line's words, as the generated list for deferred timing."""
+    words = line.words
+    if type(words) is LineWords:
+        return words.materialize()
+    return words
+
+
+@dataclass
+class TimelineFrame:
+    """Snapshot of everything the display needs at one playback position."""
+    line_index: int                       # Current line, or -1 before the first line
+    word_count: int                       # Number of visible words in the current line
+    previous_text: Optional[str] = None   # Previous line (full text)
+    current_text: Optional[str] = None    # Visible words of the current line
+    next_text: Optional[str] = None       # Next line (full text)
+    line_text: Optional[str] = None       # Full text of the current line
+    word_time: Optional[float] = None     # Timestamp of the newest visible word
+
+
 class LyricsParser:
     """Parser for LRC format lyric files."""
 
-    def __init__(self):
-        """Initialize the lyrics parser."""
+    def __init__(self, compact: bool = False, cache: Optional[LyricsCache] = None):
+        """
+        Initialize the lyrics parser.
+
+        Args:
+            compact: If True, store parsed timelines as array-backed
+                CompactLyrics instead of LyricLine/LyricWord objects
+            cache: Optional on-disk cache of compiled timelines
+        """
+        self.compact = compact
+        self.cache = cache
         self.lyrics: List[LyricLine] = []
 
+        # Compiled timeline index (see _build_index)
+        self._indexed_lyrics: Optional[List[LyricLine]] = None
+        self._line_times: List[float] = []
+        self._word_times: Optional[List[float]] = None
+        self._word_offsets: Optional[List[int]] = None
+        self._line_word_times: List[Optional[List[float]]] = []
+
     def parse_lrc_file(self, file_path: str) -> List[LyricLine]:
         """
         Parse an LRC file and extract timestamp-lyric pairs.
@@ -48,56 +298,47 @@ class LyricsParser:
             file_path: Path to the LRC file
 
         Returns:
-            List of LyricLine objects sorted by timestamp
+            List of LyricLine objects sorted by timestamp (a CompactLyrics
+            sequence of line views in compact mode)
         """
-        lyrics = []
-
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                for line_number, line in enumerate(file, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    # Match LRC format: [mm:ss.xx]lyric text or [mm:ss]lyric text
-                    match = re.match(
-                        r'\[(\d{1,2}):(\d{2})(?:\.(\d{2}))?\](.*)', line)
-                    if match:
-                        try:
-                            minutes = int(match.group(1))
-                            seconds = int(match.group(2))
-                            centiseconds = int(match.group(
-                                3)) if match.group(3) else 0
-                            text = match.group(4).strip()
-
-                            # Validate timestamp components
-                            if seconds >= 60 or centiseconds >= 100:
-                                print(
-                                    f"Warning: Invalid timestamp on line {line_number}: {line}")
-                                continue
-
-                            # Convert to total seconds
-                            timestamp = minutes * 60 + seconds + centiseconds / 100.0
-
-                            # Skip empty lyrics but allow them for timing purposes
-                            lyrics.append(
-                                LyricLine(timestamp=timestamp, text=text))
-
-                        except (ValueError, TypeError) as e:
-                            print(
-                                f"Warning: Invalid timestamp on line {line_number}: {line}")
-                            continue
-                    else:
-                        # Skip non-lyric lines (metadata, etc.)
-                        continue
+            # Warm start: load the compiled timeline without parsing
+            cache_key = None
+            if self.cache is not None:
+                cache_key = self.cache.make_key(file_path)
+                cached = self.cache.load(cache_key)
+                if cached is not None:
+                    self.lyrics = cached if self.compact else cached.to_lines()
+                    self._build_index()
+                    return self.lyrics
+
+            # Stream the file as bytes; multi-timestamp lines come out as
+            # one entry per timestamp with [offset:] already applied
+            entries = []
+            with open(file_path, 'rb') as file:
+                for chunk_entries in self._iter_entries(file):
+                    entries += chunk_entries
 
             # Sort by timestamp for efficient lookup
-            lyrics.sort(key=lambda x: x.timestamp)
-
-            # Generate word-level timing automatically
-            self._generate_word_timing(lyrics)
+            entries.sort(key=itemgetter(0))
+
+            # Pack the timeline into array columns straight from the entries
+            # when requested, without creating a LyricLine per line
+            if self.compact or cache_key is not None:
+                compact_lyrics = _compact_timeline(entries)
+                if cache_key is not None:
+                    self.cache.store(cache_key, compact_lyrics)
+                if self.compact:
+                    lyrics = compact_lyrics
+
+            if not self.compact:
+                lyrics = [LyricLine(timestamp=timestamp, text=text)
+                          for timestamp, text in entries]
+                # Word-level timing, generated per line when first needed
+                self._generate_word_timing(lyrics)
 
             self.lyrics = lyrics
+            self._build_index()
             return lyrics
 
         except FileNotFoundError:
@@ -111,6 +352,156 @@ class LyricsParser:
         except Exception as e:
             raise ValueError(f"Error parsing LRC file {file_path}: {str(e)}")
 
+    def _iter_entries(self, file: BinaryIO, chunk_size: int = _CHUNK_SIZE) -> Iterator[List[Tuple[float, str]]]:
+        """
+        Stream (timestamp, text) entries out of an LRC file.
+
+        The file is read in bulk chunks cut at line boundaries and each chunk
+        is scanned with one precompiled pattern, so memory stays bounded by
+        the chunk size even for very large or concatenated LRC files. Lines
+        with several timestamps yield one entry per timestamp, and an
+        ``[offset:ms]`` tag shifts every entry after it.
+
+        Args:
+            file: LRC file opened in binary mode
+            chunk_size: Number of bytes to read at a time
+
+        Yields:
+            Lists of (timestamp in seconds, stripped lyric text), one per chunk
+        """
+        offset = 0.0
+        line_number = 1
+
+        for data in _iter_line_chunks(file, chunk_size):
+            entries = []
+            has_invalid = False
+
+            for offset_tag, minutes, seconds, fraction, more_tags, text in _LRC_LINE.findall(data):
+                if offset_tag:
+                    # Positive offsets make lyrics appear sooner
+                    offset = int(offset_tag) / 1000.0
+                    continue
+
+                text = text.decode('utf-8').strip()
+
+                # Most lines carry a single timestamp, captured by _LRC_LINE
+                if more_tags:
+                    tags = [(minutes, seconds, fraction)] + _TIME_TAG.findall(more_tags)
+                else:
+                    tags = ((minutes, seconds, fraction),)
+
+                for minutes, seconds, fraction in tags:
+                    seconds = int(seconds)
+
+                    # Validate timestamp components
+                    if seconds >= 60:
+                        has_invalid = True
+                        continue
+
+                    # Convert to total seconds
+                    timestamp = int(minutes) * 60 + seconds
+                    if fraction:
+                        timestamp += int(fraction) / _FRACTION_SCALE[len(fraction)]
+                    if offset:
+                        timestamp = max(0.0, timestamp - offset)
+
+                    entries.append((timestamp, text))
+
+            if has_invalid:
+                _warn_invalid_timestamps(data, line_number)
+
+            yield entries
+            line_number += data.count(b'\n')
+
+    def _build_index(self) -> None:
+        """
+        Compile the timeline index used by the timestamp lookups.
+
+        Line timestamps are kept in one sorted array, so every lookup is a
+        bisect instead of a scan over ``self.lyrics``. Compact timelines
+        also store their word timestamps in one flat array, with
+        ``_word_offsets[i]:_word_offsets[i + 1]`` delimiting the words of
+        line ``i``. For LyricLine lists the word timestamps of a line are
+        collected the first time a lookup reaches it (see _word_span), so
+        lines that are never shown keep their words ungenerated.
+        """
+        # Compact timelines already store exactly these columns
+        if isinstance(self.lyrics, CompactLyrics):
+            self._line_times = self.lyrics.line_times
+            self._word_times = self.lyrics.word_times
+            self._word_offsets = self.lyrics.word_offsets
+            self._line_word_times = []
+            self._indexed_lyrics = self.lyrics
+            return
+
+        self._line_times = [lyric_line.timestamp for lyric_line in self.lyrics]
+        self._word_times = None
+        self._word_offsets = None
+        self._line_word_times = [None] * len(self.lyrics)
+        self._indexed_lyrics = self.lyrics
+
+    def _word_span(self, line_index: int) -> Tuple[List[float], int, int]:
+        """
+        Find the word timestamps of a line.
+
+        Args:
+            line_index: Index of the line in ``self.lyrics``
+
+        Returns:
+            (timestamps, start, end), the line's words being
+            ``timestamps[start:end]``
+        """
+        if self._word_offsets is not None:
+            return (self._word_times, self._word_offsets[line_index],
+                    self._word_offsets[line_index + 1])
+
+        word_times = self._line_word_times[line_index]
+        if word_times is None:
+            word_times = [word.timestamp for word in self.lyrics[line_index].words]
+            self._line_word_times[line_index] = word_times
+        return word_times, 0, len(word_times)
+
+    def rebuild_index(self) -> None:
+        """
+        Rebuild the timeline index after ``self.lyrics`` was modified in place.
+
+        Assigning a new list to ``self.lyrics`` is detected automatically;
+        only in-place edits of the existing list need this call.
+        """
+        self._build_index()
+
+    def _ensure_index(self) -> None:
+        """Rebuild the timeline index if ``self.lyrics`` was replaced."""
+        if self._indexed_lyrics is not self.lyrics:
+            self._build_index()
+
+    def _line_index_at(self, timestamp: float) -> int:
+        """
+        Find the index of the last line starting at or before a timestamp.
+
+        Args:
+            timestamp: Current playback time in seconds
+
+        Returns:
+            Index of current line, or -1 if no line has started yet
+        """
+        self._ensure_index()
+        return bisect_right(self._line_times, timestamp) - 1
+
+    def _visible_word_count(self, line_index: int, timestamp: float) -> int:
+        """
+        Count the words of a line whose timestamp has been reached.
+
+        Args:
+            line_index: Index of the line in ``self.lyrics``
+            timestamp: Current playback time in seconds
+
+        Returns:
+            Number of leading words of the line that should be visible
+        """
+        word_times, start, end = self._word_span(line_index)
+        return bisect_right(word_times, timestamp, start, end) - start
+
     def get_current_lyric(self, timestamp: float) -> Optional[str]:
         """
         Get the current lyric line for a given timestamp.
@@ -124,16 +515,11 @@ class LyricsParser:
         if not self.lyrics:
             return None
 
-        # Find the most recent lyric line that should be displayed
-        current_lyric = None
-        for lyric_line in self.lyrics:
-            if lyric_line.timestamp <= timestamp:
-                current_lyric = lyric_line.text
-            else:
-                # Since lyrics are sorted, we can break early
-                break
+        current_line_index = self._line_index_at(timestamp)
+        if current_line_index < 0:
+            return None
 
-        return current_lyric
+        return self.lyrics[current_line_index].text
 
     def get_current_words(self, timestamp: float) -> Optional[str]:
         """
@@ -149,94 +535,47 @@ class LyricsParser:
         if not self.lyrics:
             return None
 
-        # Find which line we're currently in
-        current_line_index = -1
-        for i, lyric_line in enumerate(self.lyrics):
-            if lyric_line.timestamp <= timestamp:
-                current_line_index = i
-            else:
-                break
-
+        current_line_index = self._line_index_at(timestamp)
         if current_line_index < 0:
             return None
 
         current_line = self.lyrics[current_line_index]
+        words = _line_words(current_line)
 
         # If no word-level timing, return full line
-        if not current_line.words:
+        if not words:
             return current_line.text
 
         # Build string of words that should be visible
-        visible_words = []
-        for word in current_line.words:
-            if word.timestamp <= timestamp:
-                visible_words.append(word.text)
-            else:
-                break
-
-        return ' '.join(visible_words) if visible_words else None
-
-        # Find which line we're currently in
-        current_line_index = -1
-        for i, lyric_line in enumerate(self.lyrics):
-            if lyric_line.timestamp <= timestamp:
-                current_line_index = i
-            else:
-                break
-
-        if current_line_index < 0:
+        visible_count = self._visible_word_count(current_line_index, timestamp)
+        if visible_count <= 0:
             return None
 
-        current_line = self.lyrics[current_line_index]
-
-        # If no word-level timing, return full line
-        if not current_line.words:
-            return current_line.text
-
-        # Build string of words that should be visible
-        visible_words = []
-        for word in current_line.words:
-            if word.timestamp <= timestamp:
-                visible_words.append(word.text)
-            else:
-                break
-
-        return ' '.join(visible_words) if visible_words else None
+        return ' '.join(word.text for word in words[:visible_count])
 
     def _generate_word_timing(self, lyrics: List[LyricLine]) -> None:
         """
         Automatically generate word-level timing for each line.
         Distributes words evenly across the duration until the next line.
 
+        Each line gets a LineWords sequence; its words are only created
+        when the line is first looked up, displayed or iterated.
+
         Args:
             lyrics: List of lyric lines to process
         """
+        last_index = len(lyrics) - 1
         for i, line in enumerate(lyrics):
             if not line.text:
                 continue
 
-            # Split line into words
-            words = line.text.split()
-            if not words:
-                continue
-
             # Calculate duration until next line (or default 4 seconds)
-            if i < len(lyrics) - 1:
+            if i < last_index:
                 duration = lyrics[i + 1].timestamp - line.timestamp
             else:
-                duration = 4.0  # Default duration for last line
-
-            # Distribute words evenly across the duration
-            time_per_word = duration / len(words)
+                duration = LAST_LINE_SECONDS
 
-            line.words = []
-            for word_index, word in enumerate(words):
-                word_timestamp = line.timestamp + (word_index * time_per_word)
-                line.words.append(LyricWord(
-                    timestamp=word_timestamp,
-                    text=word,
-                    line_index=i
-                ))
+            line.words = LineWords(line.timestamp, line.text, duration, i)
 
     def get_current_word_only(self, timestamp: float) -> Optional[str]:
         """
@@ -252,32 +591,23 @@ class LyricsParser:
         if not self.lyrics:
             return None
 
-        # Find which line we're currently in
-        current_line_index = -1
-        for i, lyric_line in enumerate(self.lyrics):
-            if lyric_line.timestamp <= timestamp:
-                current_line_index = i
-            else:
-                break
-
+        current_line_index = self._line_index_at(timestamp)
         if current_line_index < 0:
             return None
 
         current_line = self.lyrics[current_line_index]
+        words = _line_words(current_line)
 
         # If no word-level timing, return full line
-        if not current_line.words:
+        if not words:
             return current_line.text
 
         # Find the current word only (not accumulated)
-        current_word = None
-        for word in current_line.words:
-            if word.timestamp <= timestamp:
-                current_word = word.text
-            else:
-                break
+        visible_count = self._visible_word_count(current_line_index, timestamp)
+        if visible_count <= 0:
+            return None
 
-        return current_word
+        return words[visible_count - 1].text
 
     def get_current_line_index(self, timestamp: float) -> int:
         """
@@ -293,14 +623,7 @@ class LyricsParser:
         if not self.lyrics:
             return -1
 
-        current_line_index = -1
-        for i, lyric_line in enumerate(self.lyrics):
-            if lyric_line.timestamp <= timestamp:
-                current_line_index = i
-            else:
-                break
-
-        return current_line_index
+        return self._line_index_at(timestamp)
 
     def get_context_lyrics(self, timestamp: float) -> tuple[Optional[str], Optional[str], Optional[str]]:
         """
@@ -334,3 +657,170 @@ class LyricsParser:
             next_lyric = self.lyrics[current_index + 1].text
 
         return previous_lyric, current_lyric, next_lyric
+
+    def cursor(self) -> 'TimelineCursor':
+        """
+        Create a playback cursor over the parsed timeline.
+
+        Returns:
+            A TimelineCursor positioned before the first line
+        """
+        return TimelineCursor(self)
+
+
+class TimelineCursor:
+    """
+    Stateful playback cursor over a LyricsParser timeline.
+
+    The cursor remembers the current line and word and steps forward from
+    there as playback time advances, so consecutive ticks cost amortized
+    O(1). Backward jumps and forward jumps longer than ``MAX_LINEAR_STEPS``
+    fall back to a binary search over the parser's timeline index.
+    """
+
+    # Forward steps to try before falling back to a binary search
+    MAX_LINEAR_STEPS = 8
+
+    def __init__(self, parser: LyricsParser):
+        """
+        Initialize the cursor.
+
+        Args:
+            parser: Parser whose timeline the cursor walks
+        """
+        self._parser = parser
+        self._line_times: Optional[List[float]] = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Move the cursor back before the first line."""
+        self.line_index: int = -1
+        self.word_count: int = 0
+        self._position: float = float('-inf')
+        self._frame = TimelineFrame(line_index=-1, word_count=0)
+
+    def advance(self, timestamp: float) -> TimelineFrame:
+        """
+        Move the cursor to a playback position.
+
+        Args:
+            timestamp: Current playback time in seconds
+
+        Returns:
+            TimelineFrame for the position; the previous frame object is
+            returned unchanged if neither the line nor the word moved
+        """
+        parser = self._parser
+        parser._ensure_index()
+
+        # The timeline was re-parsed or replaced under us
+        if self._line_times is not parser._line_times:
+            self._line_times = parser._line_times
+            self.reset()
+
+        if timestamp < self._position:
+            line_index = parser._line_index_at(timestamp)
+        else:
+            line_index = self._step_line(timestamp)
+
+        if line_index != self.line_index:
+            word_count = parser._visible_word_count(
+                line_index, timestamp) if line_index >= 0 else 0
+        elif timestamp < self._position:
+            word_count = parser._visible_word_count(
+                line_index, timestamp) if line_index >= 0 else 0
+        else:
+            word_count = self._step_word(line_index, timestamp)
+
+        self._position = timestamp
+        if line_index != self.line_index or word_count != self.word_count:
+            self.line_index = line_index
+            self.word_count = word_count
+            self._frame = self._build_frame(line_index, word_count)
+
+        return self._frame
+
+    def next_event_time(self) -> Optional[float]:
+        """
+        Get the timestamp of the next word or line boundary after the cursor.
+
+        Returns:
+            Playback time in seconds of the next visible change, or None if
+            the cursor is past the last word of the last line
+        """
+        parser = self._parser
+        line_times = parser._line_times
+        next_event = None
+
+        # Start of the next line
+        if self.line_index + 1 < len(line_times):
+            next_event = line_times[self.line_index + 1]
+
+        # Next word of the current line
+        if self.line_index >= 0:
+            word_times, start, end = parser._word_span(self.line_index)
+            position = start + self.word_count
+            if position < end:
+                word_time = word_times[position]
+                if next_event is None or word_time < next_event:
+                    next_event = word_time
+
+        return next_event
+
+    def _step_line(self, timestamp: float) -> int:
+        """Walk forward to the line active at ``timestamp``."""
+        line_times = self._line_times
+        line_index = self.line_index
+        last_index = len(line_times) - 1
+
+        for _ in range(self.MAX_LINEAR_STEPS):
+            if line_index >= last_index or line_times[line_index + 1] > timestamp:
+                return line_index
+            line_index += 1
+
+        # Large forward jump, search the remaining lines
+        return bisect_right(line_times, timestamp, line_index) - 1
+
+    def _step_word(self, line_index: int, timestamp: float) -> int:
+        """Walk forward to the number of visible words at ``timestamp``."""
+        if line_index < 0:
+            return 0
+
+        word_times, start, end = self._parser._word_span(line_index)
+        position = start + self.word_count
+
+        for _ in range(self.MAX_LINEAR_STEPS):
+            if position >= end or word_times[position] > timestamp:
+                return position - start
+            position += 1
+
+        return bisect_right(word_times, timestamp, position, end) - start
+
+    def _build_frame(self, line_index: int, word_count: int) -> TimelineFrame:
+        """Assemble the display texts for a line and visible word count."""
+        if line_index < 0:
+            return TimelineFrame(line_index=-1, word_count=0)
+
+        lyrics = self._parser.lyrics
+        current_line = lyrics[line_index]
+        words = _line_words(current_line)
+
+        # Same rules as get_current_words: full text without word timing
+        word_time = None
+        if not words:
+            current_text = current_line.text
+        elif word_count > 0:
+            current_text = ' '.join(word.text for word in words[:word_count])
+            word_time = words[word_count - 1].timestamp
+        else:
+            current_text = None
+
+        return TimelineFrame(
+            line_index=line_index,
+            word_count=word_count,
+            previous_text=lyrics[line_index - 1].text if line_index > 0 else None,
+            current_text=current_text,
+            next_text=lyrics[line_index + 1].text if line_index < len(lyrics) - 1 else None,
+            line_text=current_line.text,
+            word_time=word_time,
+        )
@@ -4,8 +4,8 @@ Main orchestrator module for the Verse music player application.
 """
 
 import sys
-import time
 import os
+import threading
 from dataclasses import dataclass
 from typing import Optional
 from pathlib import Path
@@ -19,30 +19,113 @@ class PlaybackState:
     is_playing: bool = False
     lyrics_loaded: bool = False
     audio_loaded: bool = False
+    interrupted: bool = False
+
+
+@dataclass
+class DisplayState:
+    """What the sync loop last put on screen for one timeline."""
+    cursor: object                    # TimelineCursor over the playing song
+    line_index: int = -1              # Line on screen, -1 before the first
+    lyric: Optional[str] = None       # Visible words on screen
+    progress_tick: int = -1           # Progress bar tick on screen
+    redraw: bool = False              # Next frame redraws every row
+    frames: object = None             # PrerenderedFrames of the song, if any
+    table: object = None              # FrameTable the line is drawn from
+    table_next: int = 0               # Next table frame to write
+    layout: Optional[int] = None      # Display layout generation on screen
+    levels: Optional[int] = None      # Spectrum frame on screen, None if none
+
+    def reset(self) -> None:
+        """Forget the screen contents so the next frame redraws everything."""
+        self.line_index = -1
+        self.lyric = None
+        self.progress_tick = -1
+        self.redraw = True
 
 
 class VersePlayer:
     """Main orchestrator class for the Verse music player."""
 
-    def __init__(self, song_path: str, lyrics_path: str):
-        """Initialize the Verse player with song and lyrics file paths."""
+    def __init__(
+        self,
+        song_path: str,
+        lyrics_path: str,
+        audio_player=None,
+        lyrics_parser=None,
+        display=None,
+        clock=None,
+        telemetry=None,
+        start_position: float = 0.0,
+        keyboard_controls: bool = False,
+        prerender: bool = False,
+        align_words: bool = False,
+        visualizer: bool = False,
+        cache_lyrics: bool = False
+    ):
+        """
+        Initialize the Verse player with song and lyrics file paths.
+
+        Components default to the real ones; passing replacements (see
+        src/simulation.py) lets the player run headless on a virtual clock.
+
+        Args:
+            song_path: Path to the MP3/WAV audio file
+            lyrics_path: Path to the LRC lyrics file
+            audio_player: Audio backend, defaults to a pygame AudioPlayer
+                created while the song header is on screen
+            lyrics_parser: Lyrics parser, defaults to a cached compact parser
+            display: Lyric display, defaults to a terminal LyricDisplay
+            clock: Object with now() and sleep(), defaults to the system clock
+            telemetry: Optional SyncTelemetry that records per-tick timings
+            start_position: Song position in seconds to start playing from
+            keyboard_controls: Run playback on the asyncio core with pause,
+                seek and quit keys (see src/async_player.py)
+            prerender: Render every lyric frame ahead of time in a worker
+                thread while the header is shown (see src/frame_table.py)
+            align_words: Move word timestamps onto onsets in the song's WAV
+                audio after parsing (see src/word_alignment.py)
+            visualizer: Show a spectrum strip above the progress bar,
+                computed in a worker thread (see src/visualizer.py)
+            cache_lyrics: Keep parsed lyrics in the on-disk cache so warm
+                starts skip parsing (see src/lyrics_cache.py)
+        """
         self.song_path = Path(song_path)
         self.lyrics_path = Path(lyrics_path)
         self.state = PlaybackState()
 
         # Import components here to avoid circular imports
-        from src.player import AudioPlayer
         from src.lyrics_parser import LyricsParser
+        from src.lyrics_cache import LyricsCache
         from src.display import LyricDisplay
-
-        # Initialize components
-        self.audio_player = AudioPlayer()
-        self.lyrics_parser = LyricsParser()
-        self.display = LyricDisplay()
+        from src.scheduler import DeadlineScheduler, SystemClock
+
+        # Initialize components; the default audio player is created by the
+        # background loader so importing pygame does not delay the header
+        self.audio_player = audio_player
+        self.lyrics_parser = lyrics_parser or LyricsParser(
+            compact=True, cache=LyricsCache() if cache_lyrics else None)
+        self.display = display or LyricDisplay()
+        self.clock = clock or SystemClock()
+        self.scheduler = DeadlineScheduler(sleep=self.clock.sleep)
+        self.telemetry = telemetry
+        self.start_position = start_position
+        self.keyboard_controls = keyboard_controls
+        self.prerender = prerender
+        self.align_words = align_words
+        self.visualizer = visualizer
+        self.frame_tables = None
+        self.spectrum = None
+
+        # Wakes the loop that renders; the asyncio core replaces it
+        self._wake_render = self.clock.wake
 
         # Track last displayed lyric to avoid redundant updates
         self.last_displayed_lyric: Optional[str] = None
 
+        # Set by seek() so the sync loop redraws at the new position
+        self._seek_pending: bool = False
+
     def _validate_files(self) -> bool:
         """
         Comprehensive file validation and error handling.
@@ -96,40 +179,69 @@ class VersePlayer:
 
         return True
 
-    def _load_files(self) -> bool:
+    def _load_audio(self) -> Optional[str]:
         """
-        Load audio and lyrics files with error handling.
+        Create the audio player if needed and load the song.
 
         Returns:
-            True if both files loaded successfully, False otherwise
+            None on success, otherwise the error message to show
         """
         try:
-            # Load audio file
+            if self.audio_player is None:
+                from src.player import AudioPlayer
+                self.audio_player = AudioPlayer()
+
             if not self.audio_player.load_song(str(self.song_path)):
-                self.display.show_error(
-                    f"Failed to load audio file '{self.song_path}'. File may be corrupted or in an unsupported format")
-                return False
+                return f"Failed to load audio file '{self.song_path}'. File may be corrupted or in an unsupported format"
             self.state.audio_loaded = True
+            return None
+
+        except Exception as e:
+            return f"Unexpected error loading files: {str(e)}"
+
+    def _load_files(self) -> bool:
+        """
+        Load audio and lyrics files with error handling.
+
+        The audio loads in a background thread while the lyrics are parsed,
+        and both are awaited before playback starts.
+
+        Returns:
+            True if both files loaded successfully, False otherwise
+        """
+        audio_result: list = []
+        audio_loader = threading.Thread(
+            target=lambda: audio_result.append(self._load_audio()),
+            name="verse-audio-loader", daemon=True)
+        audio_loader.start()
 
+        try:
             # Load lyrics file
             self.lyrics_parser.parse_lrc_file(str(self.lyrics_path))
+            self._align_word_timing(self.lyrics_parser, self.lyrics_path, self.song_path)
             self.state.lyrics_loaded = True
-
-            return True
+            lyrics_error = None
+            self._start_frame_tables(self.display.song_duration)
 
         except FileNotFoundError as e:
-            self.display.show_error(f"File not found: {str(e)}")
-            return False
+            lyrics_error = f"File not found: {str(e)}"
         except PermissionError as e:
-            self.display.show_error(f"Permission denied: {str(e)}")
-            return False
+            lyrics_error = f"Permission denied: {str(e)}"
         except ValueError as e:
-            self.display.show_error(f"Invalid file format: {str(e)}")
-            return False
+            lyrics_error = f"Invalid file format: {str(e)}"
         except Exception as e:
-            self.display.show_error(
-                f"Unexpected error loading files: {str(e)}")
+            lyrics_error = f"Unexpected error loading files: {str(e)}"
+
+        # Ready signal: the loader finishes once the song is loaded
+        audio_loader.join()
+        audio_error = audio_result[0] if audio_result else None
+
+        # Report audio problems first, as the sequential loader did
+        error = audio_error or lyrics_error
+        if error:
+            self.display.show_error(error)
             return False
+        return True
 
     def start_playback(self) -> None:
         """Begin synchronized playback of audio and lyrics."""
@@ -137,27 +249,86 @@ class VersePlayer:
         if not self._validate_files():
             return
 
+        # Show the header right away and load while it is on screen
+        from src.audio_probe import probe_duration
+        self._show_header(probe_duration(str(self.song_path)))
+
         # Load files
         if not self._load_files():
             return
 
-        try:
-            # Extract song name from file path
-            song_name = self.song_path.stem.replace(
-                '_', ' ').replace('-', ' ').title()
+        self._play_loaded()
 
-            # Get song duration
-            duration = self.audio_player.get_duration()
+    def _align_word_timing(self, lyrics_parser, lyrics_path: Path, song_path: Path) -> None:
+        """
+        Align a parsed song's word timing to its audio if enabled.
+
+        Songs that cannot be aligned keep their evenly spread word timing.
 
-            # Show song header with duration
-            self.display.show_song_header(song_name, duration)
+        Args:
+            lyrics_parser: Parser holding the song's timeline
+            lyrics_path: Path to the song's LRC file
+            song_path: Path to the song's audio file
+        """
+        if not self.align_words:
+            return
+        from src.word_alignment import align_parsed_lyrics
+        align_parsed_lyrics(lyrics_parser, str(lyrics_path), str(song_path))
 
-            # Wait a moment for user to see the header
-            import time
-            time.sleep(2)
+    def _start_frame_tables(self, duration: float) -> None:
+        """
+        Start pre-rendering the parsed song's frames if enabled.
+
+        Args:
+            duration: Song length in seconds for the progress bar
+        """
+        self.frame_tables = None
+        if not self.prerender:
+            return
+        from src.frame_table import PrerenderedFrames
+        self.frame_tables = PrerenderedFrames(
+            self.lyrics_parser, self.display.console.color_system,
+            self.scheduler.progress_interval)
+        self.frame_tables.build(self.display.terminal_width, duration)
+
+    def _start_visualizer(self) -> None:
+        """Start the spectrum analyzer of the current song if enabled."""
+        if self.spectrum is not None:
+            self.spectrum.stop()
+            self.spectrum = None
+        if not self.visualizer:
+            return
+        from src.visualizer import SpectrumAnalyzer
+        self.spectrum = SpectrumAnalyzer(str(self.song_path), self.clock,
+                                         on_frame=lambda: self._wake_render())
+        self.spectrum.start()
+
+    def _show_header(self, duration: float) -> None:
+        """
+        Show the song header.
+
+        Args:
+            duration: Song duration in seconds, 0.0 if unknown
+        """
+        self.display.show_song_header(self._song_name(), duration)
+
+    def _song_name(self) -> str:
+        """Song name for display, taken from the file name."""
+        return self.song_path.stem.replace('_', ' ').replace('-', ' ').title()
+
+    def _play_loaded(self) -> None:
+        """Play the loaded audio with lyrics once the header is shown."""
+        try:
+            # The loaded song may know its duration better than the probe
+            duration = self.audio_player.get_duration()
+            if duration > 0:
+                self.display.song_duration = duration
+
+            # The spectrum worker starts with playback
+            self._start_visualizer()
 
             # Start audio playback
-            self.audio_player.play()
+            self.audio_player.play(start=self.start_position)
             self.state.is_playing = True
 
             # Start synchronization loop
@@ -165,6 +336,7 @@ class VersePlayer:
 
         except KeyboardInterrupt:
             # Handle Ctrl+C gracefully
+            self.state.interrupted = True
             self.display.clear_display()
             self.display.show_error("Playback interrupted by user")
             self.audio_player.stop()
@@ -175,47 +347,12 @@ class VersePlayer:
     def _sync_loop(self) -> None:
         """Main synchronization loop for coordinating audio and lyrics."""
         try:
-            current_line_index = -1
-            last_displayed_lyric = None
-
-            while self.audio_player.is_playing():
-                # Get current playback position
-                current_time = self.audio_player.get_position()
-                self.state.current_position = current_time
-
-                # Get current line index to detect line changes
-                new_line_index = self.lyrics_parser.get_current_line_index(
-                    current_time)
-
-                # Get context lyrics (previous, current, next)
-                prev_lyric, current_lyric, next_lyric = self.lyrics_parser.get_context_lyrics(
-                    current_time)
-
-                # Detect if we moved to a new line
-                line_changed = new_line_index != current_line_index and new_line_index >= 0
-
-                # Update display if current lyric changed (word-by-word) or line changed
-                if current_lyric != last_displayed_lyric or line_changed:
-                    if current_lyric:
-                        # Show lyric with context and progress bar
-                        self.display.show_lyric_with_context(
-                            current_text=current_lyric,
-                            previous_text=prev_lyric,
-                            next_text=next_lyric,
-                            current_time=current_time,
-                            clear_screen=line_changed
-                        )
-                        last_displayed_lyric = current_lyric
-                    else:
-                        # Clear display if no lyric should be shown
-                        self.display.clear_display()
-                        last_displayed_lyric = None
-
-                    current_line_index = new_line_index
-                    self.state.current_lyric = current_lyric
-
-                # Sleep for 50ms for smoother updates
-                time.sleep(0.05)
+            if self.keyboard_controls:
+                # Imported here so asyncio does not delay the song header
+                from src.async_player import AsyncPlaybackCore
+                AsyncPlaybackCore(self).run()
+            else:
+                self._poll_loop()
 
             # Playback finished
             self.state.is_playing = False
@@ -225,42 +362,394 @@ class VersePlayer:
             self.display.show_error(f"Synchronization error: {str(e)}")
             self.audio_player.stop()
             self.state.is_playing = False
+        finally:
+            if self.spectrum is not None:
+                self.spectrum.stop()
+
+    def pause(self) -> None:
+        """Pause playback; may be called from any thread."""
+        self.audio_player.pause()
+        self.clock.wake()
+
+    def resume(self) -> None:
+        """Resume paused playback; may be called from any thread."""
+        self.audio_player.resume()
+        self.clock.wake()
+
+    def seek(self, position: float) -> float:
+        """
+        Jump to a song position; may be called from any thread.
+
+        The sync loop wakes up at once and redraws the screen at the new
+        position with its next frame.
+
+        Args:
+            position: Song position in seconds
+
+        Returns:
+            The position playback continues from
+        """
+        position = self.audio_player.seek(position)
+        self._seek_pending = True
+        self.clock.wake()
+        return position
+
+    def seek_by(self, offset: float) -> float:
+        """
+        Jump forward or back from the current position.
+
+        Args:
+            offset: Seconds to skip, negative to go back
+
+        Returns:
+            The position playback continues from
+        """
+        return self.seek(self.audio_player.get_position() + offset)
+
+    def _poll_loop(self) -> None:
+        """Render and sleep on this thread until the song ends."""
+        view = DisplayState(cursor=self.lyrics_parser.cursor(), frames=self.frame_tables)
+
+        while self.audio_player.is_playing():
+            # Get current playback position
+            current_time = self.audio_player.get_position()
+            self.state.current_position = current_time
+
+            # Follow a gapless switch to the next song's timeline
+            next_cursor = self._next_track_cursor()
+            if next_cursor is not None:
+                view = DisplayState(cursor=next_cursor, frames=self.frame_tables)
+
+            # After a seek the cursor finds the new line by binary search;
+            # the reset view makes this frame redraw every row
+            if self._seek_pending:
+                self._seek_pending = False
+                view.reset()
+
+            next_event = self._render_frame(view, current_time)
+
+            if self.audio_player.paused:
+                # Nothing moves until resume() or seek() wakes the loop
+                self.clock.sleep(None)
+            else:
+                # Sleep until the next word, line or progress tick is due
+                self.scheduler.sleep_until(current_time, next_event)
+
+    def _render_frame(self, view: 'DisplayState', current_time: float) -> Optional[float]:
+        """
+        Bring the screen up to date with a playback position.
+
+        Args:
+            view: What is on screen, updated in place
+            current_time: Playback position in seconds
+
+        Returns:
+            Playback time of the next word, line or held-back frame, or None
+            if nothing is left to show
+        """
+        telemetry = self.telemetry
+        if telemetry is not None:
+            tick_start = telemetry.clock()
+
+        # A terminal resize invalidated the layouts: redraw everything
+        layout = self.display.layout_generation
+        if layout != view.layout:
+            if view.layout is not None:
+                view.reset()
+            view.layout = layout
+
+        # Advance the cursor to get the line index and context
+        # lyrics (previous, current, next) in one step
+        frame = view.cursor.advance(current_time)
+        new_line_index = frame.line_index
+        prev_lyric = frame.previous_text
+        current_lyric = frame.current_text
+        next_lyric = frame.next_text
+
+        if telemetry is not None:
+            render_start = telemetry.clock()
+            word_changed = current_lyric != view.lyric
+
+        # Detect if we moved to a new line, or a reset view needs all rows
+        line_changed = ((new_line_index != view.line_index or view.redraw)
+                        and new_line_index >= 0)
+
+        # Detect if the progress bar time display moved on
+        progress_tick = int(
+            current_time // self.scheduler.progress_interval)
+        progress_changed = progress_tick != view.progress_tick and view.lyric is not None
+
+        # Update display if current lyric changed (word-by-word), line changed
+        # or the progress bar needs a tick
+        needs_redraw = (current_lyric != view.lyric or line_changed
+                        or progress_changed or view.redraw)
+        if needs_redraw:
+            if current_lyric:
+                if not self._show_prerendered(view, new_line_index, current_time, line_changed):
+                    # Show lyric with context and progress bar
+                    self.display.show_lyric_with_context(
+                        current_text=current_lyric,
+                        previous_text=prev_lyric,
+                        next_text=next_lyric,
+                        current_time=current_time,
+                        clear_screen=line_changed,
+                        line_text=frame.line_text,
+                        word_count=frame.word_count
+                    )
+                view.lyric = current_lyric
+                view.progress_tick = progress_tick
+                if line_changed:
+                    # The new line's rows erased the spectrum strip
+                    view.levels = None
+            else:
+                # Clear display if no lyric should be shown
+                self.display.clear_display()
+                view.lyric = None
+
+            view.line_index = new_line_index
+            view.redraw = False
+            self.state.current_lyric = current_lyric
+
+        if self.spectrum is not None:
+            self._show_levels(view, current_time)
+
+        # Write a frame held back by the display's frame-rate cap,
+        # and wake up again when it is due if it still has to wait
+        next_event = view.cursor.next_event_time()
+        pending_delay = self.display.flush_pending()
+        if pending_delay is not None:
+            pending_at = current_time + pending_delay
+            if next_event is None or pending_at < next_event:
+                next_event = pending_at
+
+        if telemetry is not None:
+            self._record_tick(telemetry, tick_start, render_start, current_time,
+                              frame, word_changed, needs_redraw)
+        return next_event
+
+    def _show_levels(self, view: 'DisplayState', current_time: float) -> None:
+        """
+        Draw the newest spectrum strip after the lyrics are up to date.
+
+        Only reads the strip the analyzer's worker already published, so a
+        slow or busy worker never holds back a lyric frame.
+
+        Args:
+            view: What is on screen, updated in place
+            current_time: Playback position in seconds
+        """
+        spectrum = self.spectrum
+        spectrum.follow(current_time, self.clock.now(), not self.audio_player.paused)
+        latest = spectrum.latest()
+        if latest is None or view.lyric is None or latest[0] == view.levels:
+            return
+
+        draw_start = self.clock.now()
+        self.display.show_levels(latest[1])
+        spectrum.record_draw(latest[0], self.clock.now() - draw_start)
+        view.levels = latest[0]
+
+    def _show_prerendered(self, view: 'DisplayState', line_index: int,
+                          current_time: float, new_line: bool) -> bool:
+        """
+        Write the frames due up to a position from the song's frame table.
+
+        A line is drawn from the table only if it was started from it: at
+        a new line the table is looked up again, which also notices a
+        resized terminal and has the table rebuilt for the new width.
+
+        Args:
+            view: What is on screen, updated in place
+            line_index: Line at the position
+            current_time: Playback position in seconds
+            new_line: The line changed or the screen needs a full redraw
+
+        Returns:
+            True if the frames were written, False to render live instead
+        """
+        if view.frames is None:
+            return False
+
+        if new_line:
+            view.table = view.frames.table(self.display.terminal_width,
+                                           self.display.song_duration)
+            view.table_next = view.table.keyframe(line_index) if view.table else -1
+        table = view.table
+        if table is None or view.table_next < 0:
+            return False
+
+        last = table.frame_at(current_time)
+        if last < view.table_next or table.lines[last] != line_index:
+            # Past the end of the table; live rendering takes over the line
+            view.table = None
+            return False
+
+        self.display.show_prerendered(table.span(view.table_next, last), new_line,
+                                      table.rows[line_index], table.bar_rows[line_index])
+        view.table_next = last + 1
+        return True
+
+    def _next_track_cursor(self):
+        """
+        Hook for playlists, called once per sync loop tick.
+
+        Returns:
+            A cursor over the next song's lyrics once that song has started
+            playing, otherwise None; a single song never switches
+        """
+        duration = self._poll_next_track()
+        return self._switch_track(duration) if duration is not None else None
+
+    def _poll_next_track(self) -> Optional[float]:
+        """
+        Audio part of the playlist hook, the only part that calls the mixer.
+
+        The asyncio core runs it on its audio thread.
+
+        Returns:
+            Duration of the next song once it has started playing, otherwise
+            None; a single song never switches
+        """
+        return None
+
+    def _switch_track(self, duration: float):
+        """
+        Display part of the playlist hook, after _poll_next_track saw a switch.
+
+        Args:
+            duration: Duration of the song that started
+
+        Returns:
+            A cursor over the new song's lyrics
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _record_tick(telemetry, tick_start: float, render_start: float,
+                     position: float, frame, word_changed: bool,
+                     redrawn: bool) -> None:
+        """Pass one sync loop iteration's timings to the telemetry collector."""
+        render_end = telemetry.clock()
+
+        # A new word is on screen once the frame is written; compare the
+        # audio position at that moment against the word's timestamp
+        word_lateness = None
+        if word_changed and frame.word_time is not None:
+            word_lateness = position + (render_end - tick_start) - frame.word_time
+
+        telemetry.record_tick(
+            tick_start=tick_start,
+            position=position,
+            lookup_seconds=render_start - tick_start,
+            render_seconds=render_end - render_start if redrawn else 0.0,
+            word_lateness=word_lateness
+        )
+
+
+def check_dependencies() -> None:
+    """Exit with an install hint if pygame or rich is missing."""
+    # find_spec does not import them; pygame is imported in the background
+    # while the header is on screen
+    from importlib.util import find_spec
+    for module in ('pygame', 'rich'):
+        if find_spec(module) is None:
+            print(f"Missing required dependency: No module named '{module}'")
+            print("Please install required packages: pip install pygame rich")
+            sys.exit(1)
 
 
 def main():
     """Entry point for the Verse music player application."""
-    # Handle command-line arguments first
-    if len(sys.argv) != 3:
+    # Handle command-line arguments first: one song/LRC pair, a playlist
+    # source, or several song/LRC pairs
+    arguments = sys.argv[1:]
+    if arguments and arguments[0] == 'scan':
+        from src.scanner import main as scan_main
+        sys.exit(scan_main(arguments[1:]))
+    if arguments and arguments[0] == 'search':
+        from src.lyrics_index import main as search_main
+        sys.exit(search_main(arguments[1:]))
+    if arguments and arguments[0] == 'export':
+        from src.export import main as export_main
+        sys.exit(export_main(arguments[1:]))
+
+    if not arguments or (len(arguments) > 2 and len(arguments) % 2):
         print("Verse - Terminal Music Player with Synchronized Lyrics")
         print()
         print("Usage: python verse.py <song.mp3> <lyrics.lrc>")
+        print("       python verse.py <directory | playlist.m3u>")
+        print("       python verse.py <song1> <lyrics1> <song2> <lyrics2> ...")
+        print("       python verse.py scan <directory> [--catalog PATH] [--jobs N] [--full]")
+        print("       python verse.py search <directory> <words...> [--play N]")
+        print("       python verse.py export <lyrics.lrc | directory | playlist.m3u>... [--format F]")
         print()
         print("Arguments:")
-        print("  song.mp3    Path to the MP3/WAV audio file")
-        print("  lyrics.lrc  Path to the LRC lyrics file")
+        print("  song.mp3      Path to the MP3/WAV audio file")
+        print("  lyrics.lrc    Path to the LRC lyrics file")
+        print("  directory     Play every song with a same-named LRC file")
+        print("  playlist.m3u  Play the listed songs with their LRC files")
+        print("  scan          Catalog and index every song/LRC pair under a directory")
+        print("  search        Find words in the indexed lyrics, or play a match")
+        print("  export        Write lyrics as SRT/WebVTT/ASS subtitles or asciicast recordings")
         print()
         print("Examples:")
         print("  python verse.py songs/my_song.mp3 songs/my_song.lrc")
         print("  python verse.py songs/sample.wav songs/sample.lrc")
+        print("  python verse.py songs/")
         sys.exit(1)
 
     # Check dependencies after argument validation
+    check_dependencies()
+
     try:
-        import pygame
-        import rich
-    except ImportError as e:
-        print(f"Missing required dependency: {e}")
-        print("Please install required packages: pip install pygame rich")
-        sys.exit(1)
+        # Opt-in sync telemetry, written as JSON when playback ends
+        telemetry_path = os.environ.get('VERSE_TELEMETRY')
+        telemetry = None
+        if telemetry_path:
+            from src.telemetry import SyncTelemetry
+            telemetry = SyncTelemetry()
 
-    song_path = sys.argv[1]
-    lyrics_path = sys.argv[2]
+        # Opt-in frame tables rendered ahead of playback
+        prerender = os.environ.get('VERSE_PRERENDER', '') not in ('', '0')
+
+        # Opt-in word timing from the audio's onsets, WAV files only
+        align_words = os.environ.get('VERSE_ALIGN', '') not in ('', '0')
+
+        # Opt-in spectrum strip above the progress bar
+        visualizer = os.environ.get('VERSE_VISUALIZER', '') not in ('', '0')
+
+        # Opt-in on-disk lyrics cache
+        from src.lyrics_cache import cache_enabled
+        cache_lyrics = cache_enabled()
 
-    try:
         # Create and start the player
         # File validation is handled within the VersePlayer class
-        player = VersePlayer(song_path, lyrics_path)
-        player.start_playback()
+        if len(arguments) == 2:
+            player = VersePlayer(arguments[0], arguments[1], telemetry=telemetry,
+                                 keyboard_controls=True, prerender=prerender,
+                                 align_words=align_words, visualizer=visualizer,
+                                 cache_lyrics=cache_lyrics)
+        else:
+            from src.playlist import PlaylistPlayer, load_playlist
+            try:
+                tracks = load_playlist(arguments)
+            except (OSError, ValueError) as e:
+                print(f"Error: {str(e)}")
+                sys.exit(1)
+            player = PlaylistPlayer(tracks, telemetry=telemetry, keyboard_controls=True,
+                                    prerender=prerender, align_words=align_words,
+                                    visualizer=visualizer, cache_lyrics=cache_lyrics)
+
+        try:
+            player.start_playback()
+        finally:
+            if telemetry is not None:
+                extra = {}
+                if player.audio_player is not None:
+                    extra['audio_clock'] = player.audio_player.get_clock_stats()
+                if player.spectrum is not None:
+                    extra['visualizer'] = player.spectrum.stats()
+                telemetry.write(telemetry_path, extra=extra)
 
     except KeyboardInterrupt:
         print("\nPlayback interrupted by user")
@@ -0,0 +1,116 @@
+"""
+PCM Module for Verse Music Player
+Gives NumPy access to the samples of WAV songs through memory maps.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency, callers check numpy_available()
+    np = None
+
+from src.audio_probe import read_wav_layout
+
+# NumPy sample types by (format tag, bits per sample); 24-bit PCM is
+# assembled from bytes
+_SAMPLE_TYPES = {
+    (1, 8): 'u1',
+    (1, 16): '<i2',
+    (1, 24): 'u1',
+    (1, 32): '<i4',
+    (3, 32): '<f4',
+    (3, 64): '<f8',
+}
+
+
+def numpy_available() -> bool:
+    """Check whether NumPy, needed for sample access, is installed."""
+    return np is not None
+
+
+@dataclass
+class PcmSamples:
+    """Samples of a song, frames by channels."""
+    samples: object         # numpy array or memmap; 24-bit PCM has a third axis of bytes
+    sample_rate: int        # Frames per second
+    bits_per_sample: int    # Bits of one stored sample
+    full_scale: float       # Largest sample magnitude
+
+    @property
+    def frames(self) -> int:
+        """Number of frames."""
+        return len(self.samples)
+
+    @property
+    def channels(self) -> int:
+        """Number of channels."""
+        return self.samples.shape[1]
+
+    def mono(self, start: int, stop: int):
+        """
+        Sum the channels of frames start to stop.
+
+        Args:
+            start: First frame
+            stop: Frame after the last, at most frames
+
+        Returns:
+            float32 NumPy array with one sample per frame, in stored units
+        """
+        block = self.samples[start:stop]
+        if self.bits_per_sample == 24:
+            block = block.astype(np.int32)
+            block = block[..., 0] | (block[..., 1] << 8) | (block[..., 2] << 16)
+            block -= (block & 0x800000) << 1
+        mono = block.sum(axis=1, dtype=np.float32)
+        if self.bits_per_sample == 8 and self.samples.dtype.kind == 'u':
+            # Unsigned samples centered on 128
+            mono -= 128.0 * block.shape[1]
+        return mono
+
+
+def map_wav(file_path: str) -> Optional[PcmSamples]:
+    """
+    Memory-map the samples of a WAV file.
+
+    Nothing is read until samples are accessed, and then only the pages
+    covering them, so any song length costs the same memory.
+
+    Args:
+        file_path: Path to the WAV file
+
+    Returns:
+        PcmSamples over the file, or None without NumPy, for unreadable or
+        truncated files and for sample formats other than 8/16/24/32-bit
+        PCM and float
+    """
+    if np is None:
+        return None
+    try:
+        with open(file_path, 'rb') as file:
+            layout = read_wav_layout(file)
+    except (OSError, ValueError):
+        return None
+
+    bits = layout.bits_per_sample
+    sample_type = _SAMPLE_TYPES.get((layout.format_tag, bits))
+    if (sample_type is None or not layout.channels or not layout.sample_rate
+            or layout.block_align != layout.channels * (bits // 8)):
+        return None
+
+    frames = layout.data_size // layout.block_align
+    if not frames:
+        return None
+    shape = (frames, layout.channels) + ((3,) if bits == 24 else ())
+    try:
+        samples = np.memmap(file_path, dtype=sample_type, mode='r',
+                            offset=layout.data_offset, shape=shape)
+    except (OSError, ValueError):
+        return None
+
+    full_scale = 1.0 if layout.format_tag == 3 else float(1 << (bits - 1))
+    return PcmSamples(samples=samples, sample_rate=layout.sample_rate,
+                      bits_per_sample=bits, full_scale=full_scale)
+
@@ -6,8 +6,12 @@ Handles MP3 playback using pygame.mixer.
 from typing import Optional
 import pygame
 import os
+import time
 from pathlib import Path
 
+from src.audio_clock import InterpolatedClock
+from src.audio_probe import probe_duration
+
 
 class AudioPlayer:
     """Audio player component using pygame.mixer for MP3 playback."""
@@ -18,8 +22,21 @@ class AudioPlayer:
         self._is_playing: bool = False
         self._start_time: float = 0.0
         self._pause_time: float = 0.0
+        self._paused: bool = False
+        self._seek_on_resume: bool = False
         self._mixer_initialized: bool = False
         self._duration: float = 0.0
+        self._start_offset: float = 0.0
+        self._clock = InterpolatedClock(self._read_mixer_position)
+
+        # Gapless playlist state: the song queued behind the current one and
+        # how many queued songs have started since play()
+        self._queued_file: Optional[str] = None
+        self._queued_duration: float = 0.0
+        self._last_mixer_position: float = 0.0
+        self._mixer_restarted: bool = False
+        self._awaiting_mixer_restart: bool = False
+        self.track_index: int = 0
 
         # Initialize pygame mixer
         try:
@@ -40,6 +57,29 @@ class AudioPlayer:
         Returns:
             True if file loaded successfully, False otherwise
         """
+        if not self._can_load(file_path):
+            return False
+
+        try:
+            # Stop any currently playing music
+            if self._is_playing:
+                self.stop()
+
+            # Load the music file
+            pygame.mixer.music.load(file_path)
+            self.loaded_file = file_path
+
+            # Try to get duration for WAV files
+            self._duration = self._get_duration(file_path)
+
+            return True
+
+        except pygame.error:
+            self.loaded_file = None
+            return False
+
+    def _can_load(self, file_path: str) -> bool:
+        """Check that the mixer is up and the file is a readable MP3/WAV."""
         if not self._mixer_initialized:
             return False
 
@@ -53,28 +93,53 @@ class AudioPlayer:
             return False
 
         # Validate file is readable
-        if not os.access(file_path, os.R_OK):
-            return False
+        return os.access(file_path, os.R_OK)
 
-        try:
-            # Stop any currently playing music
-            if self._is_playing:
-                self.stop()
+    def queue_song(self, file_path: str) -> bool:
+        """
+        Queue a song to start gaplessly when the current one ends.
 
-            # Load the music file
-            pygame.mixer.music.load(file_path)
-            self.loaded_file = file_path
+        The switch shows up in get_position(), which restarts from zero for
+        the queued song, and in track_index, which counts up by one.
 
-            # Try to get duration for WAV files
-            self._duration = self._get_duration(file_path)
+        Args:
+            file_path: Path to the MP3/WAV file
 
-            return True
+        Returns:
+            True if the song was queued, False otherwise
+        """
+        if not self._is_playing or not self._can_load(file_path):
+            return False
 
+        try:
+            pygame.mixer.music.queue(file_path)
         except pygame.error:
-            self.loaded_file = None
             return False
 
-    def _get_duration(self, file_path: str) -> float:
+        self._queued_file = file_path
+        self._queued_duration = self._get_duration(file_path)
+        return True
+
+    def _start_queued(self, position: float, mixer_restarted: bool) -> None:
+        """
+        Make the queued song the current one at the given position.
+
+        Args:
+            position: Playback position in the queued song
+            mixer_restarted: Whether get_pos() already counts the queued song
+        """
+        self.loaded_file = self._queued_file
+        self._duration = self._queued_duration
+        self._queued_file = None
+        self._queued_duration = 0.0
+        self._start_offset = 0.0
+        self._mixer_restarted = False
+        self._awaiting_mixer_restart = not mixer_restarted
+        self.track_index += 1
+        self._clock.start(position)
+
+    @staticmethod
+    def _get_duration(file_path: str) -> float:
         """
         Get the duration of the audio file in seconds.
 
@@ -84,24 +149,8 @@ class AudioPlayer:
         Returns:
             Duration in seconds, or 0.0 if unable to determine
         """
-        try:
-            path = Path(file_path)
-
-            # For WAV files, we can use wave module
-            if path.suffix.lower() == '.wav':
-                import wave
-                with wave.open(file_path, 'r') as wav_file:
-                    frames = wav_file.getnframes()
-                    rate = wav_file.getframerate()
-                    duration = frames / float(rate)
-                    return duration
-
-            # For MP3 files, we'd need mutagen or similar library
-            # For now, return 0.0 and let it be estimated during playback
-            return 0.0
-
-        except Exception:
-            return 0.0
+        # Reads only the RIFF chunks or MP3 frame headers, no decoding
+        return probe_duration(file_path)
 
     def get_duration(self) -> float:
         """
@@ -112,22 +161,159 @@ class AudioPlayer:
         """
         return self._duration
 
-    def play(self) -> None:
-        """Start audio playback."""
+    def play(self, start: float = 0.0) -> None:
+        """
+        Start audio playback.
+
+        Args:
+            start: Song position in seconds to start from
+        """
         if not self._mixer_initialized or not self.loaded_file:
             return
 
         try:
             if not self._is_playing:
-                pygame.mixer.music.play()
-                self._start_time = pygame.time.get_ticks() / 1000.0
+                pygame.mixer.music.play(start=start)
+                # Wait until pygame reports the music as started rather than
+                # sleeping a fixed time, then anchor the clock there
+                self._wait_until_started()
+                self._start_time = time.perf_counter()
+                self._restart_clock(start, at=self._start_time)
+                self.track_index = 0
+                self._paused = False
                 self._is_playing = True
-                # Small delay to ensure pygame recognizes playback has started
-                import time
-                time.sleep(0.1)
         except pygame.error:
             self._is_playing = False
 
+    def _restart_clock(self, position: float, at: Optional[float] = None) -> None:
+        """
+        Anchor the position clock after the mixer (re)started playing.
+
+        Args:
+            position: Song position the mixer started from
+            at: Monotonic time of the start, defaults to now
+        """
+        # get_pos() counts from the start position, not the song start
+        self._start_offset = position
+        self._last_mixer_position = 0.0
+        self._mixer_restarted = False
+        self._awaiting_mixer_restart = False
+        self._clock.start(position, at=at)
+
+    def pause(self) -> None:
+        """Pause playback, keeping the position."""
+        if not self._is_playing or self._paused:
+            return
+        self._pause_time = self.get_position()
+        try:
+            pygame.mixer.music.pause()
+        except pygame.error:
+            return
+        self._paused = True
+
+    def resume(self) -> None:
+        """Resume paused playback from the paused position."""
+        if not self._paused:
+            return
+        try:
+            if self._seek_on_resume:
+                # Seek while still paused so nothing of the old position plays
+                self._play_from(self._pause_time)
+                pygame.mixer.music.unpause()
+            else:
+                pygame.mixer.music.unpause()
+                # get_pos() stood still while paused, only the clock moved on
+                self._clock.start(self._pause_time)
+        except pygame.error:
+            return
+        self._paused = False
+        self._seek_on_resume = False
+
+    def seek(self, position: float) -> float:
+        """
+        Jump to a position in the current song.
+
+        While paused, the new position takes effect on resume().
+
+        Args:
+            position: Song position in seconds, clamped to the song
+
+        Returns:
+            The position playback continues from
+        """
+        if not self._is_playing:
+            return 0.0
+        position = max(0.0, position)
+        if self._duration > 0:
+            position = min(position, self._duration)
+
+        if self._paused:
+            self._pause_time = position
+            self._seek_on_resume = True
+            return position
+
+        try:
+            self._play_from(position)
+        except pygame.error:
+            return self.get_position()
+        return position
+
+    def seek_by(self, offset: float) -> float:
+        """
+        Jump forward or back from the current position.
+
+        Args:
+            offset: Seconds to skip, negative to go back
+
+        Returns:
+            The position playback continues from
+        """
+        return self.seek(self.get_position() + offset)
+
+    def _play_from(self, position: float) -> None:
+        """Move the mixer to a position, keeping the queued song."""
+        raw_ms = -1
+        # Right after a queued song took over by duration, the mixer may
+        # still be playing the previous one
+        if not self._awaiting_mixer_restart:
+            try:
+                pygame.mixer.music.set_pos(position)
+                raw_ms = pygame.mixer.music.get_pos()
+            except pygame.error:
+                raw_ms = -1
+        if raw_ms >= 0:
+            # set_pos() leaves get_pos() counting on from where it was
+            self._start_offset = position - raw_ms / 1000.0
+            self._clock.start(position)
+            return
+
+        # Formats set_pos() cannot seek restart at the position instead;
+        # play(start=) drops the queue, so queue the next song again
+        pygame.mixer.music.play(start=position)
+        if self._queued_file is not None:
+            pygame.mixer.music.queue(self._queued_file)
+        self._restart_clock(position)
+
+    @property
+    def paused(self) -> bool:
+        """True while playback is paused."""
+        return self._paused
+
+    @staticmethod
+    def _wait_until_started(timeout: float = 0.1, poll_interval: float = 0.001) -> None:
+        """
+        Block until the mixer reports the music as playing.
+
+        Args:
+            timeout: Longest wait in seconds, the old fixed startup delay
+            poll_interval: Seconds between checks
+        """
+        deadline = time.perf_counter() + timeout
+        while not pygame.mixer.music.get_busy() or pygame.mixer.music.get_pos() < 0:
+            if time.perf_counter() >= deadline:
+                return
+            time.sleep(poll_interval)
+
     def stop(self) -> None:
         """Stop audio playback."""
         if not self._mixer_initialized:
@@ -138,6 +324,10 @@ class AudioPlayer:
             self._is_playing = False
             self._start_time = 0.0
             self._pause_time = 0.0
+            self._paused = False
+            self._seek_on_resume = False
+            self._queued_file = None
+            self._queued_duration = 0.0
         except pygame.error:
             pass
 
@@ -145,21 +335,73 @@ class AudioPlayer:
         """
         Get current playback position in seconds.
 
+        The position is interpolated from the monotonic clock and corrected
+        against the mixer every few polls, so it advances smoothly and most
+        calls do not touch the mixer.
+
         Returns:
             Current playback time in seconds
         """
         if not self._mixer_initialized or not self._is_playing:
             return 0.0
+        if self._paused:
+            return self._pause_time
+
+        position = self._clock.position()
+
+        # A queued song starts where the current one ends; without a known
+        # duration the mixer restarting its position count gives it away
+        if self._queued_file is not None:
+            if self._mixer_restarted:
+                position = self._last_mixer_position
+                self._start_queued(position, mixer_restarted=True)
+            elif self._duration > 0 and position >= self._duration:
+                position -= self._duration
+                self._start_queued(position, mixer_restarted=False)
+
+        return position
 
+    def _read_mixer_position(self) -> Optional[float]:
+        """
+        Read the position reported by the mixer.
+
+        Returns:
+            Mixer position in seconds, or None if playback has not started
+        """
         try:
             # pygame.mixer.music.get_pos() returns milliseconds since music started
             pos_ms = pygame.mixer.music.get_pos()
-            if pos_ms < 0:
-                # get_pos() returns -1 if music hasn't started yet
-                return 0.0
-            return pos_ms / 1000.0
         except pygame.error:
-            return 0.0
+            return None
+        if pos_ms < 0:
+            # get_pos() returns -1 if music hasn't started yet
+            return None
+
+        # get_pos() restarts from zero when a queued song begins
+        position = pos_ms / 1000.0
+        restarted = position < self._last_mixer_position - 1.0
+        self._last_mixer_position = position
+        if restarted:
+            if self._awaiting_mixer_restart:
+                self._awaiting_mixer_restart = False
+            else:
+                self._mixer_restarted = True
+        elif self._awaiting_mixer_restart:
+            # The clock already moved on to the queued song by its duration,
+            # the mixer still counts the previous one
+            return None
+        return position + self._start_offset
+
+    def get_clock_stats(self) -> dict:
+        """
+        Get the jitter of the mixer readings against the interpolated clock.
+
+        Returns:
+            Dictionary of sample counts and error statistics in milliseconds
+        """
+        summary = self._clock.stats.summary()
+        summary['rate'] = self._clock.rate
+        return summary
 
     def is_playing(self) -> bool:
         """
@@ -170,6 +412,9 @@ class AudioPlayer:
         """
         if not self._mixer_initialized:
             return False
+        if self._paused:
+            # get_busy() is False while paused, but the song is not over
+            return self._is_playing
 
         try:
             # Check if pygame mixer is busy (playing music)
@@ -0,0 +1,257 @@
+"""
+Playlist Module for Verse Music Player
+Plays a list of song/LRC pairs gaplessly on one audio player.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Sequence
+import os
+import threading
+
+from src.main import VersePlayer
+
+AUDIO_SUFFIXES = ('.mp3', '.wav')
+PLAYLIST_SUFFIXES = ('.m3u', '.m3u8')
+
+
+@dataclass
+class Track:
+    """One song and its lyrics."""
+    song_path: Path
+    lyrics_path: Path
+
+
+def _lyrics_for(song_path: Path) -> Optional[Path]:
+    """Find the LRC file next to a song, matching the suffix case-insensitively."""
+    for suffix in ('.lrc', '.LRC'):
+        candidate = song_path.with_suffix(suffix)
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _tracks_from_directory(directory: Path) -> List[Track]:
+    """Pair every audio file in a directory with its LRC file, by name."""
+    tracks = []
+    for song_path in sorted(directory.iterdir()):
+        if song_path.suffix.lower() in AUDIO_SUFFIXES:
+            lyrics_path = _lyrics_for(song_path)
+            if lyrics_path is not None:
+                tracks.append(Track(song_path, lyrics_path))
+    return tracks
+
+
+def _tracks_from_m3u(playlist_path: Path) -> List[Track]:
+    """Read audio entries from an M3U playlist and pair them with LRC files."""
+    tracks = []
+    with open(playlist_path, 'r', encoding='utf-8-sig', errors='replace') as file:
+        for entry in file:
+            entry = entry.strip()
+            if not entry or entry.startswith('#'):
+                continue
+            # Relative entries are relative to the playlist
+            song_path = playlist_path.parent / entry
+            lyrics_path = _lyrics_for(song_path)
+            if lyrics_path is not None:
+                tracks.append(Track(song_path, lyrics_path))
+    return tracks
+
+
+def load_playlist(arguments: Sequence[str]) -> List[Track]:
+    """
+    Build a playlist from command-line arguments.
+
+    Args:
+        arguments: A directory, an M3U playlist, or song/LRC path pairs
+
+    Returns:
+        Tracks in playing order
+
+    Raises:
+        ValueError: If the arguments describe no playable song/LRC pairs
+    """
+    if len(arguments) == 1:
+        source = Path(arguments[0])
+        if source.is_dir():
+            tracks = _tracks_from_directory(source)
+        elif source.suffix.lower() in PLAYLIST_SUFFIXES:
+            tracks = _tracks_from_m3u(source)
+        else:
+            raise ValueError(f"'{source}' is neither a directory nor an M3U playlist")
+        if not tracks:
+            raise ValueError(f"No song/LRC pairs found in '{source}'")
+        return tracks
+
+    if not arguments or len(arguments) % 2:
+        raise ValueError("Expected song and LRC paths in pairs")
+    return [Track(Path(song), Path(lyrics))
+            for song, lyrics in zip(arguments[::2], arguments[1::2])]
+
+
+def _is_playable(track: Track) -> bool:
+    """Check a track the way VersePlayer._validate_files does, silently."""
+    for path, suffixes in ((track.song_path, AUDIO_SUFFIXES), (track.lyrics_path, ('.lrc',))):
+        if (path.suffix.lower() not in suffixes or not path.is_file()
+                or not os.access(path, os.R_OK) or path.stat().st_size == 0):
+            return False
+    return True
+
+
+@dataclass
+class _Prefetch:
+    """Next track, parsed and indexed in the background."""
+    index: int                                  # Playlist index being prepared
+    ready: threading.Event = field(default_factory=threading.Event)
+    lyrics_parser: object = None                # Parsed timeline, None if nothing is left
+    queued: bool = False                        # Audio handed to the mixer queue
+
+
+class PlaylistPlayer(VersePlayer):
+    """
+    Plays tracks one after another on a single audio player.
+
+    While a song plays, the next track's LRC file is parsed and indexed in a
+    background thread; its audio is then queued on the mixer so it starts
+    without a gap. When the mixer moves on, the sync loop swaps in the
+    prepared timeline, which costs a reference swap and a new cursor.
+    Tracks that cannot be validated, parsed or queued are skipped, and
+    not tried again when the playlist gets to them.
+    """
+
+    def __init__(self, tracks: Sequence[Track], **components):
+        """
+        Initialize the playlist player.
+
+        Args:
+            tracks: Tracks in playing order
+            **components: audio_player, lyrics_parser, display, clock,
+                telemetry, keyboard_controls, prerender, align_words and
+                visualizer, as for VersePlayer
+        """
+        if not tracks:
+            raise ValueError("Playlist is empty")
+        super().__init__(tracks[0].song_path, tracks[0].lyrics_path, **components)
+        self.tracks = list(tracks)
+        self.track_index = 0
+        self.skipped: List[Track] = []
+        self._prefetch: Optional[_Prefetch] = None
+        self._audio_track_index = 0
+
+    def _set_track(self, index: int) -> None:
+        """Make a playlist entry the current track."""
+        self.track_index = index
+        self.song_path = self.tracks[index].song_path
+        self.lyrics_path = self.tracks[index].lyrics_path
+
+    def _skip(self, track: Track) -> None:
+        """Record a track that could not be played."""
+        if track not in self.skipped:
+            self.skipped.append(track)
+
+    def start_playback(self) -> None:
+        """Play every track, gaplessly where the next one is ready in time."""
+        index = 0
+        while index < len(self.tracks):
+            if self.tracks[index] in self.skipped:
+                # Already failed while being prepared for a gapless start
+                index += 1
+                continue
+            self._set_track(index)
+            super().start_playback()
+            if self.state.interrupted:
+                break
+            if not (self.state.lyrics_loaded and self.state.audio_loaded):
+                self._skip(self.tracks[self.track_index])
+
+            # Continue after the last track that played, queued ones included
+            index = self.track_index + 1
+            self.state.lyrics_loaded = self.state.audio_loaded = False
+
+    def _play_loaded(self) -> None:
+        """Start preparing the next track, then play the current one."""
+        self._audio_track_index = 0
+        self._start_prefetch(self.track_index + 1)
+        super()._play_loaded()
+
+    def _start_prefetch(self, index: int) -> None:
+        """Parse the next playable track from index on in a background thread."""
+        prefetch = _Prefetch(index=index)
+        self._prefetch = prefetch
+        threading.Thread(target=self._prefetch_track, args=(prefetch,),
+                         name="verse-prefetch", daemon=True).start()
+
+    def _prefetch_track(self, prefetch: _Prefetch) -> None:
+        """Background worker: validate, parse and index the next track."""
+        from src.lyrics_parser import LyricsParser
+
+        try:
+            while prefetch.index < len(self.tracks):
+                track = self.tracks[prefetch.index]
+                if _is_playable(track):
+                    lyrics_parser = LyricsParser(compact=True, cache=self.lyrics_parser.cache)
+                    try:
+                        lyrics_parser.parse_lrc_file(str(track.lyrics_path))
+                        self._align_word_timing(lyrics_parser, track.lyrics_path,
+                                                track.song_path)
+                    except Exception:
+                        pass
+                    else:
+                        prefetch.lyrics_parser = lyrics_parser
+                        return
+                self._skip(track)
+                prefetch.index += 1
+        finally:
+            prefetch.ready.set()
+
+    def _poll_next_track(self) -> Optional[float]:
+        """
+        Queue the prepared track's audio and notice when it starts playing.
+
+        Returns:
+            Duration of the queued song once the mixer has moved on to it,
+            otherwise None
+        """
+        prefetch = self._prefetch
+        if prefetch is None or not prefetch.ready.is_set() or prefetch.lyrics_parser is None:
+            return None
+
+        if not prefetch.queued:
+            prefetch.queued = True
+            track = self.tracks[prefetch.index]
+            if not self.audio_player.queue_song(str(track.song_path)):
+                self._prefetch = None
+                if self.audio_player.is_playing():
+                    # The mixer rejected the song: skip it for good and
+                    # prepare the one after it instead
+                    self._skip(track)
+                    self._start_prefetch(prefetch.index + 1)
+                # Otherwise the current song just ended and the next one
+                # starts after it, without gapless
+            return None
+
+        if self.audio_player.track_index == self._audio_track_index:
+            return None
+        self._audio_track_index = self.audio_player.track_index
+        return self.audio_player.get_duration()
+
+    def _switch_track(self, duration: float):
+        """
+        Swap in the timeline of the queued song that started playing.
+
+        Args:
+            duration: Duration of that song
+
+        Returns:
+            A cursor over the new track's lyrics
+        """
+        prefetch = self._prefetch
+        self._set_track(prefetch.index)
+        self.lyrics_parser = prefetch.lyrics_parser
+        # Only the title row changes; the lyric rows stay until the new
+        # song's first line replaces them in place
+        self.display.show_song_title(self._song_name(), duration)
+        self._start_frame_tables(duration)
+        self._start_visualizer()
+        self._start_prefetch(prefetch.index + 1)
+        return self.lyrics_parser.cursor()
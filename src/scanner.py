@@ -0,0 +1,299 @@
+"""
+Library Scanner Module for Verse Music Player
+Finds song/LRC pairs under a directory and keeps a catalog of them.
+
+Usage:
+    python verse.py scan <directory> [--catalog PATH] [--jobs N] [--full]
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+
+CATALOG_NAME = '.verse-catalog.json'
+CATALOG_VERSION = 1
+
+AUDIO_SUFFIXES = ('.mp3', '.wav')
+
+# Pairs handed to a worker per task; larger chunks mean less pickling overhead
+_MAX_CHUNK = 64
+
+
+def find_pairs(root: Path) -> Iterator[Tuple[Path, Path]]:
+    """
+    Walk a directory tree for audio files with a same-named LRC file.
+
+    Args:
+        root: Library directory
+
+    Yields:
+        (song_path, lyrics_path) tuples, directories in sorted order
+    """
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        # Map lowercase stems to LRC names so Song.MP3 finds song.lrc
+        lyrics = {}
+        for name in filenames:
+            stem, suffix = os.path.splitext(name)
+            if suffix.lower() == '.lrc':
+                lyrics[stem.lower()] = name
+        for name in sorted(filenames):
+            stem, suffix = os.path.splitext(name)
+            if suffix.lower() in AUDIO_SUFFIXES and stem.lower() in lyrics:
+                yield (Path(directory, name), Path(directory, lyrics[stem.lower()]))
+
+
+def _stat_key(path: Path) -> Tuple[int, int]:
+    """Get the (mtime_ns, size) pair that marks a file as changed."""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def scan_pair(song_path: str, lyrics_path: str) -> dict:
+    """
+    Parse one song/LRC pair into a catalog entry.
+
+    Runs in a worker process, so it takes and returns only plain data.
+
+    Args:
+        song_path: Path to the audio file
+        lyrics_path: Path to the LRC file
+
+    Returns:
+        Catalog entry with the duration, line and word counts, and an error
+        message if the lyrics could not be parsed; the lyrics' search
+        postings and line texts travel along under 'postings' and
+        'line_texts'
+    """
+    from src.audio_probe import probe_duration
+    from src.lyrics_index import song_postings
+    from src.lyrics_parser import LyricsParser, timed_words
+
+    entry = {
+        'song': song_path,
+        'lyrics': lyrics_path,
+        'duration': 0.0,
+        'lines': 0,
+        'words': 0,
+        'warnings': 0,
+        'error': None,
+    }
+    try:
+        entry['song_mtime_ns'], entry['song_size'] = _stat_key(Path(song_path))
+        entry['lyrics_mtime_ns'], entry['lyrics_size'] = _stat_key(Path(lyrics_path))
+
+        # Same header-only probe as AudioPlayer._get_duration, without
+        # importing pygame in every worker
+        entry['duration'] = probe_duration(song_path)
+
+        # The parser prints timestamp warnings; count them instead
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            lyrics = LyricsParser().parse_lrc_file(lyrics_path)
+        entry['lines'] = len(lyrics)
+        entry['words'] = sum(len(timed_words(line)) for line in lyrics)
+        entry['warnings'] = output.getvalue().count('Warning:')
+        entry['postings'] = song_postings(lyrics)
+        entry['line_texts'] = [line.text for line in lyrics]
+    except Exception as e:
+        entry['error'] = f"{type(e).__name__}: {e}"
+    return entry
+
+
+def _scan_chunk(pairs: List[Tuple[str, str]]) -> List[dict]:
+    """Worker task: scan a batch of pairs."""
+    return [scan_pair(song_path, lyrics_path) for song_path, lyrics_path in pairs]
+
+
+class LibraryCatalog:
+    """
+    Persistent JSON catalog of a music library.
+
+    Entries are keyed by song path and remember the mtime and size of both
+    files they were built from, so a rescan only re-parses changed pairs.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize the catalog and load it if it exists.
+
+        Args:
+            path: Catalog file
+        """
+        self.path = Path(path)
+        self.entries: Dict[str, dict] = {}
+        self.load()
+
+    def load(self) -> None:
+        """Load the catalog file; a missing or unreadable file starts empty."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == CATALOG_VERSION:
+            self.entries = {entry['song']: entry for entry in data.get('entries', [])}
+
+    def save(self) -> None:
+        """Write the catalog atomically via a temporary file."""
+        data = {
+            'version': CATALOG_VERSION,
+            'entries': sorted(self.entries.values(), key=lambda entry: entry['song']),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.path.parent, prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(data, file, indent=1)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def is_current(self, song_path: Path, lyrics_path: Path) -> bool:
+        """
+        Check whether the entry of a pair matches the files on disk.
+
+        Args:
+            song_path: Path to the audio file
+            lyrics_path: Path to the LRC file
+
+        Returns:
+            True if the pair is cataloged and neither file changed
+        """
+        entry = self.entries.get(str(song_path))
+        if entry is None or entry.get('lyrics') != str(lyrics_path):
+            return False
+        try:
+            return ((entry.get('song_mtime_ns'), entry.get('song_size')) == _stat_key(song_path)
+                    and (entry.get('lyrics_mtime_ns'), entry.get('lyrics_size')) == _stat_key(lyrics_path))
+        except OSError:
+            return False
+
+
+def scan_library(
+    root: Path,
+    catalog: LibraryCatalog,
+    jobs: Optional[int] = None,
+    full: bool = False
+) -> dict:
+    """
+    Scan a library into a catalog, re-parsing only new or changed pairs.
+
+    The lyrics search index is rebuilt next to the catalog; unchanged
+    songs are carried over from the previous index without parsing.
+
+    Args:
+        root: Library directory
+        catalog: Catalog to update; saved when the scan completes
+        jobs: Worker processes, defaults to every CPU
+        full: Re-parse every pair even if unchanged
+
+    Returns:
+        Scan statistics including files per second
+    """
+    from src.lyrics_index import INDEX_NAME, IndexBuilder, open_index
+
+    start = time.perf_counter()
+    index_path = catalog.path.with_name(INDEX_NAME)
+    previous_index = open_index(index_path)
+    indexed = previous_index.song_ids() if previous_index is not None else {}
+
+    # Absolute paths keep catalog keys stable across working directories
+    pairs = list(find_pairs(Path(root).resolve()))
+    stale = [(str(song), str(lyrics)) for song, lyrics in pairs
+             if full or not catalog.is_current(song, lyrics) or str(song) not in indexed]
+
+    builder = IndexBuilder()
+    stale_songs = {song for song, _ in stale}
+    for song, _ in pairs:
+        if str(song) not in stale_songs:
+            builder.reuse_song(previous_index, str(song), indexed[str(song)])
+
+    jobs = jobs or os.cpu_count() or 1
+    if stale:
+        # Several chunks per worker keep the pool balanced near the end
+        chunk_size = max(1, min(_MAX_CHUNK, len(stale) // (jobs * 4)))
+        chunks = [stale[i:i + chunk_size] for i in range(0, len(stale), chunk_size)]
+        with contextlib.ExitStack() as stack:
+            map_chunks = map
+            if jobs > 1 and len(chunks) > 1:
+                pool = ProcessPoolExecutor(max_workers=min(jobs, len(chunks)))
+                map_chunks = stack.enter_context(pool).map
+            for entries in map_chunks(_scan_chunk, chunks):
+                for entry in entries:
+                    builder.add_song(entry['song'], entry['lyrics'], entry.pop('postings', {}),
+                                     entry.pop('line_texts', []))
+                    catalog.entries[entry['song']] = entry
+
+    # Forget pairs whose files are gone
+    present = {str(song) for song, _ in pairs}
+    removed = [song for song in catalog.entries if song not in present]
+    for song in removed:
+        del catalog.entries[song]
+
+    catalog.save()
+    builder.write(index_path)
+    if previous_index is not None:
+        previous_index.close()
+    elapsed = time.perf_counter() - start
+    errors = sum(1 for entry in catalog.entries.values() if entry.get('error'))
+    return {
+        'pairs': len(pairs),
+        'parsed': len(stale),
+        'unchanged': len(pairs) - len(stale),
+        'removed': len(removed),
+        'errors': errors,
+        'index': str(index_path),
+        'jobs': jobs,
+        'seconds': elapsed,
+        'files_per_second': len(pairs) / elapsed if elapsed else 0.0,
+        'parsed_per_second': len(stale) / elapsed if elapsed else 0.0,
+    }
+
+
+def main(arguments: Sequence[str]) -> int:
+    """
+    Run the scan command.
+
+    Args:
+        arguments: Command-line arguments after 'scan'
+
+    Returns:
+        Process exit status
+    """
+    parser = argparse.ArgumentParser(
+        prog='python verse.py scan',
+        description='Catalog the song/LRC pairs in a music library')
+    parser.add_argument('directory', type=Path, help='library directory to scan')
+    parser.add_argument('--catalog', type=Path,
+                        help=f'catalog file (default: <directory>/{CATALOG_NAME})')
+    parser.add_argument('--jobs', type=int, help='worker processes (default: all CPUs)')
+    parser.add_argument('--full', action='store_true',
+                        help='re-parse every pair, not just changed ones')
+    args = parser.parse_args(arguments)
+
+    if not args.directory.is_dir():
+        print(f"Error: '{args.directory}' is not a directory")
+        return 1
+
+    catalog = LibraryCatalog(args.catalog or args.directory / CATALOG_NAME)
+    stats = scan_library(args.directory, catalog, jobs=args.jobs, full=args.full)
+
+    print(f"Scanned {stats['pairs']} song/LRC pairs in {stats['seconds']:.2f}s "
+          f"({stats['files_per_second']:.0f} files/s, {stats['jobs']} workers)")
+    print(f"  parsed: {stats['parsed']}  unchanged: {stats['unchanged']}  "
+          f"removed: {stats['removed']}  errors: {stats['errors']}")
+    print(f"Catalog written to {catalog.path}")
+    print(f"Lyrics index written to {stats['index']}")
+    return 0
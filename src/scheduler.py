@@ -0,0 +1,114 @@
+"""
+Scheduler Module for Verse Music Player
+Decides how long the sync loop may sleep before something changes on screen.
+"""
+
+import math
+import threading
+import time
+from typing import Callable, Optional
+
+
+class SystemClock:
+    """Monotonic wall clock used for real playback."""
+
+    def __init__(self):
+        """Initialize the clock."""
+        self._wakeup = threading.Event()
+
+    def now(self) -> float:
+        """Get the current monotonic time in seconds."""
+        return time.perf_counter()
+
+    def sleep(self, seconds: Optional[float]) -> None:
+        """
+        Block for the given number of seconds or until wake() is called.
+
+        Args:
+            seconds: Time to sleep, or None to sleep until woken
+        """
+        if self._wakeup.wait(seconds):
+            self._wakeup.clear()
+
+    def wake(self) -> None:
+        """End the current or next sleep early, from any thread."""
+        self._wakeup.set()
+
+
+class DeadlineScheduler:
+    """
+    Deadline-driven sleep for the synchronization loop.
+
+    Word and line timestamps are known ahead of time, so instead of polling
+    at a fixed rate the loop sleeps until the next lyric event or progress
+    bar tick. Sleeps are capped at ``resync_interval`` so the audio clock is
+    still re-read regularly to correct for drift.
+    """
+
+    def __init__(
+        self,
+        sleep: Callable[[float], None] = time.sleep,
+        resync_interval: float = 0.5,
+        progress_interval: float = 1.0,
+        min_sleep: float = 0.002
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            sleep: Function used to sleep, in seconds
+            resync_interval: Longest sleep before re-reading the audio clock
+            progress_interval: Playback time between progress bar ticks
+            min_sleep: Shortest sleep, avoids spinning on a coarse audio clock
+        """
+        self._sleep = sleep
+        self.resync_interval = resync_interval
+        self.progress_interval = progress_interval
+        self.min_sleep = min_sleep
+        self.wakeups: int = 0
+
+    def next_progress_tick(self, position: float) -> float:
+        """
+        Get the playback time of the next progress bar tick.
+
+        Args:
+            position: Current playback time in seconds
+
+        Returns:
+            Next multiple of ``progress_interval`` after the position
+        """
+        return (math.floor(position / self.progress_interval) + 1) * self.progress_interval
+
+    def next_deadline(self, position: float, event_time: Optional[float]) -> float:
+        """
+        Get the playback time at which the loop should wake up next.
+
+        Args:
+            position: Current playback time in seconds
+            event_time: Timestamp of the next word or line boundary, if any
+
+        Returns:
+            Earliest of the next lyric event, progress tick and resync time
+        """
+        deadline = min(self.next_progress_tick(position),
+                       position + self.resync_interval)
+        if event_time is not None and event_time < deadline:
+            deadline = event_time
+        return deadline
+
+    def sleep_until(self, position: float, event_time: Optional[float]) -> float:
+        """
+        Sleep until the next deadline.
+
+        Args:
+            position: Current playback time in seconds
+            event_time: Timestamp of the next word or line boundary, if any
+
+        Returns:
+            The time slept in seconds
+        """
+        delay = max(self.min_sleep,
+                    self.next_deadline(position, event_time) - position)
+        self.wakeups += 1
+        self._sleep(delay)
+        return delay
@@ -0,0 +1,323 @@
+"""
+Simulation Module for Verse Music Player
+Runs VersePlayer headless on a virtual clock, faster than real time.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+import io
+import json
+import sys
+import time
+
+
+class VirtualClock:
+    """Clock whose time only moves when something sleeps on it."""
+
+    def __init__(self, start: float = 0.0):
+        """
+        Initialize the virtual clock.
+
+        Args:
+            start: Initial time in seconds
+        """
+        self._now = start
+        self.sleeps: List[Tuple[float, float]] = []  # (time, duration) pairs
+
+    def now(self) -> float:
+        """Get the current virtual time in seconds."""
+        return self._now
+
+    def sleep(self, seconds: Optional[float]) -> None:
+        """
+        Advance the virtual time instantly.
+
+        Args:
+            seconds: Time to skip in seconds; None (sleep until woken)
+                returns at once, as nothing else moves a virtual clock
+        """
+        seconds = seconds or 0.0
+        self.sleeps.append((self._now, seconds))
+        self._now += max(0.0, seconds)
+
+    def wake(self) -> None:
+        """Nothing to wake, sleeps never block."""
+
+
+class NullAudioPlayer:
+    """Silent audio backend that plays along a clock without pygame."""
+
+    def __init__(self, clock: VirtualClock, duration: Optional[float] = None):
+        """
+        Initialize the null audio player.
+
+        Args:
+            clock: Clock that drives the playback position
+            duration: Song length in seconds; probed from the file if None
+        """
+        self.clock = clock
+        self.loaded_file: Optional[str] = None
+        self._fixed_duration: Optional[float] = duration
+        self._duration: float = duration or 0.0
+        self._start_time: Optional[float] = None
+        self._paused_at: Optional[float] = None  # Position while paused
+        self._queued: Optional[Tuple[str, float]] = None
+        self.track_index: int = 0
+
+    def load_song(self, file_path: str) -> bool:
+        """
+        Pretend to load an audio file.
+
+        Args:
+            file_path: Path to the audio file
+
+        Returns:
+            True, the file is never decoded
+        """
+        self.loaded_file = file_path
+        if not self._fixed_duration:
+            from src.audio_probe import probe_duration
+            self._duration = probe_duration(file_path)
+        return True
+
+    def get_duration(self) -> float:
+        """Get the song length in seconds."""
+        return self._duration
+
+    def queue_song(self, file_path: str) -> bool:
+        """
+        Queue a song to start when the current one ends.
+
+        Args:
+            file_path: Path to the audio file, probed for its duration
+
+        Returns:
+            True if the song was queued
+        """
+        if self._start_time is None:
+            return False
+        from src.audio_probe import probe_duration
+        self._queued = (file_path, probe_duration(file_path))
+        return True
+
+    def _start_queued(self) -> None:
+        """Move on to the queued song once the current one has ended."""
+        if (self._queued is not None and self._start_time is not None
+                and self.clock.now() - self._start_time >= self._duration):
+            self._start_time += self._duration
+            self.loaded_file, self._duration = self._queued
+            self._queued = None
+            self.track_index += 1
+
+    def play(self, start: float = 0.0) -> None:
+        """
+        Start the virtual playback at the current clock time.
+
+        Args:
+            start: Song position in seconds to start from
+        """
+        self._start_time = self.clock.now() - start
+        self._paused_at = None
+        self.track_index = 0
+
+    def pause(self) -> None:
+        """Hold the virtual playback at its position."""
+        if self._start_time is not None and self._paused_at is None:
+            self._paused_at = self.get_position()
+
+    def resume(self) -> None:
+        """Continue the virtual playback from the paused position."""
+        if self._paused_at is not None:
+            self._start_time = self.clock.now() - self._paused_at
+            self._paused_at = None
+
+    @property
+    def paused(self) -> bool:
+        """True while the virtual playback is paused."""
+        return self._paused_at is not None
+
+    def seek(self, position: float) -> float:
+        """
+        Jump to a position in the current song.
+
+        Args:
+            position: Song position in seconds, clamped to the song
+
+        Returns:
+            The position playback continues from
+        """
+        if self._start_time is None:
+            return 0.0
+        position = min(max(0.0, position), self._duration)
+        if self._paused_at is not None:
+            self._paused_at = position
+        else:
+            self._start_time = self.clock.now() - position
+        return position
+
+    def seek_by(self, offset: float) -> float:
+        """
+        Jump forward or back from the current position.
+
+        Args:
+            offset: Seconds to skip, negative to go back
+
+        Returns:
+            The position playback continues from
+        """
+        return self.seek(self.get_position() + offset)
+
+    def stop(self) -> None:
+        """Stop the virtual playback."""
+        self._start_time = None
+        self._paused_at = None
+        self._queued = None
+
+    def get_position(self) -> float:
+        """Get the virtual playback position in seconds."""
+        if self._start_time is None:
+            return 0.0
+        if self._paused_at is not None:
+            return self._paused_at
+        self._start_queued()
+        return min(self.clock.now() - self._start_time, self._duration)
+
+    def is_playing(self) -> bool:
+        """Check whether the virtual playback has not reached the end yet."""
+        if self._start_time is None:
+            return False
+        if self._paused_at is not None:
+            return True
+        self._start_queued()
+        return self.clock.now() - self._start_time < self._duration
+
+
+@dataclass
+class SimulationResult:
+    """Outcome of a simulated playback session."""
+    duration: float                 # Simulated song length in seconds
+    frames: int                     # Frames written to the terminal
+    bytes_written: int              # Terminal output in bytes
+    wakeups: int                    # Sync loop wakeups
+    sleeps: List[Tuple[float, float]] = field(default_factory=list)  # (time, duration)
+    render_seconds: float = 0.0     # Wall time spent rendering lyric frames
+    wall_seconds: float = 0.0       # Wall time of the whole simulation
+    output: str = ''                # Everything written to the terminal
+
+    def summary(self) -> dict:
+        """
+        Summarize the deterministic results and measured costs.
+
+        Returns:
+            Dictionary suitable for JSON output
+        """
+        return {
+            'duration': self.duration,
+            'frames': self.frames,
+            'bytes_written': self.bytes_written,
+            'wakeups': self.wakeups,
+            'render_seconds': self.render_seconds,
+            'wall_seconds': self.wall_seconds,
+            'speedup': self.duration / self.wall_seconds if self.wall_seconds else None,
+        }
+
+
+def simulate(
+    lyrics_path: str,
+    song_path: Optional[str] = None,
+    duration: Optional[float] = None,
+    width: int = 100,
+    height: int = 24,
+    max_fps: Optional[float] = None,
+    clock: Optional[VirtualClock] = None,
+    output: Optional[io.StringIO] = None,
+    align_words: bool = False
+) -> SimulationResult:
+    """
+    Play a song through VersePlayer on a virtual clock with no audio.
+
+    Args:
+        lyrics_path: Path to the LRC lyrics file
+        song_path: Optional audio file; its duration is probed and it goes
+            through the normal file validation
+        duration: Song length in seconds, defaults to the audio duration or
+            four seconds past the last lyric line
+        width: Terminal width of the captured console
+        height: Terminal height of the captured console
+        max_fps: Optional frame-rate cap for the display
+        clock: Virtual clock to run on, e.g. one shared with the output
+        output: In-memory file for the terminal output, e.g. one that
+            records when each write happens
+        align_words: Move word timing onto the song's onsets, as
+            VERSE_ALIGN does (WAV songs only)
+
+    Returns:
+        SimulationResult with frame counts, costs and the captured output
+    """
+    # Imported here so importing this module stays cheap
+    from rich.console import Console
+    from src.display import LyricDisplay
+    from src.lyrics_parser import LyricsParser
+    from src.main import VersePlayer
+
+    clock = clock or VirtualClock()
+    output = output if output is not None else io.StringIO()
+    console = Console(file=output, force_terminal=True, width=width,
+                      height=height, color_system='truecolor')
+    display = LyricDisplay(console, max_fps=max_fps, clock=clock.now)
+    audio_player = NullAudioPlayer(clock, duration)
+
+    player = VersePlayer(
+        song_path or lyrics_path, lyrics_path,
+        audio_player=audio_player,
+        lyrics_parser=LyricsParser(compact=True),
+        display=display,
+        clock=clock,
+        align_words=align_words
+    )
+
+    # Time spent rendering lyric frames, in real wall time
+    render_seconds = 0.0
+    show_lyric_with_context = display.show_lyric_with_context
+
+    def timed_show_lyric_with_context(**kwargs):
+        nonlocal render_seconds
+        start = time.perf_counter()
+        show_lyric_with_context(**kwargs)
+        render_seconds += time.perf_counter() - start
+
+    display.show_lyric_with_context = timed_show_lyric_with_context
+
+    wall_start = time.perf_counter()
+    if song_path is not None:
+        player.start_playback()
+    else:
+        player.lyrics_parser.parse_lrc_file(lyrics_path)
+        audio_player.load_song(lyrics_path)
+        if not audio_player.get_duration():
+            lyrics = player.lyrics_parser.lyrics
+            audio_player._duration = (lyrics[-1].timestamp if len(lyrics) else 0.0) + 4.0
+        player._show_header(audio_player.get_duration())
+        player._play_loaded()
+    wall_seconds = time.perf_counter() - wall_start
+
+    stats = display.frame_stats
+    return SimulationResult(
+        duration=audio_player.get_duration(),
+        frames=stats.frames,
+        bytes_written=stats.bytes,
+        wakeups=player.scheduler.wakeups,
+        sleeps=clock.sleeps,
+        render_seconds=render_seconds,
+        wall_seconds=wall_seconds,
+        output=output.getvalue(),
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python -m src.simulation <lyrics.lrc> [song.mp3]")
+        sys.exit(1)
+
+    result = simulate(sys.argv[1], sys.argv[2] if len(sys.argv) == 3 else None)
+    print(json.dumps(result.summary(), indent=2))
@@ -0,0 +1,181 @@
+"""
+Telemetry Module for Verse Music Player
+Opt-in timing and drift instrumentation for the synchronization loop.
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional
+import json
+import math
+import time
+
+# Upper bucket bounds in milliseconds for the exported histograms
+HISTOGRAM_BOUNDS_MS = (0.01, 0.05, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 250.0)
+
+
+@dataclass
+class TickSample:
+    """Measurements of one sync loop iteration."""
+    wall_time: float                # Monotonic seconds since the session started
+    position: float                 # Audio position reported by the player
+    lookup_seconds: float           # Time spent in timeline lookups
+    render_seconds: float           # Time spent in LyricDisplay, 0 if nothing drawn
+    clock_skew: float               # Audio position drift against the monotonic clock
+    word_lateness: Optional[float] = None  # How late a newly shown word appeared
+
+
+def percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    """
+    Get a nearest-rank percentile of sorted values.
+
+    Args:
+        sorted_values: Values in ascending order
+        fraction: Percentile as a fraction, e.g. 0.95
+
+    Returns:
+        The percentile, or None for no values
+    """
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(values: List[float]) -> Dict[str, object]:
+    """
+    Summarize samples with p50/p95/p99 and a millisecond histogram.
+
+    Args:
+        values: Samples in seconds
+
+    Returns:
+        Dictionary with count, mean, max, percentiles (in ms) and bucket counts
+    """
+    ordered = sorted(values)
+    to_ms = (lambda value: None if value is None else value * 1000.0)
+
+    buckets = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+    bound_index = 0
+    for value in ordered:
+        value_ms = value * 1000.0
+        while bound_index < len(HISTOGRAM_BOUNDS_MS) and value_ms > HISTOGRAM_BOUNDS_MS[bound_index]:
+            bound_index += 1
+        buckets[bound_index] += 1
+
+    labels = [f"<={bound}" for bound in HISTOGRAM_BOUNDS_MS] + [f">{HISTOGRAM_BOUNDS_MS[-1]}"]
+    return {
+        'count': len(ordered),
+        'mean_ms': to_ms(sum(ordered) / len(ordered)) if ordered else None,
+        'max_ms': to_ms(ordered[-1]) if ordered else None,
+        'p50_ms': to_ms(percentile(ordered, 0.50)),
+        'p95_ms': to_ms(percentile(ordered, 0.95)),
+        'p99_ms': to_ms(percentile(ordered, 0.99)),
+        'histogram_ms': dict(zip(labels, buckets)),
+    }
+
+
+class SyncTelemetry:
+    """
+    Collects per-tick samples from VersePlayer._sync_loop.
+
+    The loop only calls into this object when telemetry is enabled, so a
+    disabled session pays for a few ``is not None`` checks per tick.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter, max_samples: int = 200_000):
+        """
+        Initialize the telemetry collector.
+
+        Args:
+            clock: Monotonic clock in seconds
+            max_samples: Ticks kept for the trace; older ticks still count
+                towards the histograms
+        """
+        self.clock = clock
+        self.max_samples = max_samples
+        self.samples: List[TickSample] = []
+        self.ticks: int = 0
+        self._lookup: List[float] = []
+        self._render: List[float] = []
+        self._lateness: List[float] = []
+        self._skew: List[float] = []
+        self._session_start: Optional[float] = None
+        self._position_start: float = 0.0
+
+    def record_tick(
+        self,
+        tick_start: float,
+        position: float,
+        lookup_seconds: float,
+        render_seconds: float,
+        word_lateness: Optional[float] = None
+    ) -> None:
+        """
+        Record the measurements of one loop iteration.
+
+        Args:
+            tick_start: Clock reading taken right after the position was read
+            position: Audio position reported by the player in seconds
+            lookup_seconds: Time spent in timeline lookups
+            render_seconds: Time spent rendering, 0 if nothing was drawn
+            word_lateness: Lateness of a newly shown word against its timestamp
+        """
+        if self._session_start is None:
+            self._session_start = tick_start
+            self._position_start = position
+
+        wall_time = tick_start - self._session_start
+        clock_skew = (position - self._position_start) - wall_time
+
+        self.ticks += 1
+        self._lookup.append(lookup_seconds)
+        self._skew.append(clock_skew)
+        if render_seconds:
+            self._render.append(render_seconds)
+        if word_lateness is not None:
+            self._lateness.append(word_lateness)
+
+        if len(self.samples) < self.max_samples:
+            self.samples.append(TickSample(
+                wall_time=wall_time,
+                position=position,
+                lookup_seconds=lookup_seconds,
+                render_seconds=render_seconds,
+                clock_skew=clock_skew,
+                word_lateness=word_lateness,
+            ))
+
+    def report(self) -> dict:
+        """
+        Build the end-of-session summary.
+
+        Returns:
+            Dictionary with p50/p95/p99 histograms of every metric
+        """
+        # Skew can be negative, summarize its magnitude
+        return {
+            'ticks': self.ticks,
+            'lookup': summarize(self._lookup),
+            'render': summarize(self._render),
+            'word_lateness': summarize(self._lateness),
+            'clock_skew_abs': summarize([abs(skew) for skew in self._skew]),
+            'final_clock_skew_ms': self._skew[-1] * 1000.0 if self._skew else None,
+        }
+
+    def write(self, path: str, extra: Optional[dict] = None) -> None:
+        """
+        Write the summary and the per-tick trace as JSON.
+
+        Args:
+            path: Output file path
+            extra: Additional summary sections, e.g. audio clock statistics
+        """
+        summary = self.report()
+        if extra:
+            summary.update(extra)
+        data = {
+            'summary': summary,
+            'trace': [asdict(sample) for sample in self.samples],
+        }
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, indent=1)
@@ -0,0 +1,150 @@
+"""
+Terminal Output Module for Verse Music Player
+Composes each display update into one buffered write per frame.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, List, Optional, TextIO
+import time
+
+
+@dataclass
+class FrameStats:
+    """Output cost counters for the frames written to the terminal."""
+    frames: int = 0      # Frames written to the terminal
+    coalesced: int = 0   # Frames merged into a later one by the rate cap
+    bytes: int = 0       # Bytes written, in the file's encoding
+    writes: int = 0      # write() calls on the output file
+    flushes: int = 0     # flush() calls on the output file
+
+    def summary(self) -> dict:
+        """
+        Summarize the counters with per-frame averages.
+
+        Returns:
+            Dictionary of the totals and bytes/syscalls per frame
+        """
+        frames = max(1, self.frames)
+        return {
+            'frames': self.frames,
+            'coalesced': self.coalesced,
+            'bytes': self.bytes,
+            'writes': self.writes,
+            'flushes': self.flushes,
+            'bytes_per_frame': self.bytes / frames,
+            'syscalls_per_frame': (self.writes + self.flushes) / frames,
+        }
+
+
+class FrameWriter:
+    """
+    Buffered frame composer for terminal output.
+
+    Cursor moves, styles and text for a frame are collected in memory and
+    emitted by commit() as exactly one write and one flush. An optional
+    frame-rate cap holds back frames that come too soon after the previous
+    one; they are merged into the next frame instead of being written.
+
+    Frames for a text file with a binary buffer, such as sys.stdout, are
+    encoded once and written to the buffer, so the bytes counted are the
+    bytes written.
+    """
+
+    def __init__(
+        self,
+        file: TextIO,
+        max_fps: Optional[float] = None,
+        clock: Callable[[], float] = time.perf_counter
+    ):
+        """
+        Initialize the frame writer.
+
+        Args:
+            file: Output file, usually the console's file
+            max_fps: Maximum frames per second, or None for no cap
+            clock: Monotonic clock in seconds used by the frame-rate cap
+        """
+        self.file = file
+        self._buffer = getattr(file, 'buffer', None)
+        self._encoding = getattr(file, 'encoding', None) or 'utf-8'
+        self._errors = getattr(file, 'errors', None) or 'strict'
+        self.max_fps = max_fps
+        self.stats = FrameStats()
+        self._clock = clock
+        self._parts: List[str] = []
+        self._last_frame_time: Optional[float] = None
+
+    def write(self, data: str) -> None:
+        """
+        Append output to the current frame.
+
+        Args:
+            data: Text and escape sequences to add
+        """
+        self._parts.append(data)
+
+    @property
+    def pending(self) -> bool:
+        """True if the buffer holds output that was not written yet."""
+        return bool(self._parts)
+
+    def pending_delay(self) -> Optional[float]:
+        """
+        Get how long a held-back frame still has to wait for the rate cap.
+
+        Returns:
+            Seconds until commit() will write the pending frame, or None if
+            nothing is pending
+        """
+        if not self._parts:
+            return None
+        if not self.max_fps or self._last_frame_time is None:
+            return 0.0
+        ready_at = self._last_frame_time + 1.0 / self.max_fps
+        return max(0.0, ready_at - self._clock())
+
+    def commit(self, force: bool = False) -> bool:
+        """
+        Write the buffered frame with one write and one flush.
+
+        Args:
+            force: Write even if the frame-rate cap would hold the frame back
+
+        Returns:
+            True if a frame was written, False if nothing was pending or the
+            frame was held back for the rate cap
+        """
+        if not self._parts:
+            return False
+
+        now = self._clock()
+        if (not force and self.max_fps and self._last_frame_time is not None
+                and now - self._last_frame_time < 1.0 / self.max_fps):
+            self.stats.coalesced += 1
+            return False
+
+        frame = ''.join(self._parts)
+        self._parts = []
+        self._last_frame_time = now
+
+        buffer = self._buffer
+        if buffer is not None:
+            data = frame.encode(self._encoding, self._errors)
+            # Text printed around the frame writer goes out first; with none
+            # pending this makes no system call
+            self.file.flush()
+            buffer.write(data)
+            buffer.flush()
+            size = len(data)
+        else:
+            self.file.write(frame)
+            self.file.flush()
+            # In-memory files hold text; count what a UTF-8 terminal receives
+            size = len(frame) if frame.isascii() else len(frame.encode('utf-8', 'replace'))
+
+        stats = self.stats
+        stats.frames += 1
+        stats.bytes += size
+        stats.writes += 1
+        stats.flushes += 1
+        return True
@@ -0,0 +1,257 @@
+"""
+Visualizer Module for Verse Music Player
+Computes a spectrum strip from the song's samples on a worker thread.
+"""
+
+from typing import Callable, Optional, Tuple
+import threading
+
+from src.pcm import map_wav, np
+
+# Spectrum frames computed per second
+DEFAULT_FPS = 20
+
+# Samples per FFT window, about 46 ms at 44.1 kHz
+FFT_SIZE = 2048
+
+# Bands shown, one cell each, the width of the progress bar
+BANDS = 20
+
+# Frequency range split into logarithmically spaced bands
+MIN_FREQUENCY = 50.0
+MAX_FREQUENCY = 16000.0
+
+# Levels span this many dB below a full-scale sine
+RANGE_DB = 60.0
+
+# Block characters for band levels 0 to 8
+GLYPHS = " ▁▂▃▄▅▆▇█"
+
+
+class SpectrumAnalyzer:
+    """
+    Spectrum of the playing song, computed off the render path.
+
+    A worker thread memory-maps the song's samples once, then every
+    1/fps seconds takes an FFT of the samples at the playback position and
+    reduces it to BANDS levels, ready to write as one string of block
+    characters. Each frame is published by replacing a single reference,
+    so the render path reads the newest strip without taking a lock and
+    never waits for the worker.
+
+    Frames that are due while the worker is still busy are dropped rather
+    than computed late, and strips the render path had no frame for are
+    skipped; both are counted in stats() together with the share of each
+    frame's time budget spent computing and drawing.
+
+    Only WAV songs have a spectrum. Decoding other formats would need
+    pygame, which only the audio player's executor may use, and would hold
+    the whole decoded song in memory during playback.
+    """
+
+    def __init__(self, song_path: str, clock, fps: int = DEFAULT_FPS,
+                 on_frame: Optional[Callable[[], None]] = None):
+        """
+        Initialize the analyzer.
+
+        Args:
+            song_path: Path to the song's audio file
+            clock: Object with now(), the clock the sync loop reads
+            fps: Spectrum frames per second
+            on_frame: Called from the worker after each published frame,
+                e.g. to wake the sync loop
+        """
+        self.song_path = song_path
+        self.clock = clock
+        self.fps = fps
+        self.interval = 1.0 / fps
+        self.on_frame = on_frame
+        self.available: Optional[bool] = None   # Known once the samples are read
+
+        # Newest frame as (sequence, strip); replaced, never modified
+        self._slot: Optional[Tuple[int, str]] = None
+        # Playback position as (position, clock time, playing), from follow()
+        self._anchor: Optional[Tuple[float, float, bool]] = None
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Worker statistics
+        self.frames: int = 0
+        self.dropped_frames: int = 0
+        self.compute_seconds: float = 0.0
+        self.max_compute_seconds: float = 0.0
+
+        # Render path statistics
+        self.draws: int = 0
+        self.skipped_draws: int = 0
+        self.draw_seconds: float = 0.0
+        self._drawn_sequence: int = 0
+
+    def start(self) -> None:
+        """Start the worker thread."""
+        self._thread = threading.Thread(target=self._run, name="verse-visualizer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the worker thread; the last strip stays readable."""
+        self._stopped.set()
+        self._wake.set()
+
+    def follow(self, position: float, at: float, playing: bool = True) -> None:
+        """
+        Tell the worker where playback is; called by the render path.
+
+        Args:
+            position: Playback position in seconds
+            at: Clock time the position was read at
+            playing: False while paused, which idles the worker
+        """
+        self._anchor = (position, at, playing)
+        if playing:
+            self._wake.set()
+
+    def latest(self) -> Optional[Tuple[int, str]]:
+        """
+        Get the newest strip without waiting for the worker.
+
+        Returns:
+            (sequence, strip) of the newest frame, None before the first
+        """
+        return self._slot
+
+    def record_draw(self, sequence: int, seconds: float) -> None:
+        """
+        Count a strip drawn by the render path.
+
+        Args:
+            sequence: Sequence number of the drawn frame
+            seconds: Time spent drawing it
+        """
+        if self._drawn_sequence and sequence > self._drawn_sequence + 1:
+            self.skipped_draws += sequence - self._drawn_sequence - 1
+        self._drawn_sequence = sequence
+        self.draws += 1
+        self.draw_seconds += seconds
+
+    def stats(self) -> dict:
+        """
+        Summarize the frame budget use.
+
+        Returns:
+            Dictionary of frame counts and times; budget_used and
+            draw_budget_used are the fractions of each 1/fps frame spent
+            computing on the worker and drawing on the render path
+        """
+        return {
+            "available": bool(self.available),
+            "fps": self.fps,
+            "frame_budget_seconds": self.interval,
+            "frames": self.frames,
+            "dropped_frames": self.dropped_frames,
+            "compute_seconds": self.compute_seconds,
+            "max_compute_seconds": self.max_compute_seconds,
+            "budget_used": (self.compute_seconds / (self.frames * self.interval)
+                            if self.frames else 0.0),
+            "draws": self.draws,
+            "skipped_draws": self.skipped_draws,
+            "draw_seconds": self.draw_seconds,
+            "draw_budget_used": (self.draw_seconds / (self.draws * self.interval)
+                                 if self.draws else 0.0),
+        }
+
+    def _run(self) -> None:
+        """Worker thread: publish a strip every frame while playing."""
+        pcm = map_wav(self.song_path)
+        self.available = pcm is not None
+        if pcm is None:
+            return
+        levels = _BandLevels(pcm)
+
+        due = None
+        while not self._stopped.is_set():
+            anchor = self._anchor
+            if anchor is None or not anchor[2]:
+                # Not started or paused: wait for follow() without using CPU
+                self._wake.wait()
+                self._wake.clear()
+                due = None
+                continue
+
+            now = self.clock.now()
+            if due is None:
+                due = now
+            elif now < due:
+                self._stopped.wait(due - now)
+                continue
+
+            # Frames that fell due while the last one was computed are dropped
+            late = int((now - due) / self.interval)
+            if late:
+                self.dropped_frames += late
+                due += late * self.interval
+
+            position, at, _ = anchor
+            strip = levels.strip(position + (now - at))
+            self.frames += 1
+            self._slot = (self.frames, strip)
+
+            elapsed = self.clock.now() - now
+            self.compute_seconds += elapsed
+            self.max_compute_seconds = max(self.max_compute_seconds, elapsed)
+            due += self.interval
+
+            if self.on_frame is not None:
+                self.on_frame()
+
+
+class _BandLevels:
+    """FFT of the samples at a position, reduced to block characters."""
+
+    def __init__(self, pcm):
+        self.pcm = pcm
+        self.window = np.hanning(FFT_SIZE).astype(np.float32)
+
+        # FFT bins where each band starts and the last ends, each band at
+        # least one bin wide and all of them below the Nyquist frequency
+        top = min(MAX_FREQUENCY, pcm.sample_rate / 2)
+        frequencies = np.geomspace(MIN_FREQUENCY, top, BANDS + 1)
+        edges = []
+        for frequency in frequencies:
+            edge = int(frequency * FFT_SIZE / pcm.sample_rate)
+            edges.append(max(edge, edges[-1] + 1) if edges else edge)
+        shift = max(0, edges[-1] - FFT_SIZE // 2)
+        self.edges = np.array(edges) - shift
+        self.widths = np.diff(self.edges).astype(np.float32)
+
+        # Power of a full-scale sine through the window, in dB
+        amplitude = pcm.full_scale * pcm.channels * FFT_SIZE / 4
+        self.reference_db = 20.0 * np.log10(amplitude)
+        self.glyphs = np.array(list(GLYPHS))
+        self.previous = np.zeros(BANDS, dtype=np.int64)
+
+    def strip(self, position: float) -> str:
+        """
+        Compute the strip for the samples just before a position.
+
+        Args:
+            position: Playback position in seconds
+
+        Returns:
+            BANDS block characters, silence past the song's end
+        """
+        end = min(int(position * self.pcm.sample_rate), self.pcm.frames)
+        start = max(0, end - FFT_SIZE)
+        samples = np.zeros(FFT_SIZE, dtype=np.float32)
+        if end > start:
+            samples[FFT_SIZE - (end - start):] = self.pcm.mono(start, end)
+
+        power = np.abs(np.fft.rfft(samples * self.window)) ** 2
+        bands = np.add.reduceat(power, self.edges)[:BANDS] / self.widths
+        decibels = 10.0 * np.log10(bands + 1e-12) - self.reference_db
+        levels = np.clip((decibels / RANGE_DB + 1.0) * 8, 0, 8).astype(np.int64)
+
+        # Bars fall one level per frame instead of flickering to zero
+        levels = np.maximum(levels, self.previous - 1)
+        self.previous = levels
+        return ''.join(self.glyphs[levels])
@@ -0,0 +1,220 @@
+"""
+Word Alignment Module for Verse Music Player
+Moves generated word timestamps onto onsets detected in the song's WAV audio.
+"""
+
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Sequence
+import os
+
+from src.compact_lyrics import CompactLyrics
+from src.pcm import map_wav, np
+
+# Bump whenever the envelope or the word placement changes, so cached
+# alignments are computed again
+ALIGN_VERSION = 1
+
+# Length of one energy measurement
+HOP_SECONDS = 0.01
+
+# Audio frames converted at a time; bounds memory for any song length
+BLOCK_FRAMES = 1 << 18
+
+# Hops between the two energies compared for the onset strength
+ONSET_LAG = 3
+
+# Energies this far below the loudest hop count as silence, in dB
+SILENCE_DB = 60.0
+
+# A peak must rise this far above the average onset strength around it
+PEAK_WINDOW = 0.5    # Seconds averaged
+PEAK_DELTA = 1.5     # dB
+
+# Shortest time between two words placed on onsets
+MIN_WORD_GAP = 0.1
+
+# Window of the last line, as in LyricsParser._generate_word_timing
+LAST_LINE_SECONDS = 4.0
+
+
+@dataclass
+class OnsetEnvelope:
+    """Onset strength of a song and the peaks words can be placed on."""
+    hop_seconds: float       # Time between strength values
+    strength: object         # Onset strength of each hop in dB (numpy float32)
+    peak_times: object       # Time of each detected onset, ascending (numpy float64)
+    peak_strengths: object   # Onset strength at each peak (numpy float32)
+
+
+def onset_envelope(file_path: str) -> Optional[OnsetEnvelope]:
+    """
+    Compute the onset envelope of a WAV file.
+
+    The sample data is memory-mapped and reduced block by block to the
+    energy of every HOP_SECONDS, so memory stays bounded by BLOCK_FRAMES
+    whatever the song length. Onsets are the local maxima of the rise in
+    energy (in dB over ONSET_LAG hops) that stand PEAK_DELTA above the
+    average rise around them.
+
+    Args:
+        file_path: Path to the WAV file
+
+    Returns:
+        OnsetEnvelope, or None without NumPy, for other formats than WAV
+        and for sample formats other than 8/16/24/32-bit PCM and float
+    """
+    if Path(file_path).suffix.lower() != '.wav':
+        return None
+    pcm = map_wav(file_path)
+    if pcm is None:
+        return None
+
+    hop = max(1, round(pcm.sample_rate * HOP_SECONDS))
+    hop_seconds = hop / pcm.sample_rate
+    hop_count = pcm.frames // hop
+    if hop_count < 2:
+        return None
+
+    # Energy of each hop, one block of whole hops at a time
+    energy = np.empty(hop_count, dtype=np.float64)
+    block_hops = max(1, BLOCK_FRAMES // hop)
+    for first in range(0, hop_count, block_hops):
+        last = min(hop_count, first + block_hops)
+        mono = pcm.mono(first * hop, last * hop).reshape(last - first, hop)
+        energy[first:last] = np.einsum('ij,ij->i', mono, mono)
+
+    # Rise in level over ONSET_LAG hops, silence clipped at SILENCE_DB down
+    floor = max(float(energy.max()), 1e-30) * 10.0 ** (-SILENCE_DB / 10.0)
+    level = 10.0 * np.log10(energy + floor)
+    strength = np.zeros(hop_count, dtype=np.float32)
+    strength[ONSET_LAG:] = np.maximum(level[ONSET_LAG:] - level[:-ONSET_LAG], 0.0)
+
+    # Local maxima standing out from the moving average
+    window = max(1, int(PEAK_WINDOW / HOP_SECONDS)) | 1
+    average = np.convolve(strength, np.full(window, 1.0 / window, dtype=np.float32), mode='same')
+    middle = strength[1:-1]
+    is_peak = ((middle > strength[:-2]) & (middle >= strength[2:])
+               & (middle > average[1:-1] + PEAK_DELTA))
+    peaks = np.flatnonzero(is_peak) + 1
+
+    return OnsetEnvelope(hop_seconds=hop_seconds, strength=strength,
+                         peak_times=peaks * hop_seconds, peak_strengths=strength[peaks])
+
+
+def align_word_times(
+    line_times: Sequence[float],
+    word_offsets: Sequence[int],
+    word_times: Sequence[float],
+    envelope: OnsetEnvelope
+) -> array:
+    """
+    Place word timestamps on onsets within each line's window.
+
+    A line's first word stays on the line timestamp. The other words take
+    the strongest onsets between that timestamp and the next line's, at
+    least MIN_WORD_GAP apart, in time order. Lines with fewer onsets than
+    words keep their evenly spread timing.
+
+    Args:
+        line_times: Timestamp of each line, ascending
+        word_offsets: Words of line i are word_offsets[i]:word_offsets[i + 1]
+        word_times: Current timestamp of each word
+        envelope: Onset envelope of the song
+
+    Returns:
+        New word timestamps, array('d') in the order of word_times
+    """
+    aligned = array('d', word_times)
+    line_count = len(line_times)
+    if not line_count:
+        return aligned
+
+    peak_times = envelope.peak_times
+    peak_strengths = envelope.peak_strengths
+
+    # Onsets inside every line's window, found for all lines at once
+    starts = np.asarray(line_times, dtype=np.float64)
+    ends = np.append(starts[1:], starts[-1] + LAST_LINE_SECONDS)
+    firsts = np.searchsorted(peak_times, starts + MIN_WORD_GAP, side='left')
+    lasts = np.searchsorted(peak_times, ends - MIN_WORD_GAP, side='right')
+
+    for i in range(line_count):
+        first_word = word_offsets[i]
+        needed = word_offsets[i + 1] - first_word - 1
+        first, last = int(firsts[i]), int(lasts[i])
+        if needed < 1 or last - first < needed:
+            continue
+
+        # Strongest onsets first, skipping those too close to a chosen one
+        chosen = []
+        for peak in first + np.argsort(-peak_strengths[first:last], kind='stable'):
+            time = float(peak_times[peak])
+            if all(abs(time - other) >= MIN_WORD_GAP for other in chosen):
+                chosen.append(time)
+                if len(chosen) == needed:
+                    break
+        if len(chosen) < needed:
+            continue
+
+        chosen.sort()
+        aligned[first_word + 1:first_word + 1 + needed] = array('d', chosen)
+    return aligned
+
+
+def _alignment_variant(audio_path: str) -> str:
+    """Cache variant naming the audio file and its state."""
+    path = os.path.abspath(audio_path)
+    stat = os.stat(path)
+    return f"align-v{ALIGN_VERSION}:{path}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def align_parsed_lyrics(lyrics_parser, lyrics_path: str, audio_path: str) -> bool:
+    """
+    Align a parsed timeline's word timing to its song's audio.
+
+    The aligned timeline is stored in the parser's lyrics cache next to the
+    parsed one, keyed by the LRC file and the audio file's path, size and
+    modification time, so later plays load it instead of reading the audio.
+
+    Args:
+        lyrics_parser: LyricsParser that has parsed lyrics_path
+        lyrics_path: Path to the LRC file
+        audio_path: Path to the song's WAV file
+
+    Returns:
+        True if the parser now holds aligned word timing, False if the
+        timing was left as parsed (no NumPy, not a WAV file, unreadable)
+    """
+    if np is None:
+        return False
+
+    lyrics = lyrics_parser.lyrics
+    timeline = lyrics if isinstance(lyrics, CompactLyrics) else CompactLyrics.from_lines(lyrics)
+    cache = lyrics_parser.cache
+
+    key = None
+    aligned = None
+    if cache is not None:
+        try:
+            key = cache.make_key(lyrics_path, variant=_alignment_variant(audio_path))
+        except OSError:
+            key = None
+        if key is not None:
+            aligned = cache.load(key)
+            if aligned is not None and len(aligned.word_times) != len(timeline.word_times):
+                aligned = None
+
+    if aligned is None:
+        envelope = onset_envelope(audio_path)
+        if envelope is None:
+            return False
+        aligned = timeline.with_word_times(align_word_times(
+            timeline.line_times, timeline.word_offsets, timeline.word_times, envelope))
+        if key is not None:
+            cache.store(key, aligned)
+
+    lyrics_parser.lyrics = aligned if lyrics_parser.compact else aligned.to_lines()
+    lyrics_parser.rebuild_index()
+    return True
@@ -0,0 +1 @@
+"""Tests for the Verse music player."""
@@ -0,0 +1,110 @@
+"""
+Tests for the asyncio playback core of src.async_player with a playlist.
+"""
+
+import asyncio
+import io
+import threading
+
+from rich.console import Console
+
+from benchmarks.synthetic import write_wav
+from src.display import LyricDisplay
+from src.lyrics_parser import LyricsParser
+from src.playlist import PlaylistPlayer, Track
+from src.scheduler import SystemClock
+from src.simulation import NullAudioPlayer
+
+SONG_SECONDS = 1.5
+LRC = "[00:00.20]first line of {name}\n[00:00.80]second line of {name}\n"
+
+# Pause and resume presses sent while the songs play, an even number
+TOGGLES = 6
+
+
+class ExclusiveAudioPlayer(NullAudioPlayer):
+    """Null audio player that records the threads and any overlapping calls."""
+
+    def __init__(self, clock):
+        super().__init__(clock)
+        self._busy = threading.RLock()
+        self.threads = {}
+        self.overlaps = 0
+
+    def _enter(self, name):
+        if not self._busy.acquire(blocking=False):
+            self.overlaps += 1
+            self._busy.acquire()
+        self.threads.setdefault(name, set()).add(threading.current_thread().name)
+
+    def _call(self, name, method, *args):
+        self._enter(name)
+        try:
+            return method(*args)
+        finally:
+            self._busy.release()
+
+    def queue_song(self, file_path):
+        return self._call('queue_song', super().queue_song, file_path)
+
+    def is_playing(self):
+        return self._call('is_playing', super().is_playing)
+
+    def get_duration(self):
+        return self._call('get_duration', super().get_duration)
+
+    def get_position(self):
+        return self._call('get_position', super().get_position)
+
+    def pause(self):
+        return self._call('pause', super().pause)
+
+    def resume(self):
+        return self._call('resume', super().resume)
+
+
+class ToggleKeys:
+    """Key reader that presses pause TOGGLES times, then waits for ever."""
+
+    def start(self) -> bool:
+        self._presses = 0
+        return True
+
+    def stop(self) -> None:
+        pass
+
+    async def get(self) -> str:
+        if self._presses >= TOGGLES:
+            await asyncio.Event().wait()
+        await asyncio.sleep(0.1)
+        self._presses += 1
+        return 'p'
+
+
+def test_playlist_switch_runs_mixer_calls_on_the_audio_thread(tmp_path, monkeypatch):
+    tracks = []
+    for name in ["one", "two"]:
+        song_path = write_wav(tmp_path / f"{name}.wav", SONG_SECONDS)
+        lyrics_path = tmp_path / f"{name}.lrc"
+        lyrics_path.write_text(LRC.format(name=name), encoding="utf-8")
+        tracks.append(Track(song_path, lyrics_path))
+
+    monkeypatch.setattr("src.async_player.KeyReader", ToggleKeys)
+    clock = SystemClock()
+    output = io.StringIO()
+    display = LyricDisplay(Console(file=output, force_terminal=True, width=80))
+    audio_player = ExclusiveAudioPlayer(clock)
+    player = PlaylistPlayer(tracks, audio_player=audio_player,
+                            lyrics_parser=LyricsParser(compact=True), display=display,
+                            clock=clock, keyboard_controls=True)
+    player.start_playback()
+
+    # The second song started gaplessly and its lyrics were shown
+    assert audio_player.track_index == 1
+    assert player.skipped == []
+    assert "second line of two" in output.getvalue()
+
+    # Queueing, polling and the pause keys all went through the audio thread
+    for name in ('queue_song', 'pause', 'resume'):
+        assert audio_player.threads[name] == {'verse-audio_0'}, name
+    assert audio_player.overlaps == 0
@@ -0,0 +1,99 @@
+"""
+Tests for duration probing and WAV layout reading of src.audio_probe.
+"""
+
+import io
+import struct
+
+import pytest
+
+from benchmarks.synthetic import _mp3_frame, write_mp3, write_wav
+from src.audio_probe import probe, probe_duration, read_wav_layout
+
+SECONDS = 10.0
+
+# Frames in a synthetic SECONDS long MP3, 1152 samples each at 44.1 kHz
+FRAMES = int(SECONDS * 44100 / 1152)
+
+# Encoder delay and padding in the synthetic LAME header
+LAME_TRIM = 576 + 1152
+
+
+def _write_vbri(path, seconds: float):
+    """Write a CBR MP3 whose first frame is a Fraunhofer VBRI header."""
+    frames = write_mp3(path, seconds, header=False, id3_bytes=0).read_bytes()
+    body = bytes(32) + b"VBRI" + bytes(10) + FRAMES.to_bytes(4, "big")
+    path.write_bytes(_mp3_frame(128, 0, body) + frames)
+    return path
+
+
+@pytest.mark.parametrize("name, write, method, samples", [
+    ("info", lambda path: write_mp3(path, SECONDS), "xing", FRAMES * 1152 - LAME_TRIM),
+    ("xing", lambda path: write_mp3(path, SECONDS, vbr=True), "xing",
+     FRAMES * 1152 - LAME_TRIM),
+    ("vbri", lambda path: _write_vbri(path, SECONDS), "vbri", FRAMES * 1152),
+    ("cbr", lambda path: write_mp3(path, SECONDS, header=False), "cbr", FRAMES * 1152),
+    ("scan", lambda path: write_mp3(path, SECONDS, vbr=True, header=False), "scan",
+     FRAMES * 1152),
+])
+def test_mp3_duration_by_header_type(tmp_path, name, write, method, samples):
+    info = probe(str(write(tmp_path / f"{name}.mp3")))
+    assert info.method == method
+    assert info.sample_rate == 44100
+    assert info.channels == 2
+    assert info.duration == pytest.approx(samples / 44100, abs=1e-9)
+
+
+def test_sparse_mp3_probes_from_the_header(tmp_path):
+    # Only the first second is written; the header holds the frame count
+    path = write_mp3(tmp_path / "long.mp3", 3600.0, full=False)
+    frames = int(3600.0 * 44100 / 1152)
+    assert probe_duration(str(path)) == pytest.approx(
+        (frames * 1152 - LAME_TRIM) / 44100, abs=1e-9)
+
+
+def test_wav_duration_from_riff_chunks(tmp_path):
+    info = probe(str(write_wav(tmp_path / "song.wav", SECONDS, sample_rate=22050, channels=1)))
+    assert info.method == "riff"
+    assert (info.sample_rate, info.channels) == (22050, 1)
+    assert info.duration == pytest.approx(SECONDS)
+
+
+def test_mp3_without_frames_has_no_duration(tmp_path):
+    path = tmp_path / "noise.mp3"
+    path.write_bytes(b"not an mp3" * 100)
+    with pytest.raises(ValueError):
+        probe(str(path))
+    assert probe_duration(str(path)) == 0.0
+
+
+def _riff(*chunks: bytes, form: bytes = b'RIFF') -> bytes:
+    body = b'WAVE' + b''.join(chunks)
+    return form + struct.pack('<I', len(body)) + body
+
+
+def _fmt(size: int = 16) -> bytes:
+    body = struct.pack('<HHIIHH', 1, 2, 44100, 176400, 4, 16)
+    return b'fmt ' + struct.pack('<I', size) + body[:size]
+
+
+TRUNCATED_WAVS = {
+    # The 26-byte stub: RIFF header, fmt chunk header and 6 bytes of its body
+    "fmt_body": _riff(_fmt()[:14]),
+    "fmt_too_short": _riff(_fmt(8), b'data' + struct.pack('<I', 4) + b'\0' * 4),
+    "chunk_header": _riff(_fmt(), b'da'),
+    "ds64_body": _riff(b'ds64' + struct.pack('<I', 28) + b'\0' * 6, form=b'RF64'),
+}
+
+
+@pytest.mark.parametrize("name", sorted(TRUNCATED_WAVS))
+def test_truncated_wav_header_raises_value_error(name):
+    with pytest.raises(ValueError):
+        read_wav_layout(io.BytesIO(TRUNCATED_WAVS[name]))
+
+
+@pytest.mark.parametrize("name", sorted(TRUNCATED_WAVS))
+def test_truncated_wav_has_no_duration(tmp_path, name):
+    path = tmp_path / f"{name}.wav"
+    path.write_bytes(TRUNCATED_WAVS[name])
+    assert probe_duration(str(path)) == 0.0
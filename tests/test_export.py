@@ -0,0 +1,69 @@
+"""
+Tests for the subtitle writers of src.export.
+"""
+
+from src.export import Cue, _ASS_HEADER, lyric_cues, to_ass, to_srt, to_webvtt
+from src.lyrics_parser import LyricsParser
+
+# Two lines; the first word of the first line comes after its start, and
+# the last word of the second line falls after the cue has ended
+CUES = [
+    Cue(start=1.0, end=3.5, text="Hello <big> world",
+        words=[(1.25, "Hello"), (1.75, "<big>"), (2.5, "world")]),
+    Cue(start=63.25, end=66.0, text="{so} long & bye",
+        words=[(63.25, "{so}"), (64.0, "long"), (65.5, "&"), (67.0, "bye")]),
+]
+
+
+def test_srt():
+    assert to_srt(CUES, "Song") == (
+        "1\n"
+        "00:00:01,000 --> 00:00:03,500\n"
+        "Hello <big> world\n"
+        "\n"
+        "2\n"
+        "00:01:03,250 --> 00:01:06,000\n"
+        "{so} long & bye\n"
+    )
+
+
+def test_webvtt():
+    assert to_webvtt(CUES, "Song") == (
+        "WEBVTT - Song\n"
+        "\n"
+        "00:00:01.000 --> 00:00:03.500\n"
+        "Hello <00:00:01.750>&lt;big&gt; <00:00:02.500>world\n"
+        "\n"
+        "00:01:03.250 --> 00:01:06.000\n"
+        "{so} <00:01:04.000>long <00:01:05.500>&amp; bye\n"
+    )
+
+
+def test_ass():
+    assert to_ass(CUES, "Song") == _ASS_HEADER.format(title="Song") + (
+        "Dialogue: 0,0:00:01.00,0:00:03.50,Default,,0,0,0,,"
+        "{\\k25}{\\k50}Hello {\\k75}<big> {\\k100}world\n"
+        "Dialogue: 0,0:01:03.25,0:01:06.00,Default,,0,0,0,,"
+        "{\\k75}(so) {\\k150}long {\\k50}& {\\k0}bye\n"
+    )
+
+
+def test_cues_without_words_keep_the_line_text():
+    cues = [Cue(start=0.5, end=2.0, text="a <b> {c}")]
+    assert to_webvtt(cues) == "WEBVTT\n\n00:00:00.500 --> 00:00:02.000\na &lt;b&gt; {c}\n"
+    assert to_ass(cues).endswith("Dialogue: 0,0:00:00.50,0:00:02.00,Default,,0,0,0,,a <b> (c)\n")
+
+
+def test_lyric_cues_from_a_parsed_timeline(tmp_path):
+    path = tmp_path / "song.lrc"
+    path.write_text("[00:01.00]one two\n[00:02.00]\n[00:03.00]three\n", encoding="utf-8")
+    parser = LyricsParser(compact=True)
+    parser.parse_lrc_file(str(path))
+
+    # The empty line only ends the one before it; the last line lasts
+    # until the song ends
+    assert lyric_cues(parser.lyrics, duration=5.0) == [
+        Cue(start=1.0, end=2.0, text="one two", words=[(1.0, "one"), (1.5, "two")]),
+        Cue(start=3.0, end=5.0, text="three", words=[(3.0, "three")]),
+    ]
+    assert lyric_cues(parser.lyrics)[-1].end == 7.0
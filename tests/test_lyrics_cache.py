@@ -0,0 +1,55 @@
+"""
+Tests for the opt-in lyrics cache of src.lyrics_cache.
+"""
+
+import pytest
+
+from src.lyrics_cache import LyricsCache, cache_enabled
+from src.lyrics_parser import LyricsParser
+from src.main import VersePlayer
+
+LRC = "[00:01.00]first line\n[00:02.50]second line\n"
+
+
+@pytest.fixture
+def lrc_path(tmp_path):
+    path = tmp_path / "song.lrc"
+    path.write_text(LRC, encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("env, enabled", [
+    ({}, False),
+    ({"VERSE_CACHE": "0"}, False),
+    ({"VERSE_CACHE": "1"}, True),
+    ({"VERSE_CACHE_DIR": "/tmp/verse-cache"}, True),
+])
+def test_cache_is_opt_in(monkeypatch, env, enabled):
+    monkeypatch.delenv("VERSE_CACHE", raising=False)
+    monkeypatch.delenv("VERSE_CACHE_DIR", raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    assert cache_enabled() is enabled
+
+
+def test_player_has_no_cache_by_default(tmp_path, lrc_path):
+    player = VersePlayer(str(tmp_path / "song.wav"), str(lrc_path))
+    assert player.lyrics_parser.cache is None
+
+    player = VersePlayer(str(tmp_path / "song.wav"), str(lrc_path), cache_lyrics=True)
+    assert isinstance(player.lyrics_parser.cache, LyricsCache)
+
+
+def test_unwritable_cache_dir_still_parses(tmp_path, lrc_path):
+    # A directory below a regular file can never be created, even by root
+    blocker = tmp_path / "blocker"
+    blocker.write_bytes(b"")
+    cache = LyricsCache(str(blocker / "lyrics"))
+
+    parser = LyricsParser(compact=True, cache=cache)
+    lyrics = parser.parse_lrc_file(str(lrc_path))
+    assert [line.text for line in lyrics] == ["first line", "second line"]
+
+    key = cache.make_key(str(lrc_path))
+    assert cache.store(key, lyrics) is False
+    assert cache.load(key) is None
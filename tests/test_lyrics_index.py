@@ -0,0 +1,184 @@
+"""
+Property tests for the bisect timeline index of src.lyrics_parser.
+
+Every getter and TimelineCursor.advance must return exactly what a linear
+scan over the parsed lines returns, the way the getters worked before the
+index existed. Random LRC files cover multi-timestamp lines, [offset:]
+tags, equal timestamps, empty lines and empty or metadata-only files.
+"""
+
+import random
+
+import pytest
+
+from src.lyrics_parser import LyricsParser
+
+# Random LRC files per test and positions probed in each
+SEEDS = range(60)
+RANDOM_POSITIONS = 150
+
+_WORDS = "love night heart dance light fire rain dream sky road home time".split()
+
+
+def _timestamp_tag(rng: random.Random, seconds: float) -> str:
+    """Format an LRC timestamp with 0 to 3 fraction digits."""
+    minutes, rest = divmod(seconds, 60)
+    digits = rng.choice([0, 1, 2, 3])
+    tag = f"[{int(minutes):02d}:{int(rest):02d}"
+    if digits:
+        tag += "." + f"{rest - int(rest):.{digits}f}"[2:]
+    return tag + "]"
+
+
+def random_lrc(seed: int) -> str:
+    """
+    Generate a random LRC file.
+
+    Args:
+        seed: Random seed, the same seed always gives the same file
+
+    Returns:
+        LRC text, sometimes empty or metadata-only
+    """
+    rng = random.Random(seed)
+    shape = rng.random()
+    if shape < 0.05:
+        return ""
+    if shape < 0.1:
+        return "[ar:Verse]\n[ti:Metadata only]\n\n[al:Tests]\n"
+
+    rows = ["[ar:Verse]", f"[ti:Random {seed}]"]
+    times = [round(rng.uniform(0.0, 120.0), 2) for _ in range(rng.randint(1, 30))]
+    for index in range(len(times)):
+        if rng.random() < 0.1:
+            rows.append(f"[offset:{rng.randint(-2000, 2000):+d}]")
+        # Equal timestamps on separate lines
+        if index and rng.random() < 0.15:
+            times[index] = times[index - 1]
+        tags = _timestamp_tag(rng, times[index])
+        # Several timestamps on one line
+        for _ in range(rng.choice([0, 0, 0, 1, 2])):
+            tags += _timestamp_tag(rng, round(rng.uniform(0.0, 120.0), 2))
+        text = "" if rng.random() < 0.1 else " ".join(rng.choices(_WORDS, k=rng.randint(1, 8)))
+        rows.append(tags + text)
+        if rng.random() < 0.1:
+            rows.append("")
+    return "\n".join(rows) + "\n"
+
+
+class LinearReference:
+    """The getters as linear scans over the parsed lines."""
+
+    def __init__(self, lyrics):
+        self.lines = [(line.timestamp, line.text,
+                       [(word.timestamp, word.text) for word in line.words])
+                      for line in lyrics]
+
+    def line_index(self, timestamp: float) -> int:
+        index = -1
+        for i, (line_time, _, _) in enumerate(self.lines):
+            if line_time <= timestamp:
+                index = i
+            else:
+                break
+        return index
+
+    def visible_words(self, index: int, timestamp: float) -> list:
+        visible = []
+        for word_time, text in self.lines[index][2]:
+            if word_time <= timestamp:
+                visible.append(text)
+            else:
+                break
+        return visible
+
+    def current_lyric(self, timestamp: float):
+        index = self.line_index(timestamp)
+        return self.lines[index][1] if index >= 0 else None
+
+    def current_words(self, timestamp: float):
+        index = self.line_index(timestamp)
+        if index < 0:
+            return None
+        if not self.lines[index][2]:
+            return self.lines[index][1]
+        return ' '.join(self.visible_words(index, timestamp)) or None
+
+    def current_word_only(self, timestamp: float):
+        index = self.line_index(timestamp)
+        if index < 0:
+            return None
+        if not self.lines[index][2]:
+            return self.lines[index][1]
+        visible = self.visible_words(index, timestamp)
+        return visible[-1] if visible else None
+
+    def context(self, timestamp: float):
+        index = self.line_index(timestamp)
+        if index < 0:
+            return None, None, None
+        previous_text = self.lines[index - 1][1] if index > 0 else None
+        next_text = self.lines[index + 1][1] if index < len(self.lines) - 1 else None
+        return previous_text, self.current_words(timestamp), next_text
+
+
+def _parse(tmp_path, seed: int, compact: bool):
+    """Parse the random LRC file of a seed."""
+    path = tmp_path / f"random_{seed}.lrc"
+    path.write_text(random_lrc(seed), encoding="utf-8")
+    parser = LyricsParser(compact=compact)
+    parser.parse_lrc_file(str(path))
+    return parser, LinearReference(parser.lyrics)
+
+
+def _positions(reference: LinearReference, seed: int) -> list:
+    """Every line and word boundary, just around it, and random positions."""
+    rng = random.Random(seed)
+    boundaries = [line_time for line_time, _, _ in reference.lines]
+    boundaries += [word_time for _, _, words in reference.lines for word_time, _ in words]
+    positions = [-1.0, 0.0, 1e9]
+    for boundary in boundaries:
+        positions += [boundary - 1e-6, boundary, boundary + 1e-6]
+    positions += [rng.uniform(-5.0, 130.0) for _ in range(RANDOM_POSITIONS)]
+    return positions
+
+
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_getters_match_linear_scan(tmp_path, seed, compact):
+    parser, reference = _parse(tmp_path, seed, compact)
+
+    for position in _positions(reference, seed):
+        assert parser.get_current_line_index(position) == reference.line_index(position)
+        assert parser.get_current_lyric(position) == reference.current_lyric(position)
+        assert parser.get_current_words(position) == reference.current_words(position)
+        assert parser.get_current_word_only(position) == reference.current_word_only(position)
+        assert parser.get_context_lyrics(position) == reference.context(position)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_cursor_matches_linear_scan(tmp_path, seed, compact):
+    parser, reference = _parse(tmp_path, seed, compact)
+    rng = random.Random(seed)
+    cursor = parser.cursor()
+
+    # Sorted positions play forward; shuffled ones jump both ways
+    positions = _positions(reference, seed)
+    walks = sorted(positions) + rng.sample(positions, len(positions))
+
+    for position in walks:
+        frame = cursor.advance(position)
+        index = reference.line_index(position)
+        assert frame.line_index == index
+        if index < 0:
+            assert frame.word_count == 0
+            assert frame.current_text is None
+            continue
+
+        previous_text, current_text, next_text = reference.context(position)
+        assert frame.word_count == len(reference.visible_words(index, position))
+        assert frame.current_text == current_text
+        assert frame.previous_text == previous_text
+        assert frame.next_text == next_text
+        assert frame.line_text == reference.lines[index][1]
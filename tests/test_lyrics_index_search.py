@@ -0,0 +1,89 @@
+"""
+Tests for building and searching the lyrics index of src.lyrics_index.
+"""
+
+import os
+
+import pytest
+
+from benchmarks.synthetic import write_wav
+from src.lyrics_index import INDEX_NAME, main, open_index
+from src.scanner import CATALOG_NAME, LibraryCatalog, scan_library
+
+SONGS = {
+    "alpha": "[00:01.00]Hold me close\n[00:05.00]closer than before\n[00:09.00]hold on\n",
+    "beta": "[00:02.50]Never let me go\n[00:06.00]hold me, hold me close!\n",
+}
+
+
+@pytest.fixture
+def library(tmp_path):
+    root = tmp_path / "library"
+    root.mkdir()
+    for name, lrc in SONGS.items():
+        write_wav(root / f"{name}.wav", 12.0)
+        (root / f"{name}.lrc").write_text(lrc, encoding="utf-8")
+    scan_library(root, LibraryCatalog(root / CATALOG_NAME), jobs=1)
+    return root
+
+
+def _hits(root, query):
+    with open_index(root / INDEX_NAME) as index:
+        return [(os.path.basename(hit.song_path), hit.line_index, hit.position,
+                 hit.timestamp, hit.line_text)
+                for hit in index.search(query)]
+
+
+def test_single_word_lists_every_line_in_order(library):
+    assert _hits(library, "HOLD") == [
+        ("alpha.wav", 0, 0, 1.0, "Hold me close"),
+        ("alpha.wav", 2, 0, 9.0, "hold on"),
+        ("beta.wav", 1, 0, 6.0, "hold me, hold me close!"),
+        ("beta.wav", 1, 2, pytest.approx(6.0, abs=4.0), "hold me, hold me close!"),
+    ]
+
+
+def test_prefix_matches_every_term_with_the_prefix(library):
+    hits = _hits(library, "clos*")
+    assert [(song, line, text) for song, line, _, _, text in hits] == [
+        ("alpha.wav", 0, "Hold me close"),
+        ("alpha.wav", 1, "closer than before"),
+        ("beta.wav", 1, "hold me, hold me close!"),
+    ]
+    assert _hits(library, "closer") == [("alpha.wav", 1, 0, 5.0, "closer than before")]
+
+
+def test_phrase_needs_consecutive_tokens_in_one_line(library):
+    hits = _hits(library, "hold me close")
+    assert [(song, line, position, text) for song, line, position, _, text in hits] == [
+        ("alpha.wav", 0, 0, "Hold me close"),
+        ("beta.wav", 1, 2, "hold me, hold me close!"),
+    ]
+    # "let" and "go" are in one line of beta, but not next to each other
+    assert _hits(library, "let go") == []
+    assert [hit[:3] for hit in _hits(library, "let me g*")] == [("beta.wav", 0, 1)]
+
+
+def test_rescan_carries_line_texts_over(library):
+    lyrics = library / "beta.lrc"
+    lyrics.write_text("[00:01.00]hold tight\n", encoding="utf-8")
+    stat = lyrics.stat()
+    os.utime(lyrics, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    stats = scan_library(library, LibraryCatalog(library / CATALOG_NAME), jobs=1)
+    assert (stats["parsed"], stats["unchanged"]) == (1, 1)
+
+    assert [(song, line, text) for song, line, _, _, text in _hits(library, "hold")] == [
+        ("alpha.wav", 0, "Hold me close"),
+        ("alpha.wav", 2, "hold on"),
+        ("beta.wav", 0, "hold tight"),
+    ]
+    with open_index(library / INDEX_NAME) as index:
+        assert index.line_texts(index.song_ids()[str(library.resolve() / "alpha.wav")]) == [
+            "Hold me close", "closer than before", "hold on"]
+
+
+def test_search_command_reads_no_lyrics_files(library, capsys):
+    for name in SONGS:
+        (library / f"{name}.lrc").unlink()
+    assert main([str(library), "never", "let"]) == 0
+    assert "[00:02.50]  Never let me go" in capsys.readouterr().out
@@ -0,0 +1,38 @@
+"""
+Tests for WAV sample access of src.pcm and its users on broken files.
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from benchmarks.synthetic import write_wav
+from src.pcm import map_wav
+from src.scheduler import SystemClock
+from src.visualizer import SpectrumAnalyzer
+from src.word_alignment import onset_envelope
+from tests.test_audio_probe import TRUNCATED_WAVS
+
+
+@pytest.fixture(params=sorted(TRUNCATED_WAVS))
+def truncated_wav(request, tmp_path):
+    path = tmp_path / f"{request.param}.wav"
+    path.write_bytes(TRUNCATED_WAVS[request.param])
+    return str(path)
+
+
+def test_map_wav_reads_samples(tmp_path):
+    pcm = map_wav(str(write_wav(tmp_path / "song.wav", 1.0)))
+    assert (pcm.frames, pcm.channels, pcm.sample_rate) == (44100, 2, 44100)
+
+
+def test_truncated_wav_maps_to_none(truncated_wav):
+    assert map_wav(truncated_wav) is None
+    assert onset_envelope(truncated_wav) is None
+
+
+def test_truncated_wav_has_no_spectrum(truncated_wav):
+    analyzer = SpectrumAnalyzer(truncated_wav, SystemClock())
+    analyzer.start()
+    analyzer._thread.join(timeout=5.0)
+    assert analyzer.available is False
@@ -0,0 +1,96 @@
+"""
+Tests for gapless track switches of src.playlist, run on a virtual clock.
+"""
+
+import io
+
+from rich.console import Console
+
+from benchmarks.synthetic import write_wav
+from src.display import LyricDisplay
+from src.lyrics_parser import LyricsParser
+from src.playlist import PlaylistPlayer, Track
+from src.simulation import NullAudioPlayer, VirtualClock
+
+SONG_SECONDS = 6.0
+LRC = "[00:00.50]first line of {name}\n[00:03.00]second line of {name}\n"
+
+
+class RecordingAudioPlayer(NullAudioPlayer):
+    """Null audio player that records loads and rejects some songs."""
+
+    def __init__(self, clock, rejected=()):
+        super().__init__(clock)
+        self.rejected = set(rejected)
+        self.loaded = []
+
+    def load_song(self, file_path: str) -> bool:
+        self.loaded.append(file_path)
+        return super().load_song(file_path)
+
+    def queue_song(self, file_path: str) -> bool:
+        if file_path in self.rejected:
+            return False
+        return super().queue_song(file_path)
+
+
+class InlinePlaylistPlayer(PlaylistPlayer):
+    """Prepares the next track on the calling thread, so switches are deterministic."""
+
+    def _start_prefetch(self, index: int) -> None:
+        super()._start_prefetch(index)
+        self._prefetch.ready.wait()
+
+
+def _tracks(tmp_path, names):
+    tracks = []
+    for name in names:
+        song_path = write_wav(tmp_path / f"{name}.wav", SONG_SECONDS)
+        lyrics_path = tmp_path / f"{name}.lrc"
+        lyrics_path.write_text(LRC.format(name=name), encoding="utf-8")
+        tracks.append(Track(song_path, lyrics_path))
+    return tracks
+
+
+def _player(tracks, rejected=()):
+    clock = VirtualClock()
+    output = io.StringIO()
+    console = Console(file=output, force_terminal=True, width=80, color_system="truecolor")
+    display = LyricDisplay(console, clock=clock.now)
+    audio_player = RecordingAudioPlayer(clock, rejected)
+    player = InlinePlaylistPlayer(tracks, audio_player=audio_player,
+                                  lyrics_parser=LyricsParser(compact=True),
+                                  display=display, clock=clock)
+    return player, audio_player, output
+
+
+def test_gapless_switch_keeps_the_screen(tmp_path):
+    tracks = _tracks(tmp_path, ["one", "two"])
+    player, audio_player, output = _player(tracks)
+    player.start_playback()
+
+    # The second song was queued, never loaded, and its lyrics were shown
+    assert audio_player.loaded == [str(tracks[0].song_path)]
+    assert audio_player.track_index == 1
+    screen = output.getvalue()
+    assert "second line of two" in screen
+
+    # Only the first song's header cleared the screen; the switch rewrote
+    # the title row in place
+    first_line = screen.index("first line of one")
+    last_line = screen.index("second line of two")
+    assert "♪  Two  ♪" in screen[first_line:last_line]
+    assert "\033[2J" not in screen[first_line:last_line]
+
+
+def test_rejected_track_is_not_tried_again(tmp_path):
+    tracks = _tracks(tmp_path, ["one", "two", "three"])
+    rejected = str(tracks[1].song_path)
+    player, audio_player, output = _player(tracks, rejected=[rejected])
+    player.start_playback()
+
+    assert player.skipped == [tracks[1]]
+    assert rejected not in audio_player.loaded
+    # The track after the rejected one was queued in its place
+    assert audio_player.loaded == [str(tracks[0].song_path)]
+    assert "second line of three" in output.getvalue()
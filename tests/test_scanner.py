@@ -0,0 +1,82 @@
+"""
+Tests for library scanning and the incremental catalog of src.scanner.
+"""
+
+import os
+
+import pytest
+
+from benchmarks.synthetic import write_wav
+from src.scanner import CATALOG_NAME, LibraryCatalog, find_pairs, scan_library
+
+LRC = "[00:01.00]hello there\n[00:02.00]general kenobi\n"
+
+
+@pytest.fixture
+def library(tmp_path):
+    root = tmp_path / "library"
+    (root / "b").mkdir(parents=True)
+    (root / "a").mkdir()
+    write_wav(root / "a" / "One.WAV", 2.0)
+    (root / "a" / "one.lrc").write_text(LRC, encoding="utf-8")
+    write_wav(root / "b" / "two.wav", 3.0)
+    (root / "b" / "two.LRC").write_text(LRC + "[00:03.00]third line\n", encoding="utf-8")
+    # No lyrics: not a pair
+    write_wav(root / "b" / "three.wav", 1.0)
+    return root
+
+
+def test_find_pairs_matches_stems_case_insensitively(library):
+    pairs = [(song.relative_to(library).as_posix(), lyrics.name)
+             for song, lyrics in find_pairs(library)]
+    assert pairs == [("a/One.WAV", "one.lrc"), ("b/two.wav", "two.LRC")]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_scan_builds_catalog_entries(library, jobs):
+    catalog = LibraryCatalog(library / CATALOG_NAME)
+    stats = scan_library(library, catalog, jobs=jobs)
+    assert (stats["pairs"], stats["parsed"], stats["errors"]) == (2, 2, 0)
+
+    entries = sorted(LibraryCatalog(library / CATALOG_NAME).entries.values(),
+                     key=lambda entry: entry["song"])
+    assert [(entry["lines"], entry["words"]) for entry in entries] == [(2, 4), (3, 6)]
+    assert [entry["duration"] for entry in entries] == pytest.approx([2.0, 3.0])
+    assert all("postings" not in entry and "line_texts" not in entry for entry in entries)
+
+
+def test_rescan_parses_only_changed_pairs(library):
+    catalog_path = library / CATALOG_NAME
+    scan_library(library, LibraryCatalog(catalog_path), jobs=1)
+
+    stats = scan_library(library, LibraryCatalog(catalog_path), jobs=1)
+    assert (stats["parsed"], stats["unchanged"]) == (0, 2)
+
+    lyrics = library / "b" / "two.LRC"
+    lyrics.write_text(LRC, encoding="utf-8")
+    stat = lyrics.stat()
+    os.utime(lyrics, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    stats = scan_library(library, LibraryCatalog(catalog_path), jobs=1)
+    assert (stats["parsed"], stats["unchanged"]) == (1, 1)
+    assert LibraryCatalog(catalog_path).entries[str(library.resolve() / "b" / "two.wav")]["lines"] == 2
+
+
+def test_rescan_drops_removed_pairs(library):
+    catalog_path = library / CATALOG_NAME
+    scan_library(library, LibraryCatalog(catalog_path), jobs=1)
+
+    (library / "a" / "one.lrc").unlink()
+    stats = scan_library(library, LibraryCatalog(catalog_path), jobs=1)
+    assert (stats["pairs"], stats["removed"]) == (1, 1)
+    assert list(LibraryCatalog(catalog_path).entries) == [str(library.resolve() / "b" / "two.wav")]
+
+
+def test_unparsable_lyrics_are_recorded_as_errors(library):
+    (library / "a" / "one.lrc").write_bytes(b"[00:01.00]\xff\xfe broken\n")
+    catalog = LibraryCatalog(library / CATALOG_NAME)
+    stats = scan_library(library, catalog, jobs=1)
+
+    assert stats["errors"] == 1
+    entry = catalog.entries[str(library.resolve() / "a" / "One.WAV")]
+    assert entry["error"].startswith("ValueError")
+    assert entry["lines"] == 0
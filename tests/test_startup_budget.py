@@ -0,0 +1,27 @@
+"""
+Startup checks of benchmarks.bench_startup: the modules a cold start loads.
+
+Timing budgets depend on the machine and are checked by running
+``python -m benchmarks.bench_startup`` instead.
+"""
+
+import pytest
+
+pytest.importorskip("pygame")
+
+from benchmarks import bench_startup
+
+
+@pytest.fixture(scope="module")
+def startup(tmp_path_factory):
+    return bench_startup.run([], tmp_path_factory.mktemp("startup"), repeat=1)
+
+
+def test_player_modules_load_no_heavy_modules(startup):
+    # src.main, src.lyrics_parser and src.scheduler; rich comes with src.display
+    assert startup["heavy_modules_on_player_import"] == []
+
+
+def test_only_rich_is_loaded_before_first_frame(startup):
+    # pygame and numpy wait until playback starts; rich draws the frame itself
+    assert startup["heavy_modules_before_first_frame"] == ["rich"]
@@ -0,0 +1,65 @@
+"""
+Tests for the frame writer of src.terminal.
+"""
+
+import io
+
+from src.terminal import FrameWriter
+
+FRAME = "\033[2J\033[H♪  Déjà vu  ♪\n"
+
+
+def test_text_file_frames_go_to_the_binary_buffer():
+    raw = io.BytesIO()
+    file = io.TextIOWrapper(raw, encoding="utf-8", write_through=False)
+    writer = FrameWriter(file)
+
+    # Text written outside the writer keeps its place before the frame
+    file.write("loading\n")
+    writer.write(FRAME[:8])
+    writer.write(FRAME[8:])
+    assert writer.commit()
+
+    assert raw.getvalue() == b"loading\n" + FRAME.encode("utf-8")
+    assert writer.stats.bytes == len(FRAME.encode("utf-8"))
+    assert (writer.stats.frames, writer.stats.writes, writer.stats.flushes) == (1, 1, 1)
+
+
+def test_bytes_are_counted_in_the_file_encoding():
+    raw = io.BytesIO()
+    writer = FrameWriter(io.TextIOWrapper(raw, encoding="latin-1", errors="replace"))
+    writer.write("Déjà ♪")
+    writer.commit()
+
+    assert raw.getvalue() == "Déjà ?".encode("latin-1")
+    assert writer.stats.bytes == 6
+
+
+def test_in_memory_files_count_utf8_bytes():
+    file = io.StringIO()
+    writer = FrameWriter(file)
+    writer.write("plain ascii")
+    writer.commit(force=True)
+    writer.write(FRAME)
+    writer.commit(force=True)
+
+    assert file.getvalue() == "plain ascii" + FRAME
+    assert writer.stats.bytes == len("plain ascii") + len(FRAME.encode("utf-8"))
+
+
+def test_rate_cap_merges_early_frames():
+    now = [0.0]
+    file = io.StringIO()
+    writer = FrameWriter(file, max_fps=10, clock=lambda: now[0])
+    writer.write("a")
+    assert writer.commit()
+    now[0] = 0.05
+    writer.write("b")
+    assert not writer.commit()
+    assert writer.pending_delay() == 0.05
+    now[0] = 0.1
+    writer.write("c")
+    assert writer.commit()
+
+    assert file.getvalue() == "abc"
+    assert (writer.stats.frames, writer.stats.coalesced) == (2, 1)
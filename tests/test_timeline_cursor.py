@@ -0,0 +1,69 @@
+"""
+Regression tests for TimelineCursor in src.lyrics_parser.
+"""
+
+import pytest
+
+from src.lyrics_parser import LyricsParser
+
+
+def _parse(tmp_path, content: str, compact: bool) -> LyricsParser:
+    """Parse LRC content written to a temporary file."""
+    path = tmp_path / "song.lrc"
+    path.write_text(content, encoding="utf-8")
+    parser = LyricsParser(compact=compact)
+    parser.parse_lrc_file(str(path))
+    return parser
+
+
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("content", ["", "[ar:x]\n", "[ar:x]\n[ti:y]\n\n"])
+def test_backward_advance_on_empty_timeline(tmp_path, content, compact):
+    cursor = _parse(tmp_path, content, compact).cursor()
+
+    cursor.advance(5.0)
+    frame = cursor.advance(1.0)
+
+    assert frame.line_index == -1
+    assert frame.word_count == 0
+    assert cursor.next_event_time() is None
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_backward_advance_before_first_line(tmp_path, compact):
+    parser = _parse(tmp_path, "[00:10.00]one two\n[00:20.00]three four\n[00:30.00]five six\n",
+                    compact)
+    cursor = parser.cursor()
+
+    assert cursor.advance(15.0).line_index == 0
+    frame = cursor.advance(1.0)
+
+    assert frame.line_index == -1
+    assert frame.word_count == 0
+    assert frame.current_text is None
+    assert cursor.next_event_time() == 10.0
+
+
+def test_backward_advance_leaves_unshown_words_ungenerated(tmp_path):
+    parser = _parse(tmp_path, "[00:10.00]one two\n[00:20.00]three four\n[00:30.00]five six\n",
+                    compact=False)
+    cursor = parser.cursor()
+
+    cursor.advance(15.0)
+    cursor.advance(1.0)
+
+    assert parser.lyrics[0].words.generated
+    assert not parser.lyrics[1].words.generated
+    assert not parser.lyrics[2].words.generated
+
+
+def test_materialize_creates_the_words_once(tmp_path):
+    parser = _parse(tmp_path, "[00:10.00]one two\n[00:20.00]three\n", compact=False)
+    words = parser.lyrics[0].words
+
+    materialized = words.materialize()
+    assert words.generated
+    assert words.materialize() is materialized
+    assert [(word.timestamp, word.text, word.line_index) for word in materialized] == [
+        (10.0, "one", 0), (15.0, "two", 0)]
+    assert words.timed_texts() == [(10.0, "one"), (15.0, "two")]